@@ -19,8 +19,11 @@
 
 """ Parser for searching database names in components """
 
+from io import BytesIO
 from xml import sax
 
+from lxml import etree
+
 import sys
 import os
 import re
@@ -123,6 +126,116 @@ class ComponentHandler(sax.ContentHandler):
         self.__stack.pop()
 
 
+class ComponentParser(object):
+
+    """ lxml parser of datasources in components
+    """
+
+    def __init__(self, dsLabel="datasources", delimiter='.'):
+        """ constructor
+
+        :param dsLabel: variable element label, e.g. 'datasources'
+        :type dsLabel: :obj:`str`
+        :param delimiter: variable element delimiter, e.g. '.'
+        :type delimiter: :obj:`str`
+        :brief: It constructs parser and sets variables to default values
+        """
+        #: (:obj:`dict` <:obj:`str` , :obj:`str`> ) dictionary with datasources
+        self.datasources = {}
+        #: (:obj:`str`) tag name
+        self.__tag = "datasource"
+        #: (:obj:`int`) unnamed datasource counter
+        self.__counter = 0
+        #: (:obj:`str`) datasource variable prefix
+        self.__label = "$%s%s" % (dsLabel, delimiter)
+        #: (:obj:`int`) offset of datasource names after the prefix
+        self.__offset = len(dsLabel) + 2
+        #: (:obj:`tuple` <:obj:`str`>) containing datasources
+        self.__withDS = ("field", "attribute")
+        #: (:class:`re.RegexObject`) finder of datasource names
+        self.__finder = re.compile(r"[\w]+")
+
+    def parse(self, xml):
+        """ parses datasources of the given xml string
+
+        :brief: Processed elements are cleared so memory does not grow
+                with the size of the xml string
+        :param xml: xml string
+        :type xml: :obj:`str` or :obj:`bytes`
+        """
+        if not isinstance(xml, bytes):
+            xml = xml.encode("utf8")
+        events = etree.iterparse(
+            BytesIO(xml), events=("start", "end"),
+            tag=(self.__tag,) + self.__withDS)
+        self.__process(events, True)
+
+    def walk(self, node):
+        """ finds datasources in the given parsed tree
+
+        :param node: root of the parsed tree
+        :type node: :class:`lxml.etree.Element`
+        """
+        events = etree.iterwalk(
+            node, events=("start", "end"),
+            tag=(self.__tag,) + self.__withDS)
+        self.__process(events, False)
+
+    def __process(self, events, clear):
+        """ processes element events
+
+        :param events: start and end events of datasource, field
+                       and attribute elements
+        :type events: :obj:`iter` <(:obj:`str`, \
+                      :class:`lxml.etree.Element`)>
+        :param clear: if processed elements should be cleared
+        :type clear: :obj:`bool`
+        """
+        tag = self.__tag
+        withDS = self.__withDS
+        datasources = self.datasources
+        for event, elem in events:
+            if elem.tag == tag:
+                if event == "start":
+                    attrs = elem.attrib
+                    if "name" in attrs:
+                        aName = attrs["name"]
+                    else:
+                        aName = "__unnamed__%s" % self.__counter
+                        self.__counter += 1
+                    datasources[aName] = attrs.get("type", "")
+                elif clear:
+                    elem.clear(keep_tail=True)
+            elif event == "end":
+                self.__findNames(elem)
+                if clear:
+                    elem.clear(keep_tail=True)
+                    parent = elem.getparent()
+                    if parent is not None and parent.tag not in withDS:
+                        while elem.getprevious() is not None:
+                            del parent[0]
+
+    def __findNames(self, elem):
+        """ finds names of datasources in the text of the element
+
+        :param elem: field or attribute element
+        :type elem: :class:`lxml.etree.Element`
+        """
+        text = elem.text or ""
+        if len(elem):
+            text = "".join([text] + [child.tail or "" for child in elem])
+        index = text.find(self.__label)
+        if index == -1:
+            return
+        text = text.strip()
+        index = text.find(self.__label)
+        while index != -1:
+            match = self.__finder.search(text, index + self.__offset)
+            if match:
+                self.datasources[match.group(0)] = "__FROM_DB__"
+            index = text.find(self.__label, index + 1)
+
+
 if __name__ == "__main__":
 
     #: second test xml
@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+""" Pool of database connections """
+
+import threading
+import time
+from contextlib import contextmanager
+
+
+class ConnectionPool(object):
+
+    """ pool of database connections with background health checks
+    """
+
+    def __init__(self, connect, size=4, idletime=300, period=30,
+                 streams=None):
+        """ constructor
+
+        :param connect: function which creates a new connection
+        :type connect: :obj:`instancemethod`
+        :param size: maximal number of connections
+        :type size: :obj:`int`
+        :param idletime: time in seconds after which idle connections
+                         above one are closed
+        :type idletime: :obj:`float`
+        :param period: time in seconds between health checks
+        :type period: :obj:`float`
+        :param streams: tango-like steamset class
+        :type streams: :class:`StreamSet` or :class:`PyTango.Device_4Impl`
+        """
+        #: (:obj:`instancemethod`) connection factory
+        self.__connect = connect
+        #: (:obj:`int`) maximal number of connections
+        self.size = max(1, int(size))
+        #: (:obj:`float`) idle time in seconds
+        self.idletime = float(idletime)
+        #: (:obj:`float`) time in seconds between health checks
+        self.period = float(period)
+        #: (:class:`StreamSet` or :class:`PyTango.Device_4Impl`) stream set
+        self._streams = streams
+        #: (:obj:`list` < (any, :obj:`float`) >) idle connections
+        #:    with their release times
+        self.__idle = []
+        #: (:obj:`int`) number of connections in use or being checked
+        self.__busy = 0
+        #: (:obj:`bool`) pool closed flag
+        self.__closed = False
+        #: (:class:`threading.Condition`) pool condition
+        self.__condition = threading.Condition()
+        #: (:class:`threading.Event`) stop event of the checker thread
+        self.__stop = threading.Event()
+        #: (:class:`threading.Thread`) health checker thread
+        self.__checker = None
+
+    def open(self):
+        """ creates the first connection and starts health checks
+        """
+        connection = self.__connect()
+        with self.__condition:
+            self.__closed = False
+            self.__idle.append((connection, time.time()))
+        self.__stop.clear()
+        if self.period > 0:
+            self.__checker = threading.Thread(target=self.__check)
+            self.__checker.daemon = True
+            self.__checker.start()
+
+    def close(self):
+        """ closes all idle connections and stops health checks
+        """
+        self.__stop.set()
+        with self.__condition:
+            self.__closed = True
+            idle = self.__idle
+            self.__idle = []
+            self.__condition.notify_all()
+        for connection, _ in idle:
+            self.__close(connection)
+        if self.__checker is not None and \
+                self.__checker is not threading.current_thread():
+            self.__checker.join()
+        self.__checker = None
+
+    @classmethod
+    def __close(cls, connection):
+        """ closes the given connection
+
+        :param connection: database connection
+        :type connection: any
+        """
+        try:
+            if connection.open:
+                connection.close()
+        except Exception:
+            pass
+
+    def acquire(self):
+        """ takes a connection from the pool
+
+        :brief: It waits if all connections are in use
+        :returns: database connection
+        :rtype: any
+        """
+        connection = None
+        with self.__condition:
+            while True:
+                if self.__closed:
+                    raise RuntimeError("Connection pool is closed")
+                if self.__idle:
+                    connection, _ = self.__idle.pop()
+                    break
+                if self.__busy + len(self.__idle) < self.size:
+                    break
+                self.__condition.wait()
+            self.__busy += 1
+        if connection is None or not connection.open:
+            try:
+                connection = self.__connect()
+            except Exception:
+                with self.__condition:
+                    self.__busy -= 1
+                    self.__condition.notify()
+                raise
+        return connection
+
+    def release(self, connection, check=False):
+        """ returns the connection to the pool
+
+        :param connection: database connection
+        :type connection: any
+        :param check: if the connection should be checked
+        :type check: :obj:`bool`
+        """
+        alive = connection.open and (not check or self.__ping(connection))
+        with self.__condition:
+            self.__busy -= 1
+            if alive and not self.__closed:
+                self.__idle.append((connection, time.time()))
+                connection = None
+            self.__condition.notify()
+        if connection is not None:
+            self.__close(connection)
+
+    @contextmanager
+    def connection(self):
+        """ provides a pool connection for the with statement
+
+        :returns: database connection
+        :rtype: any
+        """
+        connection = self.acquire()
+        try:
+            yield connection
+        except Exception:
+            self.release(connection, check=True)
+            raise
+        self.release(connection)
+
+    def info(self):
+        """ provides pool statistics
+
+        :returns: dictionary with pool statistics
+        :rtype: :obj:`dict` <:obj:`str`, any>
+        """
+        with self.__condition:
+            return {"size": self.size,
+                    "busy": self.__busy,
+                    "idle": len(self.__idle),
+                    "closed": self.__closed}
+
+    @classmethod
+    def __ping(cls, connection):
+        """ checks if the connection is alive
+
+        :param connection: database connection
+        :type connection: any
+        :returns: True if the connection is alive
+        :rtype: :obj:`bool`
+        """
+        try:
+            connection.ping(True)
+            return bool(connection.open)
+        except Exception:
+            return False
+
+    def check(self):
+        """ pings idle connections and closes the broken or expired ones
+
+        :brief: It keeps at least one open connection in the pool
+        """
+        with self.__condition:
+            if self.__closed:
+                return
+            idle = self.__idle
+            others = self.__busy
+            self.__idle = []
+            self.__busy += len(idle)
+        now = time.time()
+        alive = []
+        for connection, released in idle:
+            if alive and now - released > self.idletime:
+                self.__close(connection)
+            elif self.__ping(connection):
+                alive.append((connection, released))
+            else:
+                self.__close(connection)
+        if not alive and not others:
+            try:
+                alive.append((self.__connect(), now))
+            except Exception as e:
+                if self._streams:
+                    self._streams.warn(
+                        "ConnectionPool::check() - %s" % str(e))
+        with self.__condition:
+            self.__busy -= len(idle)
+            if not self.__closed:
+                self.__idle.extend(alive)
+                alive = []
+            self.__condition.notify_all()
+        for connection, _ in alive:
+            self.__close(connection)
+
+    def __check(self):
+        """ health checker thread loop
+        """
+        while not self.__stop.wait(self.period):
+            self.check()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+""" Graph of component dependencies """
+
+import threading
+
+
+class DependencyGraph(object):
+
+    """ graph of components with their references to other components,
+        datasources and variables
+    """
+
+    #: (:obj:`tuple` <:obj:`str`>) reference labels
+    labels = ("components", "datasources", "variables")
+
+    def __init__(self):
+        """ constructor
+        """
+        #: (:obj:`str`) DB revision of the graph
+        self.revision = None
+        #: (:obj:`bool`) True if the graph contains all components
+        self.complete = False
+        #: (:obj:`dict` <:obj:`str`, :obj:`dict` <:obj:`str`, \
+        #:     :obj:`list` <:obj:`str`>>>) component references
+        self.__nodes = {}
+        #: (:obj:`dict` <:obj:`str`, :obj:`dict` <:obj:`str`, \
+        #:     :obj:`set` <:obj:`str`>>>) components using the references
+        self.__users = dict((label, {}) for label in self.labels)
+        #: (:class:`threading.RLock`) graph lock
+        self.__lock = threading.RLock()
+
+    def clear(self, revision=None):
+        """ removes all components from the graph
+
+        :param revision: new DB revision of the graph
+        :type revision: :obj:`str`
+        """
+        with self.__lock:
+            self.__nodes = {}
+            self.__users = dict((label, {}) for label in self.labels)
+            self.revision = revision
+            self.complete = False
+
+    def validate(self, revision):
+        """ clears the graph if the revision has changed
+
+        :param revision: current DB revision
+        :type revision: :obj:`str`
+        """
+        with self.__lock:
+            if revision != self.revision:
+                self.clear(revision)
+
+    def follow(self, revision, newrevision):
+        """ moves the graph to the revision after a single own DB change
+
+        :brief: The graph is cleared if the DB has been changed
+                also by someone else
+        :param revision: DB revision before the change
+        :type revision: :obj:`str`
+        :param newrevision: DB revision after the change
+        :type newrevision: :obj:`str`
+        :returns: True if the graph has been kept
+        :rtype: :obj:`bool`
+        """
+        with self.__lock:
+            if self.revision is not None and self.revision == revision \
+                    and newrevision is not None \
+                    and int(newrevision) - int(revision) in [0, 1]:
+                self.revision = newrevision
+                return True
+            self.clear(newrevision)
+            return False
+
+    def set(self, name, components, datasources, variables):
+        """ sets references of the component
+
+        :param name: component name
+        :type name: :obj:`str`
+        :param components: names of referenced components
+        :type components: :obj:`list` <:obj:`str`>
+        :param datasources: names of referenced datasources
+        :type datasources: :obj:`list` <:obj:`str`>
+        :param variables: names of used variables
+        :type variables: :obj:`list` <:obj:`str`>
+        """
+        node = dict(zip(self.labels, [
+            self.__unique(components),
+            self.__unique(datasources),
+            self.__unique(variables)]))
+        with self.__lock:
+            self.remove(name)
+            self.__nodes[name] = node
+            for label in self.labels:
+                for ref in node[label]:
+                    self.__users[label].setdefault(ref, set()).add(name)
+
+    def remove(self, name):
+        """ removes the component from the graph
+
+        :param name: component name
+        :type name: :obj:`str`
+        """
+        with self.__lock:
+            node = self.__nodes.pop(name, None)
+            if node is not None:
+                for label in self.labels:
+                    for ref in node[label]:
+                        users = self.__users[label].get(ref)
+                        users.discard(name)
+                        if not users:
+                            self.__users[label].pop(ref)
+
+    @classmethod
+    def __unique(cls, names):
+        """ removes duplicated names keeping their order
+
+        :param names: list of names
+        :type names: :obj:`list` <:obj:`str`>
+        :returns: list of unique names
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        found = set()
+        unique = []
+        for nm in names:
+            if nm not in found:
+                found.add(nm)
+                unique.append(nm)
+        return unique
+
+    def names(self):
+        """ provides names of components in the graph
+
+        :returns: component names
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        with self.__lock:
+            return list(self.__nodes.keys())
+
+    def missing(self, names):
+        """ provides names of components absent in the graph
+
+        :param names: component names
+        :type names: :obj:`list` <:obj:`str`>
+        :returns: names of absent components without duplicates
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        with self.__lock:
+            return self.__unique(
+                [nm for nm in names if nm not in self.__nodes])
+
+    def references(self, name, label="components"):
+        """ provides references of the component
+
+        :param name: component name
+        :type name: :obj:`str`
+        :param label: reference label, i.e. components, datasources
+                      or variables
+        :type label: :obj:`str`
+        :returns: referenced names
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        with self.__lock:
+            node = self.__nodes.get(name)
+            return list(node[label]) if node else []
+
+    def users(self, name, label="components"):
+        """ provides components which reference the given name
+
+        :param name: component, datasource or variable name
+        :type name: :obj:`str`
+        :param label: reference label, i.e. components, datasources
+                      or variables
+        :type label: :obj:`str`
+        :returns: sorted names of components
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        with self.__lock:
+            return sorted(self.__users[label].get(name, []))
+
+    def closure(self, names):
+        """ provides the given components with all their dependencies
+
+        :param names: component names
+        :type names: :obj:`list` <:obj:`str`>
+        :returns: component names in the breadth-first order
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        with self.__lock:
+            found = self.__unique(names)
+            visited = set(found)
+            index = 0
+            while index < len(found):
+                node = self.__nodes.get(found[index])
+                index += 1
+                for child in (node["components"] if node else []):
+                    if child not in visited:
+                        visited.add(child)
+                        found.append(child)
+            return found
+
+    def toDict(self, names=None):
+        """ provides the graph dictionary
+
+        :param names: names of components with their dependencies
+                      to be included, all components if None
+        :type names: :obj:`list` <:obj:`str`>
+        :returns: dictionary with component references and
+                  components using the referenced datasources
+        :rtype: :obj:`dict` <:obj:`str`, any>
+        """
+        with self.__lock:
+            cps = self.closure(names) if names is not None \
+                else sorted(self.__nodes.keys())
+            components = {}
+            datasources = {}
+            for name in cps:
+                node = self.__nodes.get(name)
+                if node is None:
+                    continue
+                components[name] = dict(
+                    (label, list(node[label])) for label in self.labels)
+                components[name]["usedby"] = self.users(name)
+                for ds in node["datasources"]:
+                    datasources[ds] = self.users(ds, "datasources")
+            return {"revision": self.revision,
+                    "components": components,
+                    "datasources": datasources}
@@ -75,3 +75,10 @@ class NonregisteredDBRecordError(Exception):
     """ Error for non-existing database records
     """
     pass
+
+
+class CyclicDependencyError(Exception):
+
+    """ Error for components which depend on themselves
+    """
+    pass
@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+""" Pool of worker threads executing asynchronous jobs """
+
+import threading
+import uuid
+from collections import deque, OrderedDict
+
+
+class JobPool(object):
+
+    """ pool of worker threads executing submitted jobs
+    """
+
+    #: (:obj:`str`) state of a job waiting for a worker
+    QUEUED = "QUEUED"
+    #: (:obj:`str`) state of a job being executed
+    RUNNING = "RUNNING"
+    #: (:obj:`str`) state of a successfully finished job
+    DONE = "DONE"
+    #: (:obj:`str`) state of a job finished with an error
+    FAILED = "FAILED"
+    #: (:obj:`str`) state of a finished job forgotten above maxjobs
+    EVICTED = "EVICTED"
+
+    def __init__(self, size=1, maxjobs=100, streams=None):
+        """ constructor
+
+        :param size: number of worker threads
+        :type size: :obj:`int`
+        :param maxjobs: maximal number of finished jobs kept
+                        until their results are fetched
+        :type maxjobs: :obj:`int`
+        :param streams: tango-like steamset class
+        :type streams: :class:`StreamSet` or :class:`PyTango.Device_4Impl`
+        """
+        #: (:obj:`int`) number of worker threads
+        self.size = max(1, int(size))
+        #: (:obj:`int`) maximal number of kept finished jobs
+        self.maxjobs = max(1, int(maxjobs))
+        #: (:class:`StreamSet` or :class:`PyTango.Device_4Impl`) stream set
+        self._streams = streams
+        #: (:obj:`collections.deque` < (:obj:`str`, :obj:`list`) >)
+        #:    queued job ids with their jobs
+        self.__queue = deque()
+        #: (:obj:`dict` <:obj:`str`, :obj:`list`>) queued and running jobs,
+        #:    i.e. [state, function, arguments]
+        self.__jobs = {}
+        #: (:class:`collections.OrderedDict` <:obj:`str`, :obj:`list`>)
+        #:    finished jobs, i.e. [state, result or error]
+        self.__finished = OrderedDict()
+        #: (:class:`collections.OrderedDict` <:obj:`str`, :obj:`bool`>)
+        #:    ids of the last evicted jobs
+        self.__evicted = OrderedDict()
+        #: (:obj:`bool`) pool closed flag
+        self.__closed = True
+        #: (:class:`threading.Condition`) pool condition
+        self.__condition = threading.Condition()
+        #: (:obj:`list` <:class:`threading.Thread`>) worker threads
+        self.__workers = []
+
+    def open(self):
+        """ starts the worker threads
+        """
+        with self.__condition:
+            if not self.__closed:
+                return
+            self.__closed = False
+            self.__workers = [threading.Thread(target=self.__work)
+                              for _ in range(self.size)]
+        for worker in self.__workers:
+            worker.daemon = True
+            worker.start()
+
+    def close(self, wait=True):
+        """ stops the worker threads
+
+        :brief: The queued jobs fail while the running ones are completed
+        :param wait: if the running jobs should be waited for
+        :type wait: :obj:`bool`
+        """
+        with self.__condition:
+            self.__closed = True
+            queue = self.__queue
+            self.__queue = deque()
+            workers = self.__workers
+            self.__workers = []
+            for jid, _ in queue:
+                self.__finish(jid, self.FAILED,
+                              RuntimeError("Job pool is closed"))
+            self.__condition.notify_all()
+        if wait:
+            for worker in workers:
+                if worker is not threading.current_thread():
+                    worker.join()
+
+    def submit(self, function, *args):
+        """ adds a new job to the queue
+
+        :param function: function to be executed
+        :type function: :obj:`instancemethod`
+        :param args: function arguments
+        :type args: :obj:`tuple` <any>
+        :returns: job id
+        :rtype: :obj:`str`
+        """
+        jid = uuid.uuid4().hex
+        with self.__condition:
+            if self.__closed:
+                raise RuntimeError("Job pool is closed")
+            job = [self.QUEUED, function, args]
+            self.__jobs[jid] = job
+            self.__queue.append((jid, job))
+            self.__condition.notify()
+        return jid
+
+    def state(self, jid):
+        """ provides the job state
+
+        :param jid: job id
+        :type jid: :obj:`str`
+        :returns: job state, i.e. QUEUED, RUNNING, DONE, FAILED
+                  or EVICTED
+        :rtype: :obj:`str`
+        """
+        with self.__condition:
+            if jid in self.__evicted:
+                return self.EVICTED
+            return self.__job(jid)[0]
+
+    def result(self, jid):
+        """ provides the job result and removes the finished job
+
+        :param jid: job id
+        :type jid: :obj:`str`
+        :returns: result of the job function
+        :rtype: any
+        """
+        with self.__condition:
+            if jid in self.__evicted:
+                raise RuntimeError(
+                    "Job %s is %s, i.e. its result exceeded the limit "
+                    "of %s unfetched results" % (jid, self.EVICTED,
+                                                 self.maxjobs))
+            state = self.__job(jid)[0]
+            if state in [self.QUEUED, self.RUNNING]:
+                raise RuntimeError("Job %s is %s" % (jid, state))
+            state, result = self.__finished.pop(jid)
+        if state == self.FAILED:
+            raise result
+        return result
+
+    def info(self):
+        """ provides pool statistics
+
+        :returns: dictionary with pool statistics
+        :rtype: :obj:`dict` <:obj:`str`, any>
+        """
+        with self.__condition:
+            return {"size": self.size,
+                    "queued": len(self.__queue),
+                    "running": len(self.__jobs) - len(self.__queue),
+                    "finished": len(self.__finished),
+                    "evicted": len(self.__evicted),
+                    "closed": self.__closed}
+
+    def __job(self, jid):
+        """ finds the job with the given id
+
+        :param jid: job id
+        :type jid: :obj:`str`
+        :returns: queued, running or finished job
+        :rtype: :obj:`list`
+        """
+        if jid in self.__jobs:
+            return self.__jobs[jid]
+        if jid in self.__finished:
+            return self.__finished[jid]
+        raise ValueError("Job %s not found" % jid)
+
+    def __finish(self, jid, state, result):
+        """ moves the job to the finished ones
+
+        :brief: It forgets the oldest finished jobs above maxjobs
+                and keeps ids of the last 10 * maxjobs evicted jobs
+        :param jid: job id
+        :type jid: :obj:`str`
+        :param state: final job state
+        :type state: :obj:`str`
+        :param result: job result or error
+        :type result: any
+        """
+        self.__jobs.pop(jid, None)
+        self.__finished[jid] = [state, result]
+        while len(self.__finished) > self.maxjobs:
+            self.__evicted[self.__finished.popitem(last=False)[0]] = True
+        while len(self.__evicted) > 10 * self.maxjobs:
+            self.__evicted.popitem(last=False)
+
+    def __work(self):
+        """ worker thread loop
+        """
+        worker = threading.current_thread()
+        while True:
+            with self.__condition:
+                while not self.__queue and worker in self.__workers:
+                    self.__condition.wait()
+                if worker not in self.__workers:
+                    return
+                jid, job = self.__queue.popleft()
+                job[0] = self.RUNNING
+            function, args = job[1], job[2]
+            try:
+                state, result = self.DONE, function(*args)
+            except Exception as e:
+                state, result = self.FAILED, e
+                if self._streams:
+                    self._streams.warn(
+                        "JobPool::__work() - %s: %s" % (jid, str(e)))
+            with self.__condition:
+                self.__finish(jid, state, result)
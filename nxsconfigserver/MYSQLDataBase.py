@@ -23,6 +23,8 @@ import MySQLdb
 import sys
 import json
 
+from .ConnectionPool import ConnectionPool
+from .RevisionCache import RevisionCache
 from .Errors import NonregisteredDBRecordError
 
 
@@ -42,49 +44,104 @@ class MYSQLDataBase(object):
         :param streams: tango-like steamset class
         :type streams: :class:`StreamSet` or :class:`PyTango.Device_4Impl`
         """
-        #: (:class:`MySQLdb.connections.Connection`) db instance
-        self.__db = None
+        #: (:class:`nxsconfigserver.ConnectionPool.ConnectionPool`) \
+        #:     pool of db connections
+        self.__pool = None
         #: (:obj:`dict` <:obj:`str`, any>) connect arguments
         self.__args = None
         #: (:obj:`dict` <:obj:`str`, any>) connect arguments string
         self.__argstr = None
         #: (:class:`StreamSet` or :class:`PyTango.Device_4Impl`) stream set
         self._streams = streams
+        #: (:obj:`int`) maximal number of names fetched by a single query
+        self.maxNames = 500
+        #: (:obj:`dict` <:obj:`str`, any>) default pool and cache settings
+        #:     which can be changed by connect arguments
+        self.settings = {
+            "pool_size": 4,
+            "pool_idle_timeout": 300,
+            "pool_check_period": 30,
+            "cache_max_size": 64 * 2 ** 20,
+        }
+        #: (:class:`nxsconfigserver.RevisionCache.RevisionCache`) \
+        #:     cache of component and datasource xmls
+        self.__cache = RevisionCache(self.settings["cache_max_size"])
 
     def connect(self, args):
         """ connects to the database
 
+        :brief: The pool and cache settings, i.e. pool_size,
+                pool_idle_timeout, pool_check_period and cache_max_size,
+                are taken from the arguments and the remaining ones
+                are passed to MySQLdb.connect
         :param args: arguments of the MySQLdb connect method
         :type args: :obj:`dict` <:obj:`str`, any>
         """
         if self._streams:
             self._streams.debug(
                 "MYSQLDataBase::connect() - connect: %s" % args)
-        argstr = json.dumps(args)
-        if self.__argstr == argstr and self.__db.open:
-            try:
-                self.__db.ping(True)
-            except Exception:
-                self.close()
-                self.__db = MySQLdb.connect(**args)
-        else:
+        args = dict(args)
+        settings = dict(self.settings)
+        for key in self.settings.keys():
+            if key in args:
+                settings[key] = args.pop(key)
+        self.__cache.maxsize = int(settings["cache_max_size"])
+        argstr = json.dumps([args, settings], sort_keys=True)
+        if self.__argstr != argstr or self.__pool is None \
+                or self.__pool.info()["closed"]:
             self.close()
-            self.__db = MySQLdb.connect(**args)
+            pool = ConnectionPool(
+                lambda: self.__connect(args),
+                settings["pool_size"],
+                settings["pool_idle_timeout"],
+                settings["pool_check_period"],
+                self._streams)
+            pool.open()
+            self.__pool = pool
+            self.__cache.clear()
             self.__args = args
             self.__argstr = argstr
 
+    @classmethod
+    def __connect(cls, args):
+        """ creates a new database connection
+
+        :param args: arguments of the MySQLdb connect method
+        :type args: :obj:`dict` <:obj:`str`, any>
+        :returns: database connection
+        :rtype: :class:`MySQLdb.connections.Connection`
+        """
+        db = MySQLdb.connect(**args)
+        # every query sees the recent data, transactions are started
+        # explicitly by the store and delete methods
+        db.autocommit(True)
+        return db
+
     def close(self):
         """ closes database connection
 
         :brief: It closes connection to the open database
         """
-        if self.__db:
-            try:
-                self.__db.ping(True)
-                if self.__db.open:
-                    self.__db.close()
-            except Exception:
-                pass
+        if self.__pool:
+            self.__pool.close()
+
+    def cacheInfo(self):
+        """ provides xml cache statistics
+
+        :returns: dictionary with cache statistics
+        :rtype: :obj:`dict` <:obj:`str`, any>
+        """
+        return self.__cache.info()
+
+    def poolInfo(self):
+        """ provides connection pool statistics
+
+        :returns: dictionary with pool statistics
+        :rtype: :obj:`dict` <:obj:`str`, any>
+        """
+        if self.__pool:
+            return self.__pool.info()
+        return {}
 
     def version(self):
         """ provides DB configuration version
@@ -94,15 +151,13 @@ class MYSQLDataBase(object):
         """
         argout = None
         cursor = None
-        if self.__db is not None:
+        if self.__pool is not None:
             try:
-                try:
-                    self.__db.ping(True)
-                except Exception:
-                    return argout
-                if not self.__db.open:
-                    self.connect(self.__args)
-                cursor = self.__db.cursor()
+                db = self.__pool.acquire()
+            except Exception:
+                return argout
+            try:
+                cursor = db.cursor()
                 cursor.execute(
                     "select value from properties where name = 'revision';")
                 data = cursor.fetchone()
@@ -115,7 +170,9 @@ class MYSQLDataBase(object):
             except Exception:
                 if cursor:
                     cursor.close()
+                self.__pool.release(db, check=True)
                 raise
+            self.__pool.release(db)
         return argout
 
     @classmethod
@@ -144,6 +201,99 @@ class MYSQLDataBase(object):
             "update properties set value = '%s' where name = 'revision';"
             % (cls.__escape(new)))
 
+    def __fetchRecords(self, cursor, table, column, names, label):
+        """ fetches the required records with bulk queries
+
+        :param cursor: transaction cursor
+        :type cursor: :class:`MySQLdb.cursors.Cursor`
+        :param table: table name
+        :type table: :obj:`str`
+        :param column: name of the fetched column
+        :type column: :obj:`str`
+        :param names: list of record names
+        :type names: :obj:`list` <:obj:`str`>
+        :param label: record label used in error messages
+        :type label: :obj:`str`
+        :returns: list of record values in order of the given names
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        records = {}
+        unique = list(set(names))
+        for i in range(0, len(unique), self.maxNames):
+            chunk = unique[i:(i + self.maxNames)]
+            cursor.execute(
+                "select name, %s from %s where name in (%s);"
+                % (column, table,
+                   ", ".join(["'%s'" % self.__escape(ar) for ar in chunk])))
+            for name, value in cursor.fetchall():
+                if value:
+                    records[name] = value
+        argout = []
+        for ar in names:
+            if ar not in records:
+                # names which differ from the returned ones, e.g. due to
+                # the table collation, are fetched one by one
+                cursor.execute(
+                    "select %s from %s where name = '%s';"
+                    % (column, table, self.__escape(ar)))
+                data = cursor.fetchone()
+                if not data or not data[0]:
+                    raise NonregisteredDBRecordError(
+                        "%s %s not registered in the database" % (label, ar))
+                records[ar] = data[0]
+            argout.append(records[ar])
+        return argout
+
+    @classmethod
+    def __revision(cls, cursor):
+        """ provides revision number
+
+        :param cursor: transaction cursor
+        :type cursor: :class:`MySQLdb.cursors.Cursor`
+        :returns: DB configuration revision
+        :rtype: :obj:`str`
+        """
+        cursor.execute(
+            "select value from properties where name = 'revision';")
+        data = cursor.fetchone()
+        return data[0] if data else None
+
+    def __cachedRecords(self, cursor, table, column, names, label):
+        """ fetches the required records from the cache or the database
+
+        :param cursor: transaction cursor
+        :type cursor: :class:`MySQLdb.cursors.Cursor`
+        :param table: table name
+        :type table: :obj:`str`
+        :param column: name of the fetched column
+        :type column: :obj:`str`
+        :param names: list of record names
+        :type names: :obj:`list` <:obj:`str`>
+        :param label: record label used in error messages
+        :type label: :obj:`str`
+        :returns: list of record values in order of the given names
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        if not self.__cache.maxsize or not names:
+            return self.__fetchRecords(cursor, table, column, names, label)
+        revision = self.__revision(cursor)
+        self.__cache.validate(revision)
+        records = {}
+        missing = []
+        for ar in names:
+            if ar not in records:
+                value = self.__cache.get((table, ar))
+                if value is None:
+                    missing.append(ar)
+                records[ar] = value
+        if missing:
+            values = self.__fetchRecords(
+                cursor, table, column, missing, label)
+            for ar, value in zip(missing, values):
+                records[ar] = value
+                self.__cache.set((table, ar), value, revision)
+        return [records[ar] for ar in names]
+
     def components(self, names):
         """ fetches the required components
 
@@ -153,26 +303,18 @@ class MYSQLDataBase(object):
         :rtype: :obj:`list` <:obj:`str`>
         """
         argout = []
-        if self.__db is not None:
-            try:
-                self.__db.ping(True)
-                if not self.__db.open:
-                    self.connect(self.__args)
-                cursor = self.__db.cursor()
-                for ar in names:
-                    cursor.execute(
-                        "select xml from components where name = '%s';"
-                        % self.__escape(ar))
-                    data = cursor.fetchone()
-                    if not data or not data[0]:
-                        raise NonregisteredDBRecordError(
-                            "Component %s not registered in the database" % ar)
-                    argout.append(data[0])
-                cursor.close()
-            except Exception:
-                if cursor:
+        if self.__pool is not None:
+            with self.__pool.connection() as db:
+                cursor = None
+                try:
+                    cursor = db.cursor()
+                    argout = self.__cachedRecords(
+                        cursor, "components", "xml", names, "Component")
                     cursor.close()
-                raise
+                except Exception:
+                    if cursor:
+                        cursor.close()
+                    raise
         return argout
 
     def selections(self, names):
@@ -184,26 +326,18 @@ class MYSQLDataBase(object):
         :rtype: :obj:`list` <:obj:`str`>
         """
         argout = []
-        if self.__db is not None:
-            try:
-                self.__db.ping(True)
-                if not self.__db.open:
-                    self.connect(self.__args)
-                cursor = self.__db.cursor()
-                for ar in names:
-                    cursor.execute(
-                        "select selection from selections where name = '%s';"
-                        % self.__escape(ar))
-                    data = cursor.fetchone()
-                    if not data or not data[0]:
-                        raise NonregisteredDBRecordError(
-                            "Selection %s not registered in the database" % ar)
-                    argout.append(data[0])
-                cursor.close()
-            except Exception:
-                if cursor:
+        if self.__pool is not None:
+            with self.__pool.connection() as db:
+                cursor = None
+                try:
+                    cursor = db.cursor()
+                    argout = self.__fetchRecords(
+                        cursor, "selections", "selection", names, "Selection")
                     cursor.close()
-                raise
+                except Exception:
+                    if cursor:
+                        cursor.close()
+                    raise
         return argout
 
     def dataSources(self, names):
@@ -215,27 +349,18 @@ class MYSQLDataBase(object):
         :rtype: :obj:`list` <:obj:`str`>
         """
         argout = []
-        if self.__db is not None:
-            try:
-                self.__db.ping(True)
-                if not self.__db.open:
-                    self.connect(self.__args)
-                cursor = self.__db.cursor()
-                for ar in names:
-                    cursor.execute(
-                        "select xml from datasources where name = '%s';"
-                        % self.__escape(ar))
-                    data = cursor.fetchone()
-                    if not data or not data[0]:
-                        raise NonregisteredDBRecordError(
-                            "DataSource %s not registered in the database"
-                            % ar)
-                    argout.append(data[0])
-                cursor.close()
-            except Exception:
-                if cursor:
+        if self.__pool is not None:
+            with self.__pool.connection() as db:
+                cursor = None
+                try:
+                    cursor = db.cursor()
+                    argout = self.__cachedRecords(
+                        cursor, "datasources", "xml", names, "DataSource")
                     cursor.close()
-                raise
+                except Exception:
+                    if cursor:
+                        cursor.close()
+                    raise
         return argout
 
     def availableComponents(self):
@@ -245,18 +370,19 @@ class MYSQLDataBase(object):
         :rtype: :obj:`list` <:obj:`str`>
         """
         argout = []
-        if self.__db is not None:
-            try:
-                self.__db.ping(True)
-                cursor = self.__db.cursor()
-                cursor.execute("select name from components;")
-                data = cursor.fetchall()
-                argout = [d[0] for d in data]
-                cursor.close()
-            except Exception:
-                if cursor:
+        if self.__pool is not None:
+            with self.__pool.connection() as db:
+                cursor = None
+                try:
+                    cursor = db.cursor()
+                    cursor.execute("select name from components;")
+                    data = cursor.fetchall()
+                    argout = [d[0] for d in data]
                     cursor.close()
-                raise
+                except Exception:
+                    if cursor:
+                        cursor.close()
+                    raise
 
         return argout
 
@@ -267,18 +393,19 @@ class MYSQLDataBase(object):
         :rtype: :obj:`list` <:obj:`str`>
         """
         argout = []
-        if self.__db is not None:
-            try:
-                self.__db.ping(True)
-                cursor = self.__db.cursor()
-                cursor.execute("select name from selections;")
-                data = cursor.fetchall()
-                argout = [d[0] for d in data]
-                cursor.close()
-            except Exception:
-                if cursor:
+        if self.__pool is not None:
+            with self.__pool.connection() as db:
+                cursor = None
+                try:
+                    cursor = db.cursor()
+                    cursor.execute("select name from selections;")
+                    data = cursor.fetchall()
+                    argout = [d[0] for d in data]
                     cursor.close()
-                raise
+                except Exception:
+                    if cursor:
+                        cursor.close()
+                    raise
 
         return argout
 
@@ -289,20 +416,19 @@ class MYSQLDataBase(object):
         :rtype: :obj:`list` <:obj:`str`>
         """
         argout = []
-        if self.__db is not None:
-            try:
-                self.__db.ping(True)
-                if not self.__db.open:
-                    self.connect(self.__args)
-                cursor = self.__db.cursor()
-                cursor.execute("select name from datasources;")
-                data = cursor.fetchall()
-                argout = [d[0] for d in data]
-                cursor.close()
-            except Exception:
-                if cursor:
+        if self.__pool is not None:
+            with self.__pool.connection() as db:
+                cursor = None
+                try:
+                    cursor = db.cursor()
+                    cursor.execute("select name from datasources;")
+                    data = cursor.fetchall()
+                    argout = [d[0] for d in data]
                     cursor.close()
-                raise
+                except Exception:
+                    if cursor:
+                        cursor.close()
+                    raise
         return argout
 
     def storeComponent(self, name, xml):
@@ -313,41 +439,41 @@ class MYSQLDataBase(object):
         :param xml: component tree
         :type xml: :obj:`str`
         """
-        if self.__db is not None:
-            try:
-                self.__db.ping(True)
-                if not self.__db.open:
-                    self.connect(self.__args)
-                cursor = self.__db.cursor()
-                cursor.execute(
-                    "select xml from components where name = '%s';"
-                    % self.__escape(name))
-                data = cursor.fetchone()
-                if data and len(data) > 0 and data[0]:
-                    if data[0] != xml:
+        if self.__pool is not None:
+            with self.__pool.connection() as db:
+                cursor = None
+                try:
+                    cursor = db.cursor()
+                    cursor.execute("start transaction;")
+                    cursor.execute(
+                        "select xml from components where name = '%s';"
+                        % self.__escape(name))
+                    data = cursor.fetchone()
+                    if data and len(data) > 0 and data[0]:
+                        if data[0] != xml:
+                            cursor.execute(
+                                "update components set xml"
+                                " = '%s' where name = '%s';"
+                                % (self.__escape(xml),
+                                   self.__escape(name)))
+                            self.__incRevision(cursor)
+                            db.commit()
+                        else:
+                            db.rollback()
+                    else:
                         cursor.execute(
-                            "update components set xml"
-                            " = '%s' where name = '%s';"
-                            % (self.__escape(xml),
-                               self.__escape(name)))
+                            "insert into components "
+                            "values('%s', '%s', 0);"
+                            % (self.__escape(name),
+                               self.__escape(xml)))
                         self.__incRevision(cursor)
-                        self.__db.commit()
-                    else:
-                        self.__db.rollback()
-                else:
-                    cursor.execute(
-                        "insert into components "
-                        "values('%s', '%s', 0);"
-                        % (self.__escape(name),
-                           self.__escape(xml)))
-                    self.__incRevision(cursor)
-                    self.__db.commit()
-                cursor.close()
-            except Exception:
-                self.__db.rollback()
-                if cursor:
+                        db.commit()
                     cursor.close()
-                raise
+                except Exception:
+                    db.rollback()
+                    if cursor:
+                        cursor.close()
+                    raise
 
             if self._streams:
                 self._streams.info("MYSQLDataBase::storeComponent()"
@@ -361,42 +487,42 @@ class MYSQLDataBase(object):
         :param xml: datasource tree
         :type xml: :obj:`str`
         """
-        if self.__db is not None:
-            try:
-                self.__db.ping(True)
-                if not self.__db.open:
-                    self.connect(self.__args)
-                cursor = self.__db.cursor()
-                cursor.execute(
-                    "select xml from datasources where name = '%s';"
-                    % self.__escape(name))
-                data = cursor.fetchone()
-                if data and len(data) > 0 and data[0]:
-                    if data[0] != xml:
-                        cursor.execute(
-                            "update datasources set "
-                            "xml = '%s' where name = '%s';"
-                            % (self.__escape(xml),
-                               self.__escape(name)))
-                        self.__incRevision(cursor)
-                        self.__db.commit()
-                    else:
-                        self.__db.rollback()
-                else:
+        if self.__pool is not None:
+            with self.__pool.connection() as db:
+                cursor = None
+                try:
+                    cursor = db.cursor()
+                    cursor.execute("start transaction;")
                     cursor.execute(
-                        "insert into datasources "
-                        "values('%s', '%s');"
-                        % (self.__escape(name),
-                           self.__escape(xml)))
+                        "select xml from datasources where name = '%s';"
+                        % self.__escape(name))
+                    data = cursor.fetchone()
+                    if data and len(data) > 0 and data[0]:
+                        if data[0] != xml:
+                            cursor.execute(
+                                "update datasources set "
+                                "xml = '%s' where name = '%s';"
+                                % (self.__escape(xml),
+                                   self.__escape(name)))
+                            self.__incRevision(cursor)
+                            db.commit()
+                        else:
+                            db.rollback()
+                    else:
+                        cursor.execute(
+                            "insert into datasources "
+                            "values('%s', '%s');"
+                            % (self.__escape(name),
+                               self.__escape(xml)))
 
-                    self.__incRevision(cursor)
-                    self.__db.commit()
-                cursor.close()
-            except Exception:
-                self.__db.rollback()
-                if cursor:
+                        self.__incRevision(cursor)
+                        db.commit()
                     cursor.close()
-                raise
+                except Exception:
+                    db.rollback()
+                    if cursor:
+                        cursor.close()
+                    raise
             if self._streams:
                 self._streams.info("MYSQLDataBase::storeDataSource() "
                                    "- store datasource %s" % name)
@@ -409,42 +535,42 @@ class MYSQLDataBase(object):
         :param selection: selection tree
         :type selection: :obj:`str`
         """
-        if self.__db is not None:
-            try:
-                self.__db.ping(True)
-                if not self.__db.open:
-                    self.connect(self.__args)
-                cursor = self.__db.cursor()
-                cursor.execute(
-                    "select selection from selections where name = '%s';"
-                    % self.__escape(name))
-                data = cursor.fetchone()
-                if data and len(data) > 0 and data[0]:
-                    if data[0] != selection:
-                        cursor.execute(
-                            "update selections set "
-                            "selection = '%s' where name = '%s';"
-                            % (self.__escape(selection),
-                               self.__escape(name)))
+        if self.__pool is not None:
+            with self.__pool.connection() as db:
+                cursor = None
+                try:
+                    cursor = db.cursor()
+                    cursor.execute("start transaction;")
+                    cursor.execute(
+                        "select selection from selections where name = '%s';"
+                        % self.__escape(name))
+                    data = cursor.fetchone()
+                    if data and len(data) > 0 and data[0]:
+                        if data[0] != selection:
+                            cursor.execute(
+                                "update selections set "
+                                "selection = '%s' where name = '%s';"
+                                % (self.__escape(selection),
+                                   self.__escape(name)))
 #                        self.__incRevision(cursor)
-                        self.__db.commit()
+                            db.commit()
+                        else:
+                            db.rollback()
                     else:
-                        self.__db.rollback()
-                else:
-                    cursor.execute(
-                        "insert into selections "
-                        "values('%s', '%s');"
-                        % (self.__escape(name),
-                           self.__escape(selection)))
+                        cursor.execute(
+                            "insert into selections "
+                            "values('%s', '%s');"
+                            % (self.__escape(name),
+                               self.__escape(selection)))
 
 #                    self.__incRevision(cursor)
-                    self.__db.commit()
-                cursor.close()
-            except Exception:
-                self.__db.rollback()
-                if cursor:
+                        db.commit()
                     cursor.close()
-                raise
+                except Exception:
+                    db.rollback()
+                    if cursor:
+                        cursor.close()
+                    raise
             if self._streams:
                 self._streams.info("MYSQLDataBase::storeSelection() "
                                    "- store selection %s" % name)
@@ -455,29 +581,28 @@ class MYSQLDataBase(object):
         :param name: name of the component to delete
         :type name: :obj:`str`
         """
-        if self.__db is not None:
-            try:
-                self.__db.ping(True)
-                if not self.__db.open:
-                    self.connect(self.__args)
-                cursor = self.__db.cursor()
-                cursor.execute(
-                    "select exists(select 1 from components where "
-                    "name = '%s');" % self.__escape(name))
-                data = cursor.fetchone()
-                if data[0]:
+        if self.__pool is not None:
+            with self.__pool.connection() as db:
+                cursor = None
+                try:
+                    cursor = db.cursor()
+                    cursor.execute("start transaction;")
                     cursor.execute(
-                        "delete from components where name = '%s';"
-                        % self.__escape(name))
-
-                    self.__db.commit()
-                self.__incRevision(cursor)
-                cursor.close()
-            except Exception:
-                self.__db.rollback()
-                if cursor:
+                        "select exists(select 1 from components where "
+                        "name = '%s');" % self.__escape(name))
+                    data = cursor.fetchone()
+                    if data[0]:
+                        cursor.execute(
+                            "delete from components where name = '%s';"
+                            % self.__escape(name))
+                    self.__incRevision(cursor)
+                    db.commit()
                     cursor.close()
-                raise
+                except Exception:
+                    db.rollback()
+                    if cursor:
+                        cursor.close()
+                    raise
 
             if self._streams:
                 self._streams.info("MYSQLDataBase::deleteComponent() "
@@ -489,29 +614,28 @@ class MYSQLDataBase(object):
         :param name: name of the selection to delete
         :type name: :obj:`str`
         """
-        if self.__db is not None:
-            try:
-                self.__db.ping(True)
-                if not self.__db.open:
-                    self.connect(self.__args)
-                cursor = self.__db.cursor()
-                cursor.execute(
-                    "select exists(select 1 from selections where "
-                    "name = '%s');" % self.__escape(name))
-                data = cursor.fetchone()
-                if data[0]:
+        if self.__pool is not None:
+            with self.__pool.connection() as db:
+                cursor = None
+                try:
+                    cursor = db.cursor()
+                    cursor.execute("start transaction;")
                     cursor.execute(
-                        "delete from selections where name = '%s';"
-                        % self.__escape(name))
-
-                    self.__db.commit()
-#                self.__incRevision(cursor)
-                cursor.close()
-            except Exception:
-                self.__db.rollback()
-                if cursor:
+                        "select exists(select 1 from selections where "
+                        "name = '%s');" % self.__escape(name))
+                    data = cursor.fetchone()
+                    if data[0]:
+                        cursor.execute(
+                            "delete from selections where name = '%s';"
+                            % self.__escape(name))
+#                    self.__incRevision(cursor)
+                    db.commit()
                     cursor.close()
-                raise
+                except Exception:
+                    db.rollback()
+                    if cursor:
+                        cursor.close()
+                    raise
 
             if self._streams:
                 self._streams.info("MYSQLDataBase::deleteSelection() "
@@ -523,30 +647,30 @@ class MYSQLDataBase(object):
         :param name: name of the component
         :type name: :obj:`str`
         """
-        if self.__db is not None:
-            try:
-                self.__db.ping(True)
-                if not self.__db.open:
-                    self.connect(self.__args)
-                cursor = self.__db.cursor()
-                cursor.execute(
-                    "select mandatory from components where name = '%s';"
-                    % self.__escape(name))
-                data = cursor.fetchone()
-                if data and len(data) > 0 and data[0] != 1:
+        if self.__pool is not None:
+            with self.__pool.connection() as db:
+                cursor = None
+                try:
+                    cursor = db.cursor()
+                    cursor.execute("start transaction;")
                     cursor.execute(
-                        "update components set mandatory = 1 where "
-                        "name = '%s';" % self.__escape(name))
-                    self.__db.commit()
-                    self.__incRevision(cursor)
-                else:
-                    self.__db.rollback()
-                cursor.close()
-            except Exception:
-                self.__db.rollback()
-                if cursor:
+                        "select mandatory from components where name = '%s';"
+                        % self.__escape(name))
+                    data = cursor.fetchone()
+                    if data and len(data) > 0 and data[0] != 1:
+                        cursor.execute(
+                            "update components set mandatory = 1 where "
+                            "name = '%s';" % self.__escape(name))
+                        self.__incRevision(cursor)
+                        db.commit()
+                    else:
+                        db.rollback()
                     cursor.close()
-                raise
+                except Exception:
+                    db.rollback()
+                    if cursor:
+                        cursor.close()
+                    raise
             if self._streams:
                 self._streams.info(
                     "MYSQLDataBase::setMandatory() - component %s" % name)
@@ -557,32 +681,31 @@ class MYSQLDataBase(object):
         :param name: name of the component to delete
         :type name: :obj:`str`
         """
-        if self.__db is not None:
-            try:
-                self.__db.ping(True)
-                if not self.__db.open:
-                    self.connect(self.__args)
-                cursor = self.__db.cursor()
-                cursor.execute(
-                    "select mandatory from components where name = '%s';"
-                    % self.__escape(name))
-                data = cursor.fetchone()
-                if data and len(data) > 0 and data[0] != 0:
+        if self.__pool is not None:
+            with self.__pool.connection() as db:
+                cursor = None
+                try:
+                    cursor = db.cursor()
+                    cursor.execute("start transaction;")
                     cursor.execute(
-                        "update components set mandatory = 0 where "
-                        "name = '%s';" % self.__escape(name))
-
-                    self.__db.commit()
-                    self.__incRevision(cursor)
-                else:
-                    self.__db.rollback()
+                        "select mandatory from components where name = '%s';"
+                        % self.__escape(name))
+                    data = cursor.fetchone()
+                    if data and len(data) > 0 and data[0] != 0:
+                        cursor.execute(
+                            "update components set mandatory = 0 where "
+                            "name = '%s';" % self.__escape(name))
+                        self.__incRevision(cursor)
+                        db.commit()
+                    else:
+                        db.rollback()
 
-                cursor.close()
-            except Exception:
-                self.__db.rollback()
-                if cursor:
                     cursor.close()
-                raise
+                except Exception:
+                    db.rollback()
+                    if cursor:
+                        cursor.close()
+                    raise
 
             if self._streams:
                 self._streams.info("MYSQLDataBase::unsetMandatory() "
@@ -595,21 +718,20 @@ class MYSQLDataBase(object):
         :rtype: :obj:`list` <:obj:`str`>
         """
         argout = []
-        if self.__db is not None:
-            try:
-                self.__db.ping(True)
-                if not self.__db.open:
-                    self.connect(self.__args)
-                cursor = self.__db.cursor()
-                cursor.execute(
-                    "select name from components where mandatory = 1")
-                data = cursor.fetchall()
-                argout = [d[0] for d in data]
-                cursor.close()
-            except Exception:
-                if cursor:
+        if self.__pool is not None:
+            with self.__pool.connection() as db:
+                cursor = None
+                try:
+                    cursor = db.cursor()
+                    cursor.execute(
+                        "select name from components where mandatory = 1")
+                    data = cursor.fetchall()
+                    argout = [d[0] for d in data]
                     cursor.close()
-                raise
+                except Exception:
+                    if cursor:
+                        cursor.close()
+                    raise
 
         return argout
 
@@ -619,29 +741,28 @@ class MYSQLDataBase(object):
         :param name: name of the datasource to delete
         :type name: :obj:`str`
         """
-        if self.__db is not None:
-            try:
-                self.__db.ping(True)
-                if not self.__db.open:
-                    self.connect(self.__args)
-                cursor = self.__db.cursor()
-                cursor.execute(
-                    "select exists(select 1 from datasources where "
-                    "name = '%s');" % self.__escape(name))
-                data = cursor.fetchone()
-                if data[0]:
+        if self.__pool is not None:
+            with self.__pool.connection() as db:
+                cursor = None
+                try:
+                    cursor = db.cursor()
+                    cursor.execute("start transaction;")
                     cursor.execute(
-                        "delete from datasources where name = '%s';"
-                        % self.__escape(name))
-
-                    self.__db.commit()
-                self.__incRevision(cursor)
-                cursor.close()
-            except Exception:
-                self.__db.rollback()
-                if cursor:
+                        "select exists(select 1 from datasources where "
+                        "name = '%s');" % self.__escape(name))
+                    data = cursor.fetchone()
+                    if data[0]:
+                        cursor.execute(
+                            "delete from datasources where name = '%s';"
+                            % self.__escape(name))
+                    self.__incRevision(cursor)
+                    db.commit()
                     cursor.close()
-                raise
+                except Exception:
+                    db.rollback()
+                    if cursor:
+                        cursor.close()
+                    raise
             if self._streams:
                 self._streams.info("MYSQLDataBase::deleteDataSource() "
                                    "- datasource %s" % name)
@@ -21,8 +21,8 @@
 
 import re
 import sys
+import threading
 
-import xml.etree.ElementTree as et
 from lxml.etree import XMLParser
 import lxml.etree as etree
 from .Errors import IncompatibleNodeError, UndefinedTagError
@@ -49,18 +49,63 @@ def _tostr(text):
         return str(text)
 
 
+#: (:class:`threading.local`) thread local storage of xml parsers
+_parsers = threading.local()
+
+
+def _fromstring(xml):
+    """ parses xml string with the xml parser of the current thread
+
+    :param xml: xml string
+    :type xml: :obj:`str`
+    :returns: root element
+    :rtype: :class:`lxml.etree.Element`
+    """
+    parser = getattr(_parsers, "parser", None)
+    if parser is None:
+        parser = _parsers.parser = XMLParser(collect_ids=False)
+    if sys.version_info > (3,) and isinstance(xml, str):
+        xml = bytes(xml, "UTF-8")
+    return etree.fromstring(xml, parser=parser)
+
+
 def _toxml(node):
     """ provides xml content of the whole node
 
     :param node: DOM node
-    :type node: :class:`xml.dom.Node`
+    :type node: :class:`lxml.etree.Element`
     :returns: xml content string
     :rtype: :obj:`str`
     """
-    xml = _tostr(et.tostring(node, encoding='utf8', method='xml'))
-    if xml.startswith("<?xml version='1.0' encoding='utf8'?>"):
-        xml = str(xml[38:])
-    return xml
+    return _tostr(etree.tostring(
+        node, encoding='utf8', method='xml', xml_declaration=False))
+
+
+def _mergeSubtrees(settings, subtrees):
+    """ merges independent subtrees in a worker process
+
+    :param settings: singles, allowed children and tags with unique text
+    :type settings: (:obj:`list` <:obj:`str`>, \
+                    :obj:`dict` <:obj:`str`, :obj:`tuple` <:obj:`str`>>, \
+                    :obj:`list` <:obj:`str`>)
+    :param subtrees: xml strings of subtrees with their ancestors
+    :type subtrees: :obj:`list` <(:obj:`bytes`, \
+                    :obj:`tuple` <(:obj:`str`, :obj:`str`, :obj:`str`)>)>
+    :returns: xml strings of merged subtrees or None for subtrees
+              which cannot be merged
+    :rtype: :obj:`list` <:obj:`bytes`>
+    """
+    mgr = Merger()
+    mgr.singles, mgr.children, mgr.uniqueText = settings
+    merged = []
+    for xml, ancestors in subtrees:
+        try:
+            node = _fromstring(xml)
+            mgr._mergeSubtree(node, ancestors)
+            merged.append(etree.tostring(node, with_tail=False))
+        except Exception:
+            merged.append(None)
+    return merged
 
 
 class Merger(object):
@@ -72,7 +117,7 @@ class Merger(object):
         """ consturctor
         """
 
-        #: (:obj:`xml.etree.ElementTree.Element`) DOM root node
+        #: (:class:`lxml.etree.Element`) DOM root node
         self.__root = None
         #: (:obj:`list` <:obj:`str`> ) tags which cannot have the same siblings
         self.singles = ['strategy', 'dimensions', 'definition',
@@ -125,12 +170,45 @@ class Merger(object):
         #: (:obj:`str`) datasource label
         self.__dsvars = "$datasources."
 
+        #: (:class:`re.RegexObject`) finder of datasource names in texts
+        self.__dsfinder = re.compile(
+            r"%s\W*(\w+)" % re.escape(self.__dsvars))
+
+        #: (:obj:`frozenset` <:obj:`str`> ) index of datasources
+        #:    to switch to STEP mode built for the current merge
+        self.__switchset = frozenset()
+
+        #: (:obj:`frozenset` <:obj:`str`> ) index of datasources
+        #:    to add links built for the current merge
+        self.__linkset = frozenset()
+
+        #: (:obj:`frozenset` <:obj:`str`> ) index of datasources
+        #:    to switch to CanFail mode built for the current merge
+        self.__canfailset = frozenset()
+
+        #: (:obj:`dict` <:class:`lxml.etree.Element`, \
+        #:    [:class:`lxml.etree.Element`, :obj:`set` <:obj:`str`>]> ) \
+        #:    NXdata groups of entry nodes with names of their children
+        self.__links = {}
+
+        #: (:obj:`set` <:class:`lxml.etree.Element`>) elements added
+        #:    after the last merge or None if the tree was not merged
+        self.__fresh = None
+
+        #: (:class:`concurrent.futures.Executor`) process pool executor
+        #:    merging independent subtrees or None for the serial merge
+        self.executor = None
+
+        #: (:obj:`int`) number of elements of subtrees which are merged
+        #:    in one worker task
+        self.tasksize = 2000
+
     @classmethod
     def __getText(cls, node):
         """ collects text from text child nodes
 
         :param node: parent node
-        :type node: :obj:`xml.etree.ElementTree.Element`
+        :type node: :class:`lxml.etree.Element`
         """
         if node is not None:
             tnodes = ([node.text] if node.text else []) \
@@ -142,7 +220,7 @@ class Merger(object):
         """ gets ancestors form the xml tree
 
         :param node: dom node
-        :type node: :obj:`xml.etree.ElementTree.Element`
+        :type node: :class:`lxml.etree.Element`
         :returns: xml path
         :rtype: :obj:`str`
         """
@@ -163,9 +241,9 @@ class Merger(object):
         """ checks if two elements are mergeable
 
         :param elem1: first element
-        :type elem1: :obj:`xml.etree.ElementTree.Element`
+        :type elem1: :class:`lxml.etree.Element`
         :param elem2: second element
-        :type elem2: :obj:`xml.etree.ElementTree.Element`
+        :type elem2: :class:`lxml.etree.Element`
         :returns: bool varaible if two elements are mergeable
         :rtype: :obj:`bool`
         """
@@ -209,9 +287,9 @@ class Merger(object):
         """ checks if two elements are mergeable
 
         :param elem1: first element
-        :type elem1: :obj:`xml.etree.ElementTree.Element`
+        :type elem1: :class:`lxml.etree.Element`
         :param elem2: second element
-        :type elem2: :obj:`xml.etree.ElementTree.Element`
+        :type elem2: :class:`lxml.etree.Element`
         :returns: tags with not mergeable attributes
         :rtype: :obj:`list` <:obj:`tuple` <:obj:`str`>>
         """
@@ -229,9 +307,9 @@ class Merger(object):
         """ merges two dom elements
 
         :param elem1: first element
-        :type elem1: :obj:`xml.etree.ElementTree.Element`
+        :type elem1: :class:`lxml.etree.Element`
         :param elem2: second element
-        :type elem2: :obj:`xml.etree.ElementTree.Element`
+        :type elem2: :class:`lxml.etree.Element`
         """
         attr2 = elem2.attrib
         texts = []
@@ -271,116 +349,264 @@ class Merger(object):
 
         parent.remove(elem2)
 
-    def __mergeChildren(self, node, ancestors, entrynode=None):
-        """ merge the given node
+    def __mergeCandidates(self, children):
+        """ groups siblings which can be merged
+
+        :brief: Siblings with different tags or different non-empty names
+                are not mergeable so they are grouped by tag and name.
+                Tags of single elements or with unnamed siblings are grouped
+                only by tag to keep all their compatibility checks
+        :param children: sibling elements
+        :type children: :obj:`list` <:class:`lxml.etree.Element`>
+        :returns: list of siblings with their candidate groups and positions
+                  in the groups
+        :rtype: :obj:`list` <(:class:`lxml.etree.Element`, \
+                :obj:`list` <:class:`lxml.etree.Element`>, \
+                :obj:`int`)>
+        """
+        bytag = set(self.singles)
+        for child in children:
+            if not child.get("name"):
+                bytag.add(child.tag)
+        buckets = {}
+        candidates = []
+        for child in children:
+            key = (child.tag, None) if child.tag in bytag \
+                else (child.tag, child.get("name"))
+            bucket = buckets.setdefault(key, [])
+            candidates.append((child, bucket, len(bucket)))
+            bucket.append(child)
+        return candidates
+
+    def __mergeSiblings(self, node, ancestors, full=True):
+        """ merges mergeable children of the given node
 
         :param node: the given node
-        :type node: :obj:`xml.etree.ElementTree.Element`
+        :type node: :class:`lxml.etree.Element`
+        :param ancestors: ancestors of the given node
+        :type ancestors: :obj:`tuple` <(:obj:`str`, :obj:`str`, :obj:`str`)>
+        :param full: if false merged children are marked as added
+        :type full: :obj:`bool`
+        :returns: children merged with the children added after
+                  the last merge
+        :rtype: :obj:`set` <:class:`lxml.etree.Element`>
+        """
+        children = list(node)
+        removed = set()
+        touched = set()
+        for child1, bucket, place in self.__mergeCandidates(children):
+            if child1 in removed:
+                continue
+            for child2 in bucket[place + 1:]:
+                if child2 not in removed and self.__areMergeable(
+                        child1, child2, ancestors):
+                    if not full:
+                        self.__fresh.update(child2)
+                        touched.add(child1)
+                    self.__mergeNodes(child1, child2, node)
+                    removed.add(child2)
+        return touched
+
+    def __checkChild(self, node, child, ancestors):
+        """ checks if the child is allowed in the given node
+
+        :param node: the given node
+        :type node: :class:`lxml.etree.Element`
+        :param child: child of the given node
+        :type child: :class:`lxml.etree.Element`
+        :param ancestors: ancestors of the child
+        :type ancestors: :obj:`tuple` <(:obj:`str`, :obj:`str`, :obj:`str`)>
+        """
+        nName = unicode(node.tag)
+        cName = unicode(child.tag)
+        if nName and nName in self.children.keys():
+            if cName and cName not in self.children[nName]:
+                raise IncompatibleNodeError(
+                    "Not allowed <%s> child of \n < %s > \n"
+                    "  parent"
+                    % (cName,
+                       self.__getAncestors(child, ancestors)),
+                    [child])
+
+    @classmethod
+    def __childAncestors(cls, node, ancestors):
+        """ provides ancestors of children of the given node
+
+        :param node: the given node
+        :type node: :class:`lxml.etree.Element`
+        :param ancestors: ancestors of the given node
+        :type ancestors: :obj:`tuple` <(:obj:`str`, :obj:`str`, :obj:`str`)>
+        :returns: ancestors of the children
+        :rtype: :obj:`tuple` <(:obj:`str`, :obj:`str`, :obj:`str`)>
         """
         if node is not None and node.tag != "definition":
-            newancestors = tuple(
-                list(ancestors) +
-                [(node.tag, node.get("name"), node.get("type"))])
-            if entrynode is None:
-                entrynode = node
-        else:
-            newancestors = ancestors
-        if node is not None:
+            return ancestors + (
+                (node.tag, node.get("name"), node.get("type")),)
+        return ancestors
 
-            children = list(node)
-            c1 = 0
-            while c1 < len(children):
-                child1 = children[c1]
-                c2 = c1 + 1
-                while c2 < len(children):
-                    child2 = children[c2]
-                    if child1 != child2:
-                        if self.__areMergeable(
-                                child1, child2,
-                                ancestors):
-                            self.__mergeNodes(child1, child2, node)
-                            children.pop(c2)
-                            c2 -= 1
-                    c2 += 1
-                c1 += 1
-
-            nName = unicode(node.tag)
+    def __mergeChildren(self, node, ancestors, full=True):
+        """ merge the given node
 
+        :param node: the given node
+        :type node: :class:`lxml.etree.Element`
+        :param ancestors: ancestors of the given node
+        :type ancestors: :obj:`tuple` <(:obj:`str`, :obj:`str`, :obj:`str`)>
+        :param full: if false only children added after the last merge
+                     and children merged with them are merged
+        :type full: :obj:`bool`
+        """
+        newancestors = self.__childAncestors(node, ancestors)
+        if node is not None:
+            touched = self.__mergeSiblings(node, ancestors, full)
             for child in node:
-                cName = unicode(child.tag)
-                if nName and nName in self.children.keys():
-                    if cName and cName not in self.children[nName]:
-                        raise IncompatibleNodeError(
-                            "Not allowed <%s> child of \n < %s > \n  parent"
-                            % (cName,
-                               self.__getAncestors(child, newancestors)),
-                            [child])
-
-                self.__mergeChildren(child, newancestors, entrynode)
-                if cName in self.switchable and self.switchdatasources:
-                    self.__switch(child)
-                if cName in self.linkable and self.linkdatasources:
-                    self.__addlink(child, newancestors, entrynode)
-                if cName in self.switchable and self.canfaildatasources:
-                    self.__canfail(child)
-
-            children = list(node)
-            c1 = 0
-            while c1 < len(children):
-                child = children[c1]
-                if child.tag == "group":
-                    cchildren = list(child)
-                    elems = [cchildren[i]
-                             for i in range(len(cchildren))]
-                    if not elems and \
-                       child.get("type") in self.tocut and \
-                       (len(child.attrib.keys()) == 1 or
-                        (len(child.attrib.keys()) == 2 and
-                         "NX" + child.get("name") ==
-                         child.get("type"))):
-                        node.remove(child)
-                c1 += 1
-
-    def __getTextDataSource(self, node, dslist=None):
+                if full or child in self.__fresh:
+                    self.__checkChild(node, child, newancestors)
+                    self.__mergeChildren(child, newancestors)
+                elif child in touched:
+                    self.__mergeChildren(child, newancestors, False)
+
+    def _mergeSubtree(self, node, ancestors):
+        """ merges the subtree sent to a worker process
+
+        :param node: root of the subtree
+        :type node: :class:`lxml.etree.Element`
+        :param ancestors: ancestors of the root
+        :type ancestors: :obj:`tuple` <(:obj:`str`, :obj:`str`, :obj:`str`)>
+        """
+        self.__mergeChildren(node, ancestors)
+
+    def __splitChildren(self, node, ancestors, tasks):
+        """ merges children of the given node and splits their subtrees
+            into independent merging tasks
+
+        :brief: Subtrees above the task size are split further. Subtrees
+                within namespace declarations are merged in place
+        :param node: the given node
+        :type node: :class:`lxml.etree.Element`
+        :param ancestors: ancestors of the given node
+        :type ancestors: :obj:`tuple` <(:obj:`str`, :obj:`str`, :obj:`str`)>
+        :param tasks: list of subtrees with their ancestors and sizes
+                      to be merged in worker processes
+        :type tasks: :obj:`list` <(:class:`lxml.etree.Element`, \
+                     :obj:`tuple` <(:obj:`str`, :obj:`str`, :obj:`str`)>, \
+                     :obj:`int`)>
+        """
+        newancestors = self.__childAncestors(node, ancestors)
+        self.__mergeSiblings(node, ancestors)
+        for child in node:
+            self.__checkChild(node, child, newancestors)
+            if child.nsmap:
+                self.__mergeChildren(child, newancestors)
+                continue
+            size = int(child.xpath("count(descendant-or-self::*)"))
+            if size > self.tasksize:
+                self.__splitChildren(child, newancestors, tasks)
+            else:
+                tasks.append((child, newancestors, size))
+
+    def __mergeParallel(self, executor):
+        """ merges the tree with independent subtrees merged
+            in worker processes
+
+        :brief: The subtrees are merged in the same order as
+                in the serial merge so the first error is raised.
+                Subtrees which cannot be merged by workers are merged
+                again in place in order to raise their errors
+        :param executor: process pool executor
+        :type executor: :class:`concurrent.futures.Executor`
+        """
+        tasks = []
+        error = None
+        try:
+            self.__splitChildren(self.__root, (), tasks)
+        except Exception as e:
+            error = e
+        batches = []
+        size = 0
+        for child, ancestors, csize in tasks:
+            if not batches or size >= self.tasksize:
+                batches.append([])
+                size = 0
+            batches[-1].append((child, ancestors))
+            size += csize
+        settings = (self.singles, self.children, self.uniqueText)
+        futures = [
+            executor.submit(
+                _mergeSubtrees, settings,
+                [(etree.tostring(child, with_tail=False), ancestors)
+                 for child, ancestors in batch])
+            for batch in batches]
+        for batch, future in zip(batches, futures):
+            try:
+                results = future.result()
+            except Exception:
+                results = [None] * len(batch)
+            for (child, ancestors), xml in zip(batch, results):
+                if xml is None:
+                    self.__mergeChildren(child, ancestors)
+                else:
+                    merged = _fromstring(xml)
+                    merged.tail = child.tail
+                    child.getparent().replace(child, merged)
+        if error is not None:
+            raise error
+
+    def __finalizeNode(self, node):
+        """ switches strategies and adds links of the given node
+
+        :param node: the given node
+        :type node: :class:`lxml.etree.Element`
+        """
+        cName = unicode(node.tag)
+        if cName in self.switchable and self.__switchset:
+            self.__switch(node)
+        if cName in self.linkable and self.__linkset:
+            ancestors = []
+            entrynode = None
+            for anc in node.iterancestors():
+                if anc.tag != "definition":
+                    ancestors.append(
+                        (anc.tag, anc.get("name"), anc.get("type")))
+                    entrynode = anc
+            self.__addlink(node, tuple(reversed(ancestors)), entrynode)
+        if cName in self.switchable and self.__canfailset:
+            self.__canfail(node)
+
+    def __cutGroups(self):
+        """ removes empty groups with types to cut
+        """
+        # descendants are checked before their parents
+        for child in reversed(list(self.__root.iter("group"))):
+            if not len(child) and \
+               child.get("type") in self.tocut and \
+               (len(child.attrib.keys()) == 1 or
+                (len(child.attrib.keys()) == 2 and
+                 "NX" + child.get("name") ==
+                 child.get("type"))):
+                child.getparent().remove(child)
+
+    def __getTextDataSource(self, node, dsset):
         """ find first datasources node and name in text nodes of the node
 
         :param node: the parent node
-        :type node: :obj:`xml.etree.ElementTree.Element`
-        :param dslist: list of datasources
-        :type dslist: :obj:`list` <:obj:`str`>
+        :type node: :class:`lxml.etree.Element`
+        :param dsset: index of datasources
+        :type dsset: :obj:`frozenset` <:obj:`str`>
         :returns: (node, name) of the searched datasource
         :rtype: (:obj:`str` , :obj:`str`)
         """
-        dsname = None
-        dsnode = None
-        dslist = dslist or self.switchdatasources
-        text = unicode(self.__getText(node)).strip()
-        index = text.find(self.__dsvars)
-        while index >= 0:
-            try:
-                finder = re.finditer(
-                    r"[\w]+",
-                    text[(index + len(self.__dsvars)):])
-                if sys.version_info > (3,):
-                    subc = finder.__next__().group(0)
-                else:
-                    subc = finder.next().group(0)
-            except Exception:
-                subc = ''
-            name = subc.strip() if subc else ""
-            if name in dslist:
-                dsnode = node
-                dsname = name
-                break
-            text = text[(index + len(name) + len(self.__dsvars) + 2):]
-            index = text.find(self.__dsvars)
-        return dsname, dsnode
+        text = self.__getText(node)
+        if self.__dsvars in text:
+            for match in self.__dsfinder.finditer(text):
+                if match.group(1) in dsset:
+                    return match.group(1), node
+        return None, None
 
     def __switch(self, node):
         """ switch the given node to step mode
 
         :param node: the given node
-        :type node: :obj:`xml.etree.ElementTree.Element`
+        :type node: :class:`lxml.etree.Element`
         """
         if node is not None:
             stnode = None
@@ -388,22 +614,24 @@ class Merger(object):
             dsname = None
             dsnode = None
 
-            dsname, dsnode = self.__getTextDataSource(node)
+            dsname, dsnode = self.__getTextDataSource(
+                node, self.__switchset)
 
             for child in node:
                 cName = unicode(child.tag)
                 if cName == 'datasource':
                     dsname = child.get("name")
-                    if dsname in self.switchdatasources:
+                    if dsname in self.__switchset:
                         dsnode = child
                     else:
-                        dsname, dsnode = self.__getTextDataSource(child)
+                        dsname, dsnode = self.__getTextDataSource(
+                            child, self.__switchset)
                     if dsnode is None:
                         for gchild in child:
                             gcName = unicode(gchild.tag)
                             if gcName == 'datasource':
                                 gdsname = gchild.get("name")
-                                if gdsname in self.switchdatasources:
+                                if gdsname in self.__switchset:
                                     dsnode = child
                 elif cName == 'strategy':
                     mode = child.get("mode")
@@ -420,7 +648,7 @@ class Merger(object):
         """ switch the given node to canfail mode
 
         :param node: the given node
-        :type node: :obj:`xml.etree.ElementTree.Element`
+        :type node: :class:`lxml.etree.Element`
         """
         if node is not None:
             stnode = None
@@ -428,23 +656,23 @@ class Merger(object):
             dsnode = None
 
             dsname, dsnode = self.__getTextDataSource(
-                node, self.canfaildatasources)
+                node, self.__canfailset)
 
             for child in node:
                 cName = unicode(child.tag)
                 if cName == 'datasource':
                     dsname = child.get("name")
-                    if dsname in self.canfaildatasources:
+                    if dsname in self.__canfailset:
                         dsnode = child
                     else:
                         dsname, dsnode = self.__getTextDataSource(
-                            child, self.canfaildatasources)
+                            child, self.__canfailset)
                     if dsnode is None:
                         for gchild in child:
                             gcName = unicode(gchild.tag)
                             if gcName == 'datasource':
                                 gdsname = gchild.get("name")
-                                if gdsname in self.canfaildatasources:
+                                if gdsname in self.__canfailset:
                                     dsnode = child
                 elif cName == 'strategy':
                     stnode = child
@@ -457,23 +685,23 @@ class Merger(object):
         """ add link in NXdata group
 
         :param node: the given node
-        :type node: :obj:`xml.etree.ElementTree.Element`
+        :type node: :class:`lxml.etree.Element`
         """
         if node is not None:
             dsname = None
             dsnode = None
 
             dsname, dsnode = self.__getTextDataSource(
-                node, self.linkdatasources)
+                node, self.__linkset)
             for child in node:
                 cName = unicode(child.tag)
                 if cName == 'datasource':
                     dsname = child.get("name")
-                    if dsname in self.linkdatasources:
+                    if dsname in self.__linkset:
                         dsnode = child
                     else:
                         dsname, dsnode = self.__getTextDataSource(
-                            child, self.linkdatasources)
+                            child, self.__linkset)
                 if dsnode is not None:
                     break
             if dsnode is not None:
@@ -481,39 +709,53 @@ class Merger(object):
                 path = [(node.get("name"), dsname)]
                 for anc in reversed(ancestors):
                     path.append((anc[1], anc[2]))
-                linkfound = False
-                datanode = None
                 if entrynode is not None:
-                    for gchild in entrynode:
-                        if gchild.get("name") == 'data' \
-                           and gchild.get("type") == 'NXdata':
-                            datanode = gchild
-                            for dchild in datanode:
-                                if dchild.get("name") == dsname:
-                                    linkfound = True
-                                    break
-                    if not linkfound:
-                        self.__createLink(entrynode, datanode, path)
-
-    def __createLink(self, entry, data, path):
+                    index = self.__linkIndex(entrynode)
+                    if dsname not in index[1]:
+                        self.__createLink(entrynode, index, path)
+
+    def __linkIndex(self, entry):
+        """ provides NXdata group of the entry node with its children names
+
+        :param entry: entry node
+        :type entry: :class:`lxml.etree.Element`
+        :returns: the last NXdata group and names of children
+                  of all NXdata groups
+        :rtype: [:class:`lxml.etree.Element`, :obj:`set` <:obj:`str`>]
+        """
+        index = self.__links.get(entry)
+        if index is None:
+            data = None
+            names = set()
+            for gchild in entry:
+                if gchild.get("name") == 'data' \
+                   and gchild.get("type") == 'NXdata':
+                    data = gchild
+                    names.update(dchild.get("name") for dchild in data)
+            index = self.__links[entry] = [data, names]
+        return index
+
+    def __createLink(self, entry, index, path):
         """ create link on given node
 
-        :param root: root node
-        :type root: :class:`xml.etree.ElementTree.Element`
-        :param node: the given node
-        :type node: :obj:`xml.etree.ElementTree.Element`
+        :param entry: entry node
+        :type entry: :class:`lxml.etree.Element`
+        :param index: NXdata group of the entry node with its children names
+        :type index: [:class:`lxml.etree.Element`, :obj:`set` <:obj:`str`>]
         :param path: list with NeXus path (name, type)
-        :type node: :obj:`list` < (:obj:`str`,:obj:`str`) >
+        :type path: :obj:`list` < (:obj:`str`,:obj:`str`) >
         """
 
         if path:
             target, dsname = path[0]
             if target:
+                data = index[0]
                 if data is None:
                     data = etree.Element("group")
                     entry.append(data)
                     data.attrib["type"] = "NXdata"
                     data.attrib["name"] = "data"
+                    index[0] = data
                 for gname, gtype in path[1:]:
                     target = "%s:%s/" % (gname, gtype) + target
                 target = "/" + target
@@ -522,26 +764,47 @@ class Merger(object):
                     data.append(link)
                     link.attrib["target"] = "%s" % target
                     link.attrib["name"] = dsname
+                    index[1].add(dsname)
 
-    def collect(self, components):
+    def collect(self, components, merged=False):
         """ collects the given components in one DOM tree
 
-        :param components: given components
-        :type components: :obj:`list` <:obj:`str`>
+        :param components: given components as xml strings
+                           or parsed trees which are reused
+        :type components: :obj:`list` <:obj:`str` or \
+                          :class:`lxml.etree.Element`>
+        :param merged: if the collected tree is already merged
+                       so only components added later are merged
+        :type merged: :obj:`bool`
         """
         self.__root = None
-        rootDef = None
+        self.add(components)
+        if merged:
+            self.__fresh = set()
+
+    def add(self, components):
+        """ collects further components into the DOM tree
+
+        :brief: The tree merged without finalizing can be merged again
+        :param components: given components as xml strings
+                           or parsed trees which are reused
+        :type components: :obj:`list` <:obj:`str` or \
+                          :class:`lxml.etree.Element`>
+        """
+        rootDef = self.__root
         for cp in components:
             dcp = None
-            if cp:
-                if sys.version_info > (3,):
-                    cp = bytes(cp, "UTF-8")
-                dcp = et.fromstring(cp, parser=XMLParser(collect_ids=False))
+            if isinstance(cp, basestring):
+                if cp:
+                    dcp = _fromstring(cp)
+            else:
+                dcp = cp
             if dcp is None:
                 continue
 
             if self.__root is None:
                 self.__root = dcp
+                self.__fresh = None
                 if dcp.tag != "definition":
                     raise UndefinedTagError("<definition> not defined")
                 rootDef = dcp
@@ -550,11 +813,24 @@ class Merger(object):
                     raise UndefinedTagError("<definition> not defined")
                 for cd in dcp:
                     rootDef.append(cd)
+                    if self.__fresh is not None:
+                        self.__fresh.add(cd)
                 txt = self.__getText(dcp)
                 if txt and unicode(txt).strip():
                     if rootDef.text != txt:
                         rootDef.text += "\n" + txt
 
+    def __getRoot(self):
+        """ get method for root attribute
+
+        :returns: DOM root node
+        :rtype: :class:`lxml.etree.Element`
+        """
+        return self.__root
+
+    #: (:class:`lxml.etree.Element`) DOM root node
+    root = property(__getRoot, doc='DOM root node')
+
     def toString(self):
         """ Converts DOM tree to string
 
@@ -562,13 +838,43 @@ class Merger(object):
         :rtype: :obj:`str`
         """
         if self.__root is not None:
-            return _tostr(
-                et.tostring(self.__root, encoding='utf8', method='xml'))
+            return _tostr(etree.tostring(
+                self.__root, encoding='utf8', method='xml',
+                xml_declaration=True))
 
-    def merge(self):
+    def merge(self, finalize=True):
         """ performs the merging operation
+
+        :brief: With the executor set the whole tree is merged
+                with its independent subtrees merged in worker processes
+        :param finalize: if true the tree is finalized, otherwise
+                         further components can be added and merged
+        :type finalize: :obj:`bool`
+        """
+        if self.executor is not None and self.__fresh is None \
+           and self.__root is not None:
+            self.__mergeParallel(self.executor)
+        else:
+            self.__mergeChildren(self.__root, (), self.__fresh is None)
+        self.__fresh = set()
+        if finalize:
+            self.finalize()
+
+    def finalize(self):
+        """ switches strategies of step and canfail datasources,
+            adds links of link datasources and cuts empty groups
         """
-        self.__mergeChildren(self.__root, ())
+        self.__switchset = frozenset(self.switchdatasources or [])
+        self.__linkset = frozenset(self.linkdatasources or [])
+        self.__canfailset = frozenset(self.canfaildatasources or [])
+        self.__links = {}
+        if self.__root is not None:
+            tags = set(self.switchable) | set(self.linkable)
+            for node in list(self.__root.iter(*tags)):
+                if node is not self.__root:
+                    self.__finalizeNode(node)
+            self.__cutGroups()
+        self.__links = {}
 
 
 if __name__ == "__main__":
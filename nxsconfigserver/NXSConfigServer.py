@@ -32,9 +32,14 @@
 
 """ Configuration Server for Nexus Data Writer """
 
+import json
+import weakref
 import PyTango
 
 from .XMLConfigurator import XMLConfigurator as XMLC
+from .JobPool import JobPool
+from .ReadWriteLock import ReadWriteLock
+from .StreamSet import StreamSet
 
 
 # ==================================================================
@@ -46,12 +51,28 @@ class NXSConfigServer(PyTango.Device_4Impl):
     """   NXSConfigServer Class Description:
 
     :brief: Configuration Server based on MySQL database.
+            The commands reading the configuration are executed
+            in parallel while the commands and attributes changing
+            the database or the server settings exclusively.
             Device States Description:
             DevState.OPEN -     Open connection to the database,
             DevState.ON -       Server is ON,
-            DevState.RUNNING -  Performing a query,
     """
 
+    #: (:obj:`dict` <:obj:`str`, :obj:`str`>) configurator methods
+    #:    of the commands which can be submitted as jobs
+    jobCommands = {
+        'CreateConfiguration': 'createConfiguration',
+        'Merge': 'merge',
+        'Components': 'components',
+        'InstantiatedComponents': 'instantiatedComponents',
+        'DataSources': 'dataSources',
+        'ComponentsDataSources': 'componentsDataSources',
+        'ComponentsVariables': 'componentsVariables',
+        'DependentComponents': 'dependentComponents',
+        'DependencyGraph': 'dependencyGraph',
+    }
+
     def __init__(self, cl, name):
         """ Device constructor
 
@@ -65,6 +86,12 @@ class NXSConfigServer(PyTango.Device_4Impl):
         #: (:class:`nxsconfigserver.XMLConfigutator.XMLConfigutator`) \
         #:    xml configurator instance
         self.xmlc = None
+        #: (:class:`nxsconfigserver.JobPool.JobPool`) \
+        #:    pool of workers executing submitted jobs
+        self.jobs = None
+        #: (:class:`nxsconfigserver.ReadWriteLock.ReadWriteLock`) \
+        #:    lock shared by reading commands and exclusive for writing ones
+        self.lock = ReadWriteLock()
         NXSConfigServer.init_device(self)
 
     def delete_device(self):
@@ -72,10 +99,14 @@ class NXSConfigServer(PyTango.Device_4Impl):
         """
         self.debug_stream("In delete_device()")
         if hasattr(self, "xmlc") and self.xmlc:
-            if hasattr(self.xmlc, "close"):
-                self.xmlc.close()
-            del self.xmlc
-            self.xmlc = None
+            with self.lock.writing():
+                if hasattr(self.xmlc, "close"):
+                    self.xmlc.close()
+                del self.xmlc
+                self.xmlc = None
+        if hasattr(self, "jobs") and self.jobs:
+            self.jobs.close(False)
+            self.jobs = None
         self.set_state(PyTango.DevState.OFF)
 
     def init_device(self):
@@ -86,6 +117,10 @@ class NXSConfigServer(PyTango.Device_4Impl):
         self.set_state(PyTango.DevState.ON)
         self.get_device_properties(self.get_device_class())
         self.xmlc.versionLabel = self.VersionLabel
+        self.jobs = JobPool(
+            self.JobWorkers, self.MaxJobResults,
+            streams=StreamSet(weakref.ref(self)))
+        self.jobs.open()
 
     def always_executed_hook(self):
         """ Always excuted hook method
@@ -118,7 +153,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :type attr: :class:`PyTango.Attribute`
         """
         self.debug_stream("In write_XMLString()")
-        self.xmlc.xmlstring = attr.get_write_value()
+        with self.lock.writing():
+            self.xmlc.xmlstring = attr.get_write_value()
 
     def is_XMLString_allowed(self, _):
         """ XMLString attribute State Machine
@@ -126,8 +162,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -147,7 +182,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :type attr: :class:`PyTango.Attribute`
         """
         self.debug_stream("In write_Selection()")
-        self.xmlc.selection = attr.get_write_value()
+        with self.lock.writing():
+            self.xmlc.selection = attr.get_write_value()
 
     def is_Selection_allowed(self, _):
         """ Selection attribute State Machine
@@ -155,8 +191,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -176,12 +211,14 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :type attr: :class:`PyTango.Attribute`
         """
         self.debug_stream("In write_JSONSettings()")
-        if self.is_JSONSettings_write_allowed():
-            self.xmlc.jsonsettings = attr.get_write_value()
-        else:
-            self.warn_stream("To change the settings please close the server.")
-            raise Exception(
-                "To change the settings please close the server.")
+        with self.lock.writing():
+            if self.is_JSONSettings_write_allowed():
+                self.xmlc.jsonsettings = attr.get_write_value()
+            else:
+                self.warn_stream(
+                    "To change the settings please close the server.")
+                raise Exception(
+                    "To change the settings please close the server.")
 
     def is_JSONSettings_write_allowed(self):
         """ JSONSettings attribute Write State Machine
@@ -189,8 +226,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.OPEN,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.OPEN]:
             return False
         return True
 
@@ -210,22 +246,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :type attr: :class:`PyTango.Attribute`
         """
         self.debug_stream("In write_STEPDataSources()")
-        if self.is_STEPDataSources_write_allowed():
+        with self.lock.writing():
             self.xmlc.stepdatasources = attr.get_write_value() or ""
-        else:
-            self.warn_stream("To change the settings please close the server.")
-            raise Exception(
-                "To change the settings please close the server.")
-
-    def is_STEPDataSources_write_allowed(self):
-        """ STEPDataSources attribute Write State Machine
-
-        :returns: True if the operation allowed
-        :rtype: :obj:`bool`
-        """
-        if self.get_state() in [PyTango.DevState.RUNNING]:
-            return False
-        return True
 
     def read_LinkDataSources(self, attr):
         """ Read LinkDataSources attribute
@@ -243,22 +265,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :type attr: :class:`PyTango.Attribute`
         """
         self.debug_stream("In write_LinkDataSources()")
-        if self.is_LinkDataSources_write_allowed():
+        with self.lock.writing():
             self.xmlc.linkdatasources = attr.get_write_value() or ""
-        else:
-            self.warn_stream("To change the settings please close the server.")
-            raise Exception(
-                "To change the settings please close the server.")
-
-    def is_LinkDataSources_write_allowed(self):
-        """ LinkDataSources attribute Write State Machine
-
-        :returns: True if the operation allowed
-        :rtype: :obj:`bool`
-        """
-        if self.get_state() in [PyTango.DevState.RUNNING]:
-            return False
-        return True
 
     def read_CanFailDataSources(self, attr):
         """ Read CanFailDataSources attribute
@@ -276,22 +284,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :type attr: :class:`PyTango.Attribute`
         """
         self.debug_stream("In write_CanFailDataSources()")
-        if self.is_CanFailDataSources_write_allowed():
+        with self.lock.writing():
             self.xmlc.canfaildatasources = attr.get_write_value() or ""
-        else:
-            self.warn_stream("To change the settings please close the server.")
-            raise Exception(
-                "To change the settings please close the server.")
-
-    def is_CanFailDataSources_write_allowed(self):
-        """ CanFailDataSources attribute Write State Machine
-
-        :returns: True if the operation allowed
-        :rtype: :obj:`bool`
-        """
-        if self.get_state() in [PyTango.DevState.RUNNING]:
-            return False
-        return True
 
     def read_Version(self, attr):
         """ Read Version attribute
@@ -305,6 +299,15 @@ class NXSConfigServer(PyTango.Device_4Impl):
         self.xmlc.versionLabel = self.VersionLabel
         attr.set_value(self.xmlc.version)
 
+    def read_CacheStatistics(self, attr):
+        """ Read CacheStatistics attribute
+
+        :param attr: cache statistics attribute
+        :type attr: :class:`PyTango.Attribute`
+        """
+        self.debug_stream("In read_CacheStatistics()")
+        attr.set_value(json.dumps(self.xmlc.cacheStatistics()))
+
     def read_Variables(self, attr):
         """ Read Variables attribute
 
@@ -321,17 +324,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :type attr: :class:`PyTango.Attribute`
         """
         self.debug_stream("In write_Variables()")
-        self.xmlc.variables = attr.get_write_value()
-
-    def is_Variables_allowed(self, _):
-        """ Variables attribute State Machine
-
-        :returns: True if the operation allowed
-        :rtype: :obj:`bool`
-        """
-        if self.get_state() in [PyTango.DevState.RUNNING]:
-            return False
-        return True
+        with self.lock.writing():
+            self.xmlc.variables = attr.get_write_value()
 
     # ==================================================================
     #
@@ -345,23 +339,9 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :brief: Opens connection to the database
         """
         self.debug_stream("In Open()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.writing():
             self.xmlc.open()
             self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.ON)
-
-    def is_Open_allowed(self):
-        """ Open command State Machine
-
-        :returns: True if the operation allowed
-        :rtype: :obj:`bool`
-        """
-        if self.get_state() in [PyTango.DevState.RUNNING]:
-            return False
-        return True
 
     def Close(self):
         """ Close command
@@ -369,14 +349,9 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :brief: Closes connection into the database
         """
         self.debug_stream("In Close()")
-
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.writing():
             self.xmlc.close()
             self.set_state(PyTango.DevState.ON)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.ON)
 
     def is_Close_allowed(self):
         """ Close command State Machine
@@ -384,8 +359,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -400,13 +374,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :rtype: :obj:`list` <:obj:`str`>
         """
         self.debug_stream("In Components()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.reading():
             argout = self.xmlc.components(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
         return argout
 
@@ -416,8 +385,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -432,13 +400,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :rtype: :obj:`list` <:obj:`str`>
         """
         self.debug_stream("In Selections()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.reading():
             argout = self.xmlc.selections(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
         return argout
 
@@ -448,8 +411,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -464,13 +426,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :rtype: :obj:`list` <:obj:`str`>
         """
         self.debug_stream("In InstantiateComponents()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.reading():
             argout = self.xmlc.instantiatedComponents(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
         return argout
 
@@ -480,8 +437,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -496,13 +452,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :rtype: :obj:`list` <:obj:`str`>
         """
         self.debug_stream("In DataSources()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.reading():
             argout = self.xmlc.dataSources(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
         return argout
 
@@ -512,8 +463,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -526,13 +476,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :rtype: :obj:`list` <:obj:`str`>
         """
         self.debug_stream("In AvailableComponents()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.reading():
             argout = self.xmlc.availableComponents()
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
         return argout
 
@@ -542,8 +487,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -556,13 +500,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :rtype: :obj:`list` <:obj:`str`>
         """
         self.debug_stream("In AvailableSelections()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.reading():
             argout = self.xmlc.availableSelections()
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
         return argout
 
@@ -572,8 +511,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -586,13 +524,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :rtype: :obj:`list` <:obj:`str`>
         """
         self.debug_stream("In AvailableDataSources()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.reading():
             argout = self.xmlc.availableDataSources()
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
         return argout
 
@@ -602,8 +535,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -616,13 +548,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :type argin: :obj:`str`
         """
         self.debug_stream("In StoreComponent()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.writing():
             self.xmlc.storeComponent(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
     def is_StoreComponent_allowed(self):
         """ StoreComponent command State Machine
@@ -630,8 +557,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -644,13 +570,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :type argin: :obj:`str`
         """
         self.debug_stream("In StoreSelection()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.writing():
             self.xmlc.storeSelection(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
     def is_StoreSelection_allowed(self):
         """ StoreSelection command State Machine
@@ -658,8 +579,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -672,13 +592,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :type argin: :obj:`str`
         """
         self.debug_stream("In StoreDataSource()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.writing():
             self.xmlc.storeDataSource(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
     def is_StoreDataSource_allowed(self):
         """ StoreDataSource command State Machine
@@ -686,8 +601,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -701,13 +615,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :type argin: :obj:`list` <:obj:`str`>
         """
         self.debug_stream("In CreateConfiguration()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.writing():
             self.xmlc.createConfiguration(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
     def is_CreateConfiguration_allowed(self):
         """ CreateConfiguration command State Machine
@@ -715,8 +624,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -729,13 +637,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :type argin: :obj:`str`
         """
         self.debug_stream("In DeleteComponent()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.writing():
             self.xmlc.deleteComponent(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
     def is_DeleteComponent_allowed(self):
         """ DeleteComponent command State Machine
@@ -743,8 +646,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -757,13 +659,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :type argin: :obj:`str`
         """
         self.debug_stream("In DeleteSelection()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.writing():
             self.xmlc.deleteSelection(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
     def is_DeleteSelection_allowed(self):
         """ DeleteSelection command State Machine
@@ -771,8 +668,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -786,13 +682,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         """
         self.debug_stream("In DeleteDataSource()")
         #    Add your own code here
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.writing():
             self.xmlc.deleteDataSource(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
     def is_DeleteDataSource_allowed(self):
         """ DeleteDataSource command State Machine
@@ -800,8 +691,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -814,13 +704,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :type argin: :obj:`str`
         """
         self.debug_stream("In SetComponentDataSources()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.writing():
             self.xmlc.setComponentDataSources(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
     def is_SetComponentDataSources_allowed(self):
         """ SetComponentDataSources command State Machine
@@ -828,8 +713,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -842,13 +726,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :type argin: :obj:`list` <:obj:`str`>
         """
         self.debug_stream("In SetMandatoryComponents()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.writing():
             self.xmlc.setMandatoryComponents(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
     def is_SetMandatoryComponents_allowed(self):
         """ SetMandatoryComponents command State Machine
@@ -856,8 +735,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -870,14 +748,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :rtype: :obj:`list` <:obj:`str`>
         """
         self.debug_stream("In MandatoryComponents()")
-
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.reading():
             argout = self.xmlc.mandatoryComponents()
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
         return argout
 
     def is_MandatoryComponents_allowed(self):
@@ -886,8 +758,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -901,13 +772,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :type argin: :obj:`list` <:obj:`str`>
         """
         self.debug_stream("In UnsetMandatoryComponents()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.writing():
             self.xmlc.unsetMandatoryComponents(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
     def is_UnsetMandatoryComponents_allowed(self):
         """ UnsetMandatoryComponents command State Machine
@@ -915,8 +781,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -931,13 +796,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :rtype: :obj:`list` <:obj:`str`>
         """
         self.debug_stream("In ComponentDataSources()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.reading():
             argout = self.xmlc.componentDataSources(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
         return argout
 
@@ -947,8 +807,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -963,13 +822,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :rtype: :obj:`list` <:obj:`str`>
         """
         self.debug_stream("In ComponentsDataSources()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.reading():
             argout = self.xmlc.componentsDataSources(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
         return argout
 
@@ -979,8 +833,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -995,13 +848,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :rtype: :obj:`list` <:obj:`str`>
         """
         self.debug_stream("In ComponentsVariables()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.reading():
             argout = self.xmlc.componentsVariables(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
         return argout
 
@@ -1011,8 +859,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -1027,13 +874,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :rtype: :obj:`list` <:obj:`str`>
         """
         self.debug_stream("In ComponentVariables()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.reading():
             argout = self.xmlc.componentVariables(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
         return argout
 
@@ -1043,8 +885,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -1059,13 +900,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :rtype: :obj:`str`
         """
         self.debug_stream("In Merge()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.reading():
             argout = self.xmlc.merge(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
         return argout
 
     def is_Merge_allowed(self):
@@ -1074,8 +910,7 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
@@ -1091,13 +926,8 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :rtype: :obj:`list` <:obj:`str`>
         """
         self.debug_stream("In DependentComponents()")
-        try:
-            self.set_state(PyTango.DevState.RUNNING)
+        with self.lock.reading():
             argout = self.xmlc.dependentComponents(argin)
-            self.set_state(PyTango.DevState.OPEN)
-        finally:
-            if self.get_state() == PyTango.DevState.RUNNING:
-                self.set_state(PyTango.DevState.OPEN)
 
         return argout
 
@@ -1107,11 +937,128 @@ class NXSConfigServer(PyTango.Device_4Impl):
         :returns: True if the operation allowed
         :rtype: :obj:`bool`
         """
-        if self.get_state() in [PyTango.DevState.ON,
-                                PyTango.DevState.RUNNING]:
+        if self.get_state() in [PyTango.DevState.ON]:
+            return False
+        return True
+
+    def DependencyGraph(self, argin):
+        """ DependencyGraph command
+
+        :brief: returns a JSON dictionary with references of
+            the given components and their dependencies
+            as well as with components using the referenced datasources
+
+        :param argin:  DevVarStringArray    component names,
+            all components if empty
+        :type argin: :obj:`list` <:obj:`str`>
+        :returns: DevString    JSON dependency graph
+        :rtype: :obj:`str`
+        """
+        self.debug_stream("In DependencyGraph()")
+        with self.lock.reading():
+            argout = self.xmlc.dependencyGraph(argin)
+
+        return argout
+
+    def is_DependencyGraph_allowed(self):
+        """ DependencyGraph command State Machine
+
+        :returns: True if the operation allowed
+        :rtype: :obj:`bool`
+        """
+        if self.get_state() in [PyTango.DevState.ON]:
+            return False
+        return True
+
+    def SubmitJob(self, argin):
+        """ SubmitJob command
+
+        :brief: Submits the command to be executed asynchronously
+            by a worker. The job state and result can be fetched
+            with the JobState and JobResult commands
+
+        :param argin:  DevVarStringArray    command name followed by
+            its component names
+        :type argin: :obj:`list` <:obj:`str`>
+        :returns: DevString    job id
+        :rtype: :obj:`str`
+        """
+        self.debug_stream("In SubmitJob()")
+        if not argin or argin[0] not in self.jobCommands:
+            raise Exception(
+                "Command %s cannot be submitted. Available commands: %s"
+                % (argin[0] if argin else "",
+                   ", ".join(sorted(self.jobCommands.keys()))))
+        return self.jobs.submit(self.__runJob, argin[0], list(argin[1:]))
+
+    def is_SubmitJob_allowed(self):
+        """ SubmitJob command State Machine
+
+        :returns: True if the operation allowed
+        :rtype: :obj:`bool`
+        """
+        if self.get_state() in [PyTango.DevState.ON]:
             return False
         return True
 
+    def __runJob(self, command, argin):
+        """ executes the submitted command
+
+        :brief: The jobs are executed in parallel with the reading
+            commands apart from CreateConfiguration which sets XMLString
+        :param command: command name
+        :type command: :obj:`str`
+        :param argin: list of component names
+        :type argin: :obj:`list` <:obj:`str`>
+        :returns: XML string or JSON list for list results
+        :rtype: :obj:`str`
+        """
+        lock = self.lock.writing if command == 'CreateConfiguration' \
+            else self.lock.reading
+        with lock():
+            if self.get_state() != PyTango.DevState.OPEN:
+                raise Exception(
+                    "Job %s cannot be executed in the %s state"
+                    % (command, self.get_state()))
+            argout = getattr(self.xmlc, self.jobCommands[command])(argin)
+            if argout is None:
+                argout = self.xmlc.xmlstring
+        if isinstance(argout, list):
+            argout = json.dumps(argout)
+        return argout
+
+    def JobState(self, argin):
+        """ JobState command
+
+        :brief: Returns the state of the submitted job, i.e.
+            QUEUED, RUNNING, DONE, FAILED or EVICTED if its result
+            was dropped above the MaxJobResults limit
+
+        :param argin:  DevString    job id
+        :type argin: :obj:`str`
+        :returns: DevString    job state
+        :rtype: :obj:`str`
+        """
+        self.debug_stream("In JobState()")
+        return self.jobs.state(argin)
+
+    def JobResult(self, argin):
+        """ JobResult command
+
+        :brief: Returns the result of the finished job and removes
+            the job. The resulting XML configuration of CreateConfiguration
+            and Merge is returned as it is while the lists of names
+            as JSON strings. Errors of failed jobs and of evicted ones
+            are raised.
+
+        :param argin:  DevString    job id
+        :type argin: :obj:`str`
+        :returns: DevString    job result
+        :rtype: :obj:`str`
+        """
+        self.debug_stream("In JobResult()")
+        return self.jobs.result(argin)
+
 
 class NXSConfigServerClass(PyTango.DeviceClass):
 
@@ -1132,6 +1079,15 @@ class NXSConfigServerClass(PyTango.DeviceClass):
         [PyTango.DevString,
          "version label",
          ["XCS"]],
+        'JobWorkers':
+        [PyTango.DevLong,
+         "number of workers executing submitted jobs",
+         [4]],
+        'MaxJobResults':
+        [PyTango.DevLong,
+         "maximal number of finished jobs kept until their results "
+         "are fetched, the oldest ones above it are evicted",
+         [100]],
     }
 
     #: (:obj:`dict` <:obj:`str`, \
@@ -1217,6 +1173,19 @@ class NXSConfigServerClass(PyTango.DeviceClass):
         'DependentComponents':
             [[PyTango.DevVarStringArray, "component names"],
              [PyTango.DevVarStringArray, "list of component names"]],
+        'DependencyGraph':
+            [[PyTango.DevVarStringArray, "component names"],
+             [PyTango.DevString, "JSON dependency graph"]],
+        'SubmitJob':
+            [[PyTango.DevVarStringArray,
+              "command name followed by component names"],
+             [PyTango.DevString, "job id"]],
+        'JobState':
+            [[PyTango.DevString, "job id"],
+             [PyTango.DevString, "job state"]],
+        'JobResult':
+            [[PyTango.DevString, "job id"],
+             [PyTango.DevString, "XML string or JSON list of names"]],
     }
 
     #: (:obj:`dict` <:obj:`str`, \
@@ -1269,6 +1238,17 @@ class NXSConfigServerClass(PyTango.DeviceClass):
              'label': "Configuration Version",
              'description': "Configuration version",
         }],
+        'CacheStatistics':
+        [[PyTango.DevString,
+          PyTango.SCALAR,
+          PyTango.READ],
+         {
+             'label': "Cache Statistics",
+             'description': "JSON dictionary with statistics of "
+             "configuration and xml caches as well as "
+             "of the DB connection pool",
+             'Display level': PyTango.DispLevel.EXPERT,
+        }],
         'Variables':
         [[PyTango.DevString,
           PyTango.SCALAR,
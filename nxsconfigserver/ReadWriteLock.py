@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+""" Reader/writer lock """
+
+import threading
+from contextlib import contextmanager
+
+
+class ReadWriteLock(object):
+
+    """ lock shared by readers and exclusive for writers
+
+    :brief: Waiting writers are preferred, i.e. new readers wait
+            until the waiting writers are done
+    """
+
+    def __init__(self):
+        """ constructor
+        """
+        #: (:obj:`int`) number of active readers
+        self.__readers = 0
+        #: (:obj:`bool`) if a writer is active
+        self.__writer = False
+        #: (:obj:`int`) number of waiting writers
+        self.__waiting = 0
+        #: (:class:`threading.Condition`) lock condition
+        self.__condition = threading.Condition()
+
+    def acquireRead(self):
+        """ acquires the shared lock
+        """
+        with self.__condition:
+            while self.__writer or self.__waiting:
+                self.__condition.wait()
+            self.__readers += 1
+
+    def releaseRead(self):
+        """ releases the shared lock
+        """
+        with self.__condition:
+            self.__readers -= 1
+            if not self.__readers:
+                self.__condition.notify_all()
+
+    def acquireWrite(self):
+        """ acquires the exclusive lock
+        """
+        with self.__condition:
+            self.__waiting += 1
+            try:
+                while self.__writer or self.__readers:
+                    self.__condition.wait()
+            except BaseException:
+                self.__waiting -= 1
+                self.__condition.notify_all()
+                raise
+            self.__waiting -= 1
+            self.__writer = True
+
+    def releaseWrite(self):
+        """ releases the exclusive lock
+        """
+        with self.__condition:
+            self.__writer = False
+            self.__condition.notify_all()
+
+    @contextmanager
+    def reading(self):
+        """ provides the shared lock for the with statement
+        """
+        self.acquireRead()
+        try:
+            yield
+        finally:
+            self.releaseRead()
+
+    @contextmanager
+    def writing(self):
+        """ provides the exclusive lock for the with statement
+        """
+        self.acquireWrite()
+        try:
+            yield
+        finally:
+            self.releaseWrite()
+
+    def info(self):
+        """ provides lock statistics
+
+        :returns: dictionary with numbers of readers and writers
+        :rtype: :obj:`dict` <:obj:`str`, any>
+        """
+        with self.__condition:
+            return {"readers": self.__readers,
+                    "writer": self.__writer,
+                    "waiting": self.__waiting}
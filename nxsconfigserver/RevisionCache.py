@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+""" LRU cache invalidated by the configuration revision """
+
+import threading
+from collections import OrderedDict
+
+
+class RevisionCache(object):
+
+    """ LRU cache with a size limit which is cleared
+        when the configuration revision changes
+    """
+
+    def __init__(self, maxsize=0, sizeof=len):
+        """ constructor
+
+        :param maxsize: maximal total size of cached values,
+                        0 disables caching
+        :type maxsize: :obj:`int`
+        :param sizeof: function providing size of a cached value
+        :type sizeof: :obj:`instancemethod`
+        """
+        #: (:obj:`int`) maximal total size of cached values
+        self.maxsize = maxsize
+        #: (:obj:`instancemethod`) function providing size of a value
+        self.__sizeof = sizeof
+        #: (:class:`collections.OrderedDict` <any, (any, :obj:`int`)>) \
+        #:     cached values with their sizes
+        self.__items = OrderedDict()
+        #: (:obj:`int`) total size of cached values
+        self.__size = 0
+        #: (:obj:`str`) revision of cached values
+        self.__revision = None
+        #: (:obj:`int`) number of cache hits
+        self.hits = 0
+        #: (:obj:`int`) number of cache misses
+        self.misses = 0
+        #: (:class:`threading.Lock`) cache lock
+        self.__lock = threading.Lock()
+
+    def validate(self, revision):
+        """ clears the cache if the revision has changed
+
+        :param revision: current configuration revision
+        :type revision: :obj:`str`
+        """
+        with self.__lock:
+            if revision != self.__revision:
+                self.__items.clear()
+                self.__size = 0
+                self.__revision = revision
+
+    def clear(self):
+        """ removes all cached values
+        """
+        with self.__lock:
+            self.__items.clear()
+            self.__size = 0
+            self.__revision = None
+
+    def get(self, key, default=None):
+        """ provides the cached value
+
+        :param key: value key
+        :type key: any
+        :param default: value returned when the key is not cached
+        :type default: any
+        :returns: cached value
+        :rtype: any
+        """
+        with self.__lock:
+            item = self.__items.pop(key, None)
+            if item is None:
+                self.misses += 1
+                return default
+            self.__items[key] = item
+            self.hits += 1
+            return item[0]
+
+    def __contains__(self, key):
+        """ checks if the value is cached without counting hits or misses
+
+        :param key: value key
+        :type key: any
+        :returns: True if the value is cached
+        :rtype: :obj:`bool`
+        """
+        with self.__lock:
+            return key in self.__items
+
+    def set(self, key, value, revision=None):
+        """ stores the value in the cache
+
+        :param key: value key
+        :type key: any
+        :param value: value to cache
+        :type value: any
+        :param revision: revision of the value,
+                         it is not cached if the revision is outdated
+        :type revision: :obj:`str`
+        """
+        size = self.__sizeof(value)
+        with self.__lock:
+            if size > self.maxsize or \
+               (revision is not None and revision != self.__revision):
+                return
+            item = self.__items.pop(key, None)
+            if item is not None:
+                self.__size -= item[1]
+            while self.__items and self.__size + size > self.maxsize:
+                _, item = self.__items.popitem(last=False)
+                self.__size -= item[1]
+            self.__items[key] = (value, size)
+            self.__size += size
+
+    def pop(self, key):
+        """ removes the value from the cache
+
+        :param key: value key
+        :type key: any
+        """
+        with self.__lock:
+            item = self.__items.pop(key, None)
+            if item is not None:
+                self.__size -= item[1]
+
+    def info(self):
+        """ provides cache statistics
+
+        :returns: dictionary with cache statistics
+        :rtype: :obj:`dict` <:obj:`str`, any>
+        """
+        with self.__lock:
+            return {"hits": self.hits,
+                    "misses": self.misses,
+                    "items": len(self.__items),
+                    "size": self.__size,
+                    "maxsize": self.maxsize,
+                    "revision": self.__revision}
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+""" Component template with $label.name placeholders """
+
+import re
+
+
+class Template(object):
+
+    """ component text split once into literals and placeholders
+    """
+
+    #: (:class:`re.RegexObject`) placeholder name pattern
+    __name = re.compile(r"[\w]+")
+
+    #: (:class:`re.RegexObject`) quoted default value pattern
+    __quoted = re.compile(r"([\"'])(?:\\\1|.)*?\1")
+
+    def __init__(self, text, label, delimiter=".", defaults=True,
+                 escaped=True):
+        """ constructor
+
+        :param text: component text
+        :type text: :obj:`str`
+        :param label: placeholder label, e.g. var or datasources
+        :type label: :obj:`str`
+        :param delimiter: delimiter between the label and the name
+        :type delimiter: :obj:`str`
+        :param defaults: if placeholders can have #"default" values
+        :type defaults: :obj:`bool`
+        :param escaped: if the text is escaped xml, otherwise it is
+                        text or attribute value of a parsed tree
+        :type escaped: :obj:`bool`
+        """
+        #: (:obj:`list` <:obj:`str`>) quotes enclosing default values
+        self.__quotes = ['&quot;', '\\&quot;'] if escaped else ['\\"']
+        #: (:obj:`str`) component text
+        self.text = text
+        #: (:obj:`list` <:obj:`str`>) literal segments
+        self.literals = []
+        #: (:obj:`list` < (:obj:`str`, :obj:`str`, :obj:`str`) >) \
+        #:     placeholder names, default values and source texts
+        self.placeholders = []
+        self.__tokenize("$%s%s" % (label, delimiter), defaults)
+
+    def __tokenize(self, start, defaults):
+        """ splits the text into literals and placeholders
+
+        :param start: placeholder start, i.e. $label.
+        :type start: :obj:`str`
+        :param defaults: if placeholders can have #"default" values
+        :type defaults: :obj:`bool`
+        """
+        text = self.text
+        last = 0
+        index = text.find(start)
+        while index != -1:
+            offset = index + len(start)
+            found = self.__name.search(text, offset)
+            name = found.group(0) if found else ""
+            end = offset + len(name)
+            default = None
+            if name and defaults and text[end:end + 1] == '#':
+                default, dtext = self.__default(text, end + 1)
+                if default is not None:
+                    end += len(dtext) + 1
+            self.literals.append(text[last:index])
+            self.placeholders.append((name, default, text[index:end]))
+            last = end
+            index = text.find(start, max(end, index + 1))
+        self.literals.append(text[last:])
+
+    def __default(self, text, offset):
+        """ provides the default value which follows the # character
+
+        :param text: component text
+        :type text: :obj:`str`
+        :param offset: position after the # character
+        :type offset: :obj:`int`
+        :returns: default value and its source text
+        :rtype: (:obj:`str`, :obj:`str`)
+        """
+        for quote in self.__quotes:
+            if text.startswith(quote, offset):
+                soff = text.find(quote, offset + len(quote))
+                if soff != -1:
+                    soff -= offset + len(quote)
+                dtext = text[offset:(offset + 2 * len(quote) + soff)]
+                return dtext[len(quote):-len(quote)].replace('\\"', '"'), \
+                    dtext
+        found = self.__quoted.search(text, offset)
+        if not found:
+            return None, ""
+        dtext = found.group(0)
+        if dtext[0] == "'":
+            return dtext[1:-1].replace("\\'", "'"), dtext
+        return dtext[1:-1].replace('\\"', '"'), dtext
+
+    def names(self):
+        """ provides placeholder names
+
+        :returns: placeholder names in order of their occurrence
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        return [ph[0] for ph in self.placeholders if ph[0]]
+
+    def render(self, substitute):
+        """ substitutes the placeholders
+
+        :param substitute: function of the placeholder name and
+                           its default value which returns the new text
+                           or None to keep the placeholder
+        :type substitute: :obj:`instancemethod`
+        :returns: text with substituted placeholders
+        :rtype: :obj:`str`
+        """
+        if not self.placeholders:
+            return self.text
+        parts = [self.literals[0]]
+        for (name, default, source), literal in zip(
+                self.placeholders, self.literals[1:]):
+            value = substitute(name, default)
+            parts.append(source if value is None else value)
+            parts.append(literal)
+        return "".join(parts)
@@ -19,22 +19,35 @@
 
 """ Provides the access to a database with NDTS configuration files """
 
+import copy
 import json
 import re
 import sys
 import weakref
-from xml import sax
-import xml.etree.ElementTree as et
-from lxml.etree import XMLParser
 from lxml import etree
 
 from .MYSQLDataBase import MYSQLDataBase as MyDB
-from .ComponentParser import ComponentHandler
-from .Merger import Merger
-from .Errors import NonregisteredDBRecordError, WrongXMLError, WrongJSONError
+from .ComponentParser import ComponentParser
+from .Merger import Merger, _fromstring
+from .DependencyGraph import DependencyGraph
+from .RevisionCache import RevisionCache
+from .Template import Template
+from .Errors import (NonregisteredDBRecordError, WrongXMLError,
+                     WrongJSONError, CyclicDependencyError)
 from .Release import __version__
 from .StreamSet import StreamSet
 
+if sys.version_info >= (3, 7):
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+else:
+    #: (:class:`concurrent.futures.ProcessPoolExecutor`) python versions
+    #:    without the mp_context argument merge components serially
+    ProcessPoolExecutor = None
+
+if sys.version_info > (3,):
+    basestring = str
+
 
 def _tostr(text):
     """ converts text  to str type
@@ -52,18 +65,37 @@ def _tostr(text):
         return str(text)
 
 
+def _processPool(processes):
+    """ creates the process pool merging independent subtrees
+
+    :brief: The workers are started by the forkserver or spawned,
+            i.e. they are not forked from the multithreaded server
+            and cannot inherit locks held by its threads
+    :param processes: number of worker processes
+    :type processes: :obj:`int`
+    :returns: process pool executor or None if not supported
+    :rtype: :class:`concurrent.futures.ProcessPoolExecutor`
+    """
+    if processes < 2 or ProcessPoolExecutor is None:
+        return None
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["nxsconfigserver.Merger"])
+    else:
+        context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(processes, mp_context=context)
+
+
 def _toxml(node):
     """ provides xml content of the whole node
 
     :param node: DOM node
-    :type node: :class:`xml.dom.Node`
+    :type node: :class:`lxml.etree.Element`
     :returns: xml content string
     :rtype: :obj:`str`
     """
-    xml = _tostr(et.tostring(node, encoding='utf8', method='xml'))
-    if xml.startswith("<?xml version='1.0' encoding='utf8'?>"):
-        xml = str(xml[38:])
-    return xml
+    return _tostr(etree.tostring(
+        node, encoding='utf8', method='xml', xml_declaration=False))
 
 
 class XMLConfigurator(object):
@@ -97,8 +129,9 @@ class XMLConfigurator(object):
         #: (:obj:`str`) string with XML variables
         self.variables = "{}"
 
-        #: (:obj:`str`) XML variables
-        self.__parameters = {}
+        #: (:class:`threading.local`) thread local storage
+        #:    of XML variables
+        self.__local = threading.local()
 
         #: (:class:`nxsconfigserver.MYSQLDataBase.MYSQLDataBase`) \
         #:        instance of MYSQLDataBase
@@ -125,6 +158,51 @@ class XMLConfigurator(object):
         #: (:class:`PyTango.Device_4Impl`) Tango server
         self.__server = server
 
+        #: (:class:`nxsconfigserver.DependencyGraph.DependencyGraph`) \
+        #:     graph of component dependencies
+        self.__graph = DependencyGraph()
+
+        #: ((:obj:`str`, :obj:`set` <:obj:`str`>)) DB revision \
+        #:     and names of available datasources
+        self.__dsnames = (None, set())
+
+        #: (:class:`nxsconfigserver.RevisionCache.RevisionCache`) \
+        #:     cache of serialized datasource elements
+        self.__fragments = RevisionCache(
+            16 * 2 ** 20, lambda fragment: len(fragment[0]))
+
+        #: (:class:`nxsconfigserver.RevisionCache.RevisionCache`) \
+        #:     cache of created configurations
+        self.__configurations = RevisionCache(16 * 2 ** 20)
+
+        #: (:class:`nxsconfigserver.RevisionCache.RevisionCache`) \
+        #:     cache of parsed component trees limited by their xml sizes
+        self.__trees = RevisionCache(4 * 2 ** 20, lambda tree: tree[1])
+
+        #: (:obj:`dict` <:obj:`bool`, (:obj:`dict` <:obj:`str`, :obj:`str`>, \
+        #:     :class:`lxml.etree.Element`)>) last merged components \
+        #:     with their not finalized tree for merging with \
+        #:     and without variables
+        self.__merged = {}
+
+        #: (:class:`concurrent.futures.ProcessPoolExecutor`) \
+        #:     process pool merging independent subtrees or None
+        self.__executor = None
+
+        #: (:class:`nxsconfigserver.RevisionCache.RevisionCache`) \
+        #:     cache of component templates
+        self.__templates = RevisionCache(
+            16 * 2 ** 20, lambda template: len(template.text))
+
+        #: (:class:`lxml.etree.XPath`) finder of texts, attribute values
+        #:     and comments which contain the given placeholder start
+        self.__placeholders = etree.XPath(
+            "descendant-or-self::text()[contains(., $start)]"
+            " | descendant-or-self::*/@*[contains(., $start)]"
+            " | descendant-or-self::comment()[contains(., $start)]"
+            " | descendant-or-self::processing-instruction()"
+            "[contains(., $start)]")
+
     @classmethod
     def __stringToListJson(cls, string):
         """ converts string to json list
@@ -233,6 +311,31 @@ class XMLConfigurator(object):
         __setCanFailDatSources,
         doc='canfail datasource list')
 
+    def __getParameters(self):
+        """ get method for parameters attribute
+
+        :returns: XML variables of the current thread
+        :rtype: :obj:`dict` <:obj:`str`, :obj:`str`>
+        """
+        if not hasattr(self.__local, "parameters"):
+            self.__local.parameters = {}
+        return self.__local.parameters
+
+    def __setParameters(self, parameters):
+        """ set method for parameters attribute
+
+        :param parameters: XML variables of the current thread
+        :type parameters: :obj:`dict` <:obj:`str`, :obj:`str`>
+        """
+        self.__local.parameters = parameters
+
+    #: (:obj:`dict` <:obj:`str`, :obj:`str`>) XML variables
+    #:    of the current thread, i.e. of the executed command
+    __parameters = property(
+        __getParameters,
+        __setParameters,
+        doc='XML variables of the current thread')
+
     def __getVersion(self):
         """ get method for version attribute
 
@@ -264,8 +367,38 @@ class XMLConfigurator(object):
         except Exception:
             self._streams.info("%s" % args)
             args = {}
+        self.__configurations.maxsize = int(
+            args.pop("config_cache_max_size", 16 * 2 ** 20))
+        self.__configurations.clear()
+        self.__trees.maxsize = int(
+            args.pop("tree_cache_max_size", 4 * 2 ** 20))
+        self.__trees.clear()
+        self.__merged = {}
+        self.__shutdownExecutor()
+        self.__executor = _processPool(
+            int(args.pop("merge_processes", 0)))
         self.__mydb.connect(args)
 
+    def __shutdownExecutor(self):
+        """ shuts down the process pool merging independent subtrees
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def cacheStatistics(self):
+        """ provides statistics of configuration and xml caches
+
+        :returns: dictionary with cache and connection pool statistics
+        :rtype: :obj:`dict` <:obj:`str`, any>
+        """
+        return {"configurations": self.__configurations.info(),
+                "datasources": self.__fragments.info(),
+                "templates": self.__templates.info(),
+                "trees": self.__trees.info(),
+                "records": self.__mydb.cacheInfo(),
+                "pool": self.__mydb.poolInfo()}
+
     def close(self):
         """ closes database connection
 
@@ -274,6 +407,8 @@ class XMLConfigurator(object):
 
         if self.__mydb:
             self.__mydb.close()
+        self.__merged = {}
+        self.__shutdownExecutor()
         self._streams.info("XMLConfigurator::close() - Close connection")
 
     def components(self, names):
@@ -313,14 +448,17 @@ class XMLConfigurator(object):
         comps = []
         if self.__mydb:
             comps = self.__mydb.components(names)
-            comps = [self.__instantiate(cp) for cp in comps]
+            datasources = self.__availableDataSources(comps)
+            comps = [self.__instantiate(cp, datasources) for cp in comps]
         return comps
 
-    def __instantiate(self, xmlcp):
+    def __instantiate(self, xmlcp, datasources=None):
         """ instantiates the xml component
 
         :param xmlcp: xml component
         :type xmlcp: :obj:`str`
+        :param datasources: available datasource names with their xmls
+        :type datasources: :obj:`dict` <:obj:`str`, :obj:`str`>
         :returns: instantiated components
         :rtype: :obj:`str`
 
@@ -329,7 +467,48 @@ class XMLConfigurator(object):
             self.__attachDataSources(
                 self.__attachVariables(
                     self.__attachComponents(
-                        xmlcp))))
+                        xmlcp)), datasources))
+
+    def __availableDataSources(self, components=None):
+        """ provides available datasources with xmls of datasources
+            referenced in the given components
+
+        :brief: Names of available datasources are kept for the current
+                DB revision and the referenced datasources without
+                cached elements are fetched together
+        :param components: xml components
+        :type components: :obj:`list` <:obj:`str`>
+        :returns: available datasource names with their xmls,
+                  None for datasources which have not been fetched
+        :rtype: :obj:`dict` <:obj:`str`, :obj:`str`>
+        """
+        revision = self.__mydb.version()
+        self.__fragments.validate(revision)
+        if revision is None or revision != self.__dsnames[0]:
+            self.__dsnames = (revision, set(self.availableDataSources()))
+        datasources = dict.fromkeys(self.__dsnames[1])
+        names = self.__unique(
+            [ds for cp in (components or []) if cp
+             for ds in self.__findElements(cp, self.__dsLabel)
+             if ds in datasources and ds not in self.__fragments])
+        if names:
+            datasources.update(zip(names, self.dataSources(names)))
+        return datasources
+
+    def __dataSourceValues(self, names, datasources):
+        """ provides xmls of the given datasources
+
+        :param names: datasource names
+        :type names: :obj:`list` <:obj:`str`>
+        :param datasources: available datasource names with their xmls
+        :type datasources: :obj:`dict` <:obj:`str`, :obj:`str`>
+        :returns: datasource xmls
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        missing = [nm for nm in names if datasources.get(nm) is None]
+        if missing:
+            datasources.update(zip(missing, self.dataSources(missing)))
+        return [datasources[nm] for nm in names]
 
     def componentDataSources(self, name):
         """ provides a list of datasources from the given component
@@ -343,13 +522,9 @@ class XMLConfigurator(object):
         if self.__mydb:
             cpl = self.instantiatedComponents([name])
             if len(cpl) > 0:
-                handler = ComponentHandler(self.__dsLabel)
-                text = str(cpl[0]).strip()
-                if sys.version_info > (3,):
-                    sax.parseString(bytes(text, "UTF-8"), handler)
-                else:
-                    sax.parseString(text, handler)
-                return list(handler.datasources.keys())
+                parser = ComponentParser(self.__dsLabel)
+                parser.parse(str(cpl[0]).strip())
+                return list(parser.datasources.keys())
             else:
                 return []
 
@@ -361,17 +536,14 @@ class XMLConfigurator(object):
         :returns: list of datasource names from the given components
         :rtype: :obj:`list` <:obj:`str`>
         """
-        mcnf = str(self.merge(names)).strip()
-        if mcnf:
-            cnf = self.__instantiate(mcnf)
-            handler = ComponentHandler(self.__dsLabel)
-            if sys.version_info > (3,):
-                sax.parseString(bytes(cnf, "UTF-8"), handler)
-            else:
-                sax.parseString(cnf, handler)
-            return list(handler.datasources.keys())
-        else:
+        mgr, comps = self.__mergeTree(names)
+        root = mgr.root
+        if root is None:
             return []
+        self.__instantiateTree(root, self.__availableDataSources(comps))
+        parser = ComponentParser(self.__dsLabel)
+        parser.walk(root)
+        return list(parser.datasources.keys())
 
     def __findElements(self, text, label, delimiter=None, rechars=None):
         """ provides a list of elements from the given text
@@ -444,23 +616,147 @@ class XMLConfigurator(object):
     def dependentComponents(self, names, deps=None):
         """ provides dependent components
 
+        :brief: The dependencies are resolved level by level and
+                components of each level are fetched together
         :param names: component names to check
         :type names: :obj:`list` <:obj:`str`>
-        :param deps: dictionery with dependent components
-        :type deps: :obj:`dict` <:obj:`str`, :obj:`str`>
+        :param deps: dictionary with already known component dependencies
+                     which is filled with the found ones
+        :type deps: :obj:`dict` <:obj:`str`, :obj:`list` <:obj:`str`>>
         :returns: list of depending components
         :rtype: :obj:`list` <:obj:`str`>
+        :raises: :class:`CyclicDependencyError` if a component
+                 depends on itself
         """
-        dps = deps if deps else {}
-        for nm in names:
-            if nm not in dps:
-                dps[nm] = []
-                cpl = self.__mydb.components([nm])
-                if cpl:
-                    dps[nm] = self.__findElements(cpl[0], self.__cpLabel)
-                    self.dependentComponents(dps[nm], dps)
+        dps = deps if deps is not None else {}
+        self.__graph.validate(self.__mydb.version())
+        level = [nm for nm in self.__unique(names) if nm not in dps]
+        while level:
+            self.__loadGraph(level)
+            for nm in level:
+                dps[nm] = self.__graph.references(nm)
+            level = self.__unique(
+                [cp for nm in level for cp in dps[nm] if cp not in dps])
+        self.__checkCycles(names, dps)
         return list(dps.keys())
 
+    def dependencyGraph(self, names):
+        """ provides the component dependency graph
+
+        :param names: component names with their dependencies to be
+                      included, all components if the list is empty
+        :type names: :obj:`list` <:obj:`str`>
+        :returns: JSON dictionary with component references and
+                  components using the referenced datasources
+        :rtype: :obj:`str`
+        """
+        self.__graph.validate(self.__mydb.version())
+        if not self.__graph.complete:
+            self.__loadGraph(self.availableComponents())
+            self.__graph.complete = True
+        if names:
+            self.dependentComponents(names)
+        return json.dumps(self.__graph.toDict(names or None), sort_keys=True)
+
+    @classmethod
+    def __unique(cls, names):
+        """ removes duplicated names keeping their order
+
+        :param names: list of names
+        :type names: :obj:`list` <:obj:`str`>
+        :returns: list of unique names
+        :rtype: :obj:`list` <:obj:`str`>
+        """
+        found = set()
+        unique = []
+        for nm in names:
+            if nm not in found:
+                found.add(nm)
+                unique.append(nm)
+        return unique
+
+    def __loadGraph(self, names):
+        """ adds the given components missing in the dependency graph
+
+        :param names: component names
+        :type names: :obj:`list` <:obj:`str`>
+        """
+        missing = self.__graph.missing(names)
+        if missing:
+            for nm, xml in zip(missing, self.__mydb.components(missing)):
+                self.__setGraphNode(nm, xml)
+
+    def __setGraphNode(self, name, xml):
+        """ sets references of the component in the dependency graph
+
+        :param name: component name
+        :type name: :obj:`str`
+        :param xml: component xml
+        :type xml: :obj:`str`
+        """
+        self.__graph.set(
+            name,
+            self.__findElements(xml, self.__cpLabel),
+            self.__findElements(xml, self.__dsLabel),
+            self.__findElements(xml, self.__varLabel))
+
+    def __storeComponent(self, name, xml):
+        """ stores the component and updates the dependency graph
+
+        :param name: name of the component to store
+        :type name: :obj:`str`
+        :param xml: component xml
+        :type xml: :obj:`str`
+        """
+        self.__followed(self.__mydb.storeComponent, name, xml)
+        self.__setGraphNode(name, xml)
+
+    def __followed(self, change, *args):
+        """ performs the DB change keeping the dependency graph revision
+
+        :param change: DB method changing the revision
+        :type change: :obj:`instancemethod`
+        :param args: arguments of the DB method
+        :type args: :obj:`list` <any>
+        """
+        revision = self.__mydb.version()
+        change(*args)
+        self.__graph.follow(revision, self.__mydb.version())
+
+    @classmethod
+    def __checkCycles(cls, names, deps):
+        """ checks if the given components depend on themselves
+
+        :param names: component names
+        :type names: :obj:`list` <:obj:`str`>
+        :param deps: dictionary with component dependencies
+        :type deps: :obj:`dict` <:obj:`str`, :obj:`list` <:obj:`str`>>
+        :raises: :class:`CyclicDependencyError` if a component
+                 depends on itself
+        """
+        checked = set()
+        for name in names:
+            if name in checked:
+                continue
+            path = [name]
+            onpath = set(path)
+            children = [iter(deps.get(name, []))]
+            while children:
+                child = next(children[-1], None)
+                if child is None:
+                    children.pop()
+                    onpath.discard(path[-1])
+                    checked.add(path.pop())
+                elif child in onpath:
+                    cycle = path[path.index(child):] + [child]
+                    raise CyclicDependencyError(
+                        "Cyclic dependency of components: %s"
+                        % " -> ".join(cycle))
+                elif child not in checked:
+                    path.append(child)
+                    onpath.add(child)
+                    children.append(iter(deps.get(child, [])))
+
     def dataSources(self, names, _=None):
         """ fetches the required datasources
 
@@ -515,16 +811,10 @@ class XMLConfigurator(object):
         """
         if self.__mydb:
             try:
-                if sys.version_info > (3,):
-                    et.fromstring(
-                        bytes(self.xmlstring, "UTF-8"),
-                        parser=XMLParser(collect_ids=False))
-                else:
-                    et.fromstring(
-                        self.xmlstring, parser=XMLParser(collect_ids=False))
+                _fromstring(self.xmlstring)
             except Exception as e:
                 raise WrongXMLError("WrongXMLError: %s" % str(e))
-            self.__mydb.storeComponent(name, self.xmlstring)
+            self.__storeComponent(name, self.xmlstring)
 
     def storeSelection(self, name):
         """ stores the selection from the xmlstring attribute
@@ -547,16 +837,10 @@ class XMLConfigurator(object):
         """
         if self.__mydb:
             try:
-                if sys.version_info > (3,):
-                    et.fromstring(
-                        bytes(self.xmlstring, "UTF-8"),
-                        parser=XMLParser(collect_ids=False))
-                else:
-                    et.fromstring(
-                        self.xmlstring, parser=XMLParser(collect_ids=False))
+                _fromstring(self.xmlstring)
             except Exception as e:
                 raise WrongXMLError("WrongXMLError: %s" % str(e))
-            self.__mydb.storeDataSource(name, self.xmlstring)
+            self.__followed(self.__mydb.storeDataSource, name, self.xmlstring)
 
     def deleteComponent(self, name):
         """ deletes the given component
@@ -565,7 +849,8 @@ class XMLConfigurator(object):
         :type name: :obj:`str`
         """
         if self.__mydb:
-            self.__mydb.deleteComponent(name)
+            self.__followed(self.__mydb.deleteComponent, name)
+            self.__graph.remove(name)
 
     def deleteSelection(self, name):
         """ deletes the given selection
@@ -583,7 +868,7 @@ class XMLConfigurator(object):
         :type name: :obj:`str`
         """
         if self.__mydb:
-            self.__mydb.deleteDataSource(name)
+            self.__followed(self.__mydb.deleteDataSource, name)
 
     def setComponentDataSources(self, jdict):
         """ sets component datasources according to given dict
@@ -606,7 +891,7 @@ class XMLConfigurator(object):
                             "component", cpname))
                 else:
                     tcomp = self.components([cpname])[0]
-                    self.__mydb.storeComponent(tcpname, tcomp)
+                    self.__storeComponent(tcpname, tcomp)
             else:
                 tcomp = self.components([tcpname])[0]
             tcpdss = self.componentDataSources(tcpname)
@@ -628,7 +913,7 @@ class XMLConfigurator(object):
                 tcomp, self.__dsLabel,
                 list(self.__parameters.keys()),
                 self.__getParameter, onlyexisting=True)
-            self.__mydb.storeComponent(cpname, comp)
+            self.__storeComponent(cpname, comp)
 
     @classmethod
     def __commentDataSources(cls, comp, disds):
@@ -656,7 +941,7 @@ class XMLConfigurator(object):
         :type names: :obj:`list` <:obj:`str`>
         """
         for name in names:
-            self.__mydb.setMandatory(name)
+            self.__followed(self.__mydb.setMandatory, name)
 
     def unsetMandatoryComponents(self, names):
         """ sets the mandatory components
@@ -665,7 +950,7 @@ class XMLConfigurator(object):
         :type names: :obj:`list` <:obj:`str`>
         """
         for name in names:
-            self.__mydb.unsetMandatory(name)
+            self.__followed(self.__mydb.unsetMandatory, name)
 
     def mandatoryComponents(self):
         """ provides names of the mandatory components
@@ -703,7 +988,7 @@ class XMLConfigurator(object):
             return []
 
     def __attachElements(self, component, label, keys, funValue,
-                         tag=None, onlyexisting=False):
+                         tag=None, onlyexisting=False, escaped=True):
         """ attaches elements to component
 
         :param component: given component
@@ -718,108 +1003,158 @@ class XMLConfigurator(object):
         :type tag: :obj:`str`
         :param onlyexisting: attachElement only if exists
         :type onlyexisting: :obj:`bool`
+        :param escaped: if the component is escaped xml, otherwise it is
+                        text or attribute value of a parsed tree
+        :type escaped: :obj:`bool`
         :returns: component with attached variables
         :rtype: :obj:`str`
         """
-        index = component.find("$%s%s" % (label, self.__delimiter))
-        while index != -1:
-            defsubc = None
-            subc = ''
-            dsubc = ''
-            try:
-                finder = re.finditer(
-                    r"[\w]+",
-                    component[(index + len(label) + 2):])
-                if sys.version_info > (3,):
-                    subc = finder.__next__().group(0)
-                else:
-                    subc = finder.next().group(0)
+        template = self.__template(component, label, not tag, escaped)
+        return template.render(
+            lambda name, default: self.__attachElement(
+                name, default, component, label, keys, funValue,
+                tag, onlyexisting, escaped))
+
+    def __template(self, component, label, defaults=True, escaped=True):
+        """ provides the compiled component template
 
-                if not tag:
-                    offset = index + len(subc) + len(label) + 2
-                    if component[offset] == '#':
-                        if component[offset + 1:offset + 7] == '&quot;':
-                            soff = component[(offset + 7):].find('&quot;')
-                            dsubc = component[
-                                (offset + 1):(offset + 13 + soff)]
-                            defsubc = dsubc[6:-6].replace('\\"', '"')
-                        elif component[offset + 1:offset + 8] == '\\&quot;':
-                            soff = component[(offset + 8):].find('\\&quot;')
-                            dsubc = component[
-                                (offset + 1):(offset + 15 + soff)]
-                            defsubc = dsubc[7:-7].replace('\\"', '"')
-                        else:
-                            finder = re.finditer(
-                                r"([\"'])(?:\\\1|.)*?\1",
-                                component[(offset + 1):])
-                            if sys.version_info > (3,):
-                                dsubc = finder.__next__().group(0)
-                            else:
-                                dsubc = finder.next().group(0)
-                            if dsubc:
-                                if dsubc[0] == "'":
-                                    defsubc = dsubc[1:-1].replace("\\'", "'")
-                                elif dsubc[0] == '"':
-                                    defsubc = dsubc[1:-1].replace('\\"', '"')
+        :param component: given component
+        :type component: :obj:`str`
+        :param label: element label
+        :type label: :obj:`str`
+        :param defaults: if placeholders can have default values
+        :type defaults: :obj:`bool`
+        :param escaped: if the component is escaped xml
+        :type escaped: :obj:`bool`
+        :returns: component template
+        :rtype: :class:`nxsconfigserver.Template.Template`
+        """
+        key = (component, label, defaults, escaped)
+        template = self.__templates.get(key)
+        if template is None:
+            template = Template(
+                component, label, self.__delimiter, defaults, escaped)
+            self.__templates.set(key, template)
+        return template
+
+    def __attachElement(self, name, default, component, label, keys,
+                        funValue, tag=None, onlyexisting=False,
+                        escaped=True):
+        """ provides value of the element placeholder
+
+        :param name: element name
+        :type name: :obj:`str`
+        :param default: element default value
+        :type default: :obj:`str`
+        :param component: given component
+        :type component: :obj:`str`
+        :param label: element label
+        :type label: :obj:`str`
+        :param keys: element names
+        :type label: :obj:`list` <:obj:`str`>
+        :param funValue: function of element value
+        :type funValue: :obj:`instancemethod`
+        :param tag: xml tag
+        :type tag: :obj:`str`
+        :param onlyexisting: attachElement only if exists
+        :type onlyexisting: :obj:`bool`
+        :param escaped: if the component is escaped xml
+        :type escaped: :obj:`bool`
+        :returns: element value or None if the placeholder should be kept
+        :rtype: :obj:`str`
+        """
+        if tag:
+            ds = self.__fragment(name, component, keys, funValue, tag)[0]
+        else:
+            if not name:
+                raise NonregisteredDBRecordError(
+                    "The %s %s of %s not registered" % (
+                        "variable", name, component))
+            try:
+                xmlds = funValue([name], default)
             except Exception:
-                pass
-            name = subc.strip() if subc else ""
-            if name:
-                if tag and name not in keys:
-                    raise NonregisteredDBRecordError(
-                        "The %s %s of %s not registered in the DataBase" % (
-                            tag if tag else "variable", name, component))
-                try:
-                    xmlds = funValue([name], defsubc)
-                except Exception:
-                    xmlds = []
-                if not onlyexisting and not xmlds:
-                    raise NonregisteredDBRecordError(
-                        "The %s %s of %s not registered" % (
-                            tag if tag else "variable", name, component))
-                if tag:
-                    if sys.version_info > (3,):
-                        root = et.fromstring(
-                            bytes(xmlds[0], "UTF-8"),
-                            parser=XMLParser(collect_ids=False))
-                    else:
-                        root = et.fromstring(
-                            xmlds[0], parser=XMLParser(collect_ids=False))
-                        # dom = parseString(xmlds[0])
-                    if root.tag == tag:
-                        etds = [root]
-                    else:
-                        etds = root.findall(".//%s" % tag)
-                    # domds = dom.getElementsByTagName(tag)
-                    if not etds:
-                        raise NonregisteredDBRecordError(
-                            "The %s %s of %s not registered in the DataBase"
-                            % (tag if tag else "variable", name, component))
-                    ds = _toxml(etds[0])
-                    if not ds:
-                        raise NonregisteredDBRecordError(
-                            "The %s %s of %s not registered" % (
-                                tag if tag else "variable", name, component))
-                    ds = "\n" + ds
-                else:
-                    ds = xmlds[0] if (xmlds or not onlyexisting) else None
-                if xmlds:
-                    component = component[0:index] + ("%s" % ds) \
-                        + component[
-                            (index + len(subc) + len(label) + 2 +
-                             ((len(dsubc) + 1)
-                              if defsubc is not None else 0)):]
-                if not onlyexisting:
-                    index = component.find("$%s%s" % (label, self.__delimiter))
-                else:
-                    index = component.find(
-                        "$%s%s" % (label, self.__delimiter),
-                        index + 1)
-            else:
+                xmlds = []
+            if not onlyexisting and not xmlds:
                 raise NonregisteredDBRecordError(
                     "The %s %s of %s not registered" % (
-                        tag if tag else "variable", name, component))
-        return component
+                        "variable", name, component))
+            if not xmlds:
+                return None
+            ds = "%s" % xmlds[0]
+        if not onlyexisting:
+            # substituted values can contain further elements
+            ds = self.__attachElements(
+                ds, label, keys, funValue, tag, onlyexisting, escaped)
+        return ds
+
+    def __fragment(self, name, component, keys, funValue, tag):
+        """ provides the element with the given name
+
+        :param name: element name
+        :type name: :obj:`str`
+        :param component: component with the element placeholder
+        :type component: :obj:`str`
+        :param keys: element names
+        :type keys: :obj:`list` <:obj:`str`>
+        :param funValue: function of element value
+        :type funValue: :obj:`instancemethod`
+        :param tag: xml tag
+        :type tag: :obj:`str`
+        :returns: serialized element preceded by a new line and
+                  the element with its tail
+        :rtype: (:obj:`str`, :class:`lxml.etree.Element`)
+        """
+        if not name:
+            raise NonregisteredDBRecordError(
+                "The %s %s of %s not registered" % (tag, name, component))
+        if name not in keys:
+            raise NonregisteredDBRecordError(
+                "The %s %s of %s not registered in the DataBase" % (
+                    tag, name, component))
+        fragment = self.__fragments.get(name)
+        if fragment is None:
+            try:
+                xmlds = funValue([name], None)
+            except Exception:
+                xmlds = []
+            if not xmlds:
+                raise NonregisteredDBRecordError(
+                    "The %s %s of %s not registered" % (
+                        tag, name, component))
+            fragment = self.__extractElement(xmlds[0], name, component, tag)
+            self.__fragments.set(name, fragment, self.__dsnames[0])
+        return fragment
+
+    @classmethod
+    def __extractElement(cls, xml, name, component, tag):
+        """ extracts the first element with the given tag
+
+        :param xml: xml with the element
+        :type xml: :obj:`str`
+        :param name: element name
+        :type name: :obj:`str`
+        :param component: component with the element placeholder
+        :type component: :obj:`str`
+        :param tag: xml tag
+        :type tag: :obj:`str`
+        :returns: serialized element preceded by a new line and
+                  the element with its tail
+        :rtype: (:obj:`str`, :class:`lxml.etree.Element`)
+        """
+        root = _fromstring(xml)
+        if root.tag == tag:
+            etds = [root]
+        else:
+            etds = root.findall(".//%s" % tag)
+        if not etds:
+            raise NonregisteredDBRecordError(
+                "The %s %s of %s not registered in the DataBase"
+                % (tag, name, component))
+        ds = _toxml(etds[0])
+        if not ds:
+            raise NonregisteredDBRecordError(
+                "The %s %s of %s not registered" % (tag, name, component))
+        return "\n" + ds, etds[0]
 
     def __attachVariables(self, component, cpvars=None):
         """ attaches variables to component
@@ -833,15 +1168,23 @@ class XMLConfigurator(object):
         """
         if not component:
             return
+        self.__setVariables(cpvars)
+        return self.__attachElements(
+            component, self.__varLabel,
+            list(self.__parameters.keys()), self.__getVariable)
+
+    def __setVariables(self, cpvars=None):
+        """ sets variable values
+
+        :param cpvars: dictionary with component variable values
+        :type cpvars: :obj:`dict` <:obj:`str` , :obj:`str`>
+        """
         self.__parameters = {}
         js = json.loads(self.variables)
         targs = cpvars or {}
         targs.update(dict(js.items()))
         for k in targs.keys():
             self.__parameters[str(k)] = str(targs[k])
-        return self.__attachElements(
-            component, self.__varLabel,
-            list(self.__parameters.keys()), self.__getVariable)
 
     def __attachComponents(self, component):
         """ attaches variables to component
@@ -856,21 +1199,226 @@ class XMLConfigurator(object):
         return self.__attachElements(
             component, self.__cpLabel, [], lambda x, y: [""])
 
-    def __attachDataSources(self, component):
+    def __attachDataSources(self, component, datasources=None):
         """ attaches datasources to component
 
         :param component: given component
         :type component: :obj:`str`
+        :param datasources: available datasource names with their xmls
+        :type datasources: :obj:`dict` <:obj:`str`, :obj:`str`>
         :returns: component with attached datasources
         :rtype: :obj:`str`
         """
         if not component:
             return
+        if datasources is None:
+            datasources = self.__availableDataSources([component])
         return self.__attachElements(
-            component, self.__dsLabel,
-            self.availableDataSources(), self.dataSources,
+            component, self.__dsLabel, datasources,
+            lambda names, _: self.__dataSourceValues(names, datasources),
             "datasource")
 
+    def __instantiateTree(self, root, datasources):
+        """ instantiates the parsed component in place
+
+        :brief: Texts with placeholders are found once for components,
+                variables and datasources as their values change
+                only in place before datasources are inserted
+        :param root: component root element
+        :type root: :class:`lxml.etree.Element`
+        :param datasources: available datasource names with their xmls
+        :type datasources: :obj:`dict` <:obj:`str`, :obj:`str`>
+        """
+        texts = self.__placeholders(root, start="$")
+        self.__attachTreeElements(
+            texts, self.__cpLabel,
+            lambda text: self.__attachElements(
+                text, self.__cpLabel, [], lambda x, y: [""],
+                escaped=False))
+        self.__setVariables()
+        self.__attachTreeElements(
+            texts, self.__varLabel,
+            lambda text: self.__attachElements(
+                text, self.__varLabel, [], self.__getVariable,
+                escaped=False))
+        self.__attachTreeDataSources(
+            texts, datasources,
+            lambda names, _: self.__dataSourceValues(names, datasources))
+        self.__attachTreeElements(
+            self.__placeholders(
+                root, start="$%s%s" % (self.__varLabel, self.__delimiter)),
+            self.__varLabel,
+            lambda text: self.__attachElements(
+                text, self.__varLabel, [], self.__getVariable,
+                escaped=False))
+
+    @classmethod
+    def __treeText(cls, text):
+        """ provides the current value of the found text
+
+        :param text: text, attribute value or comment found in the tree
+        :type text: :obj:`str` or :class:`lxml.etree.Element`
+        :returns: the current value
+        :rtype: :obj:`str`
+        """
+        if not isinstance(text, basestring):
+            return text.text
+        parent = text.getparent()
+        if text.is_attribute:
+            return parent.get(text.attrname)
+        elif text.is_tail:
+            return parent.tail
+        return parent.text
+
+    @classmethod
+    def __setTreeText(cls, text, value):
+        """ sets a new value of the found text
+
+        :param text: text, attribute value or comment found in the tree
+        :type text: :obj:`str` or :class:`lxml.etree.Element`
+        :param value: new value
+        :type value: :obj:`str`
+        """
+        if not isinstance(text, basestring):
+            text.text = value or None
+        elif text.is_attribute:
+            text.getparent().attrib[text.attrname] = value
+        elif text.is_tail:
+            text.getparent().tail = value or None
+        else:
+            text.getparent().text = value or None
+
+    def __attachTreeElements(self, texts, label, attach):
+        """ attaches elements to texts and attribute values of the tree
+
+        :param texts: texts, attribute values and comments of the tree
+                      which can contain placeholders
+        :type texts: :obj:`list` <:obj:`str` or \
+                     :class:`lxml.etree.Element`>
+        :param label: element label
+        :type label: :obj:`str`
+        :param attach: function attaching elements to the given text
+        :type attach: :obj:`instancemethod`
+        """
+        start = "$%s%s" % (label, self.__delimiter)
+        for text in texts:
+            value = self.__treeText(text)
+            if value and start in value:
+                self.__setTreeText(text, attach(value))
+
+    def __attachTreeDataSources(self, texts, keys, funValue):
+        """ inserts datasource elements in place of their placeholders
+
+        :param texts: texts, attribute values and comments of the tree
+                      which can contain placeholders
+        :type texts: :obj:`list` <:obj:`str` or \
+                     :class:`lxml.etree.Element`>
+        :param keys: available datasource names
+        :type keys: :obj:`dict` <:obj:`str`, :obj:`str`>
+        :param funValue: function of datasource xmls
+        :type funValue: :obj:`instancemethod`
+        """
+        start = "$%s%s" % (self.__dsLabel, self.__delimiter)
+        for text in texts:
+            value = self.__treeText(text)
+            if not value or start not in value:
+                continue
+            if not isinstance(text, basestring) or text.is_attribute:
+                self.__setTreeText(text, self.__attachElements(
+                    value, self.__dsLabel, keys, funValue,
+                    "datasource", escaped=False))
+            elif text.is_tail:
+                self.__attachTailDataSources(
+                    text.getparent(), keys, funValue)
+            else:
+                parent = text.getparent()
+                parent.text, elements, nested = self.__dataSourceElements(
+                    value, keys, funValue)
+                self.__insertDataSources(
+                    parent, 0, elements, nested, keys, funValue)
+
+    def __attachTailDataSources(self, node, keys, funValue):
+        """ inserts datasource elements in place of placeholders
+            of the node tail
+
+        :param node: the given node
+        :type node: :class:`lxml.etree.Element`
+        :param keys: available datasource names
+        :type keys: :obj:`dict` <:obj:`str`, :obj:`str`>
+        :param funValue: function of datasource xmls
+        :type funValue: :obj:`instancemethod`
+        """
+        start = "$%s%s" % (self.__dsLabel, self.__delimiter)
+        if node.tail and start in node.tail:
+            node.tail, elements, nested = self.__dataSourceElements(
+                node.tail, keys, funValue)
+            parent = node.getparent()
+            self.__insertDataSources(
+                parent, parent.index(node) + 1, elements, nested,
+                keys, funValue)
+
+    def __insertDataSources(self, parent, index, elements, nested,
+                            keys, funValue):
+        """ inserts datasource elements into the parent
+
+        :brief: The inserted datasources are also instantiated
+                as they can contain further datasources
+        :param parent: parent element
+        :type parent: :class:`lxml.etree.Element`
+        :param index: position of the first datasource
+        :type index: :obj:`int`
+        :param elements: datasource elements
+        :type elements: :obj:`list` <:class:`lxml.etree.Element`>
+        :param nested: if the datasources contain datasource placeholders
+        :type nested: :obj:`bool`
+        :param keys: available datasource names
+        :type keys: :obj:`dict` <:obj:`str`, :obj:`str`>
+        :param funValue: function of datasource xmls
+        :type funValue: :obj:`instancemethod`
+        """
+        for i, element in enumerate(elements):
+            parent.insert(index + i, element)
+        if nested:
+            start = "$%s%s" % (self.__dsLabel, self.__delimiter)
+            for element in elements:
+                self.__attachTreeDataSources(
+                    self.__placeholders(element, start=start),
+                    keys, funValue)
+                self.__attachTailDataSources(element, keys, funValue)
+
+    def __dataSourceElements(self, text, keys, funValue):
+        """ splits the text into datasource elements
+
+        :param text: text with datasource placeholders
+        :type text: :obj:`str`
+        :param keys: available datasource names
+        :type keys: :obj:`dict` <:obj:`str`, :obj:`str`>
+        :param funValue: function of datasource xmls
+        :type funValue: :obj:`instancemethod`
+        :returns: text before the first datasource, datasource
+                  elements with the following texts as their tails
+                  and if the datasources contain datasource placeholders
+        :rtype: (:obj:`str`, \
+                 :obj:`list` <:class:`lxml.etree.Element`>, :obj:`bool`)
+        """
+        start = "$%s%s" % (self.__dsLabel, self.__delimiter)
+        template = self.__template(text, self.__dsLabel, False, False)
+        texts = [template.literals[0]]
+        elements = []
+        nested = False
+        for (name, _, _), literal in zip(
+                template.placeholders, template.literals[1:]):
+            fragment = self.__fragment(
+                name, text, keys, funValue, "datasource")
+            nested = nested or start in fragment[0]
+            element = copy.deepcopy(fragment[1])
+            texts[-1] += "\n"
+            texts.append((element.tail or "") + literal)
+            elements.append(element)
+        for element, tail in zip(elements, texts[1:]):
+            element.tail = tail or None
+        return texts[0] or None, elements, nested
+
     def merge(self, names):
         """ merges the give components
 
@@ -908,61 +1456,145 @@ class XMLConfigurator(object):
         :returns: merged components
         :rtype: :obj:`str`
         """
-        xml = ""
+        xml = self.__mergeTree(names, withVariables)[0].toString()
+        return xml if xml is not None else ""
+
+    def __mergeTree(self, names, withVariables=False):
+        """ merges the give components into one tree
+
+        :param names: list of component names
+        :type names: :obj:`list` <:obj:`str`>
+        :param withVariables: if true variables will be substituted
+        :type withVariables: :obj:`bool`
+        :returns: merger with the merged tree and merged component xmls
+        :rtype: (:class:`nxsconfigserver.Merger.Merger`, \
+                 :obj:`list` <:obj:`str`>)
+        """
+        mgr = self.__merger()
+        comps = []
         if self.__mydb:
-            allnames = self.dependentComponents(
-                list(set(self.__mydb.mandatory() + names)))
-            comps = self.__mydb.components(list(set(allnames)))
+            allnames = list(set(self.dependentComponents(
+                list(set(self.__mydb.mandatory() + names)))))
+            comps = self.__mydb.components(allnames)
             if withVariables:
                 cpvars = self.__variableComponentValues(comps)
                 comps = [self.__attachVariables(cp, cpvars) for cp in comps]
-            xml = self.__merge(comps)
-        return xml if xml is not None else ""
-
-    def __merge(self, xmls):
-        """ merges the give component xmls
-
-        :param xmls: list of component xmls
-        :type xmls: :obj:`list` <:obj:`str`>
-        :returns: merged components
-        :rtype: :obj:`str`
+            self.__mergeComponents(
+                mgr, list(zip(allnames, comps)), withVariables)
+        return mgr, comps
+
+    def __mergeComponents(self, mgr, components, withVariables=False):
+        """ merges the components extending the last merged tree
+
+        :brief: The last merged tree is reused if it was merged from
+                a subset of the given components with the same xmls
+        :param mgr: merger
+        :type mgr: :class:`nxsconfigserver.Merger.Merger`
+        :param components: component names with their xmls
+        :type components: :obj:`list` <(:obj:`str`, :obj:`str`)>
+        :param withVariables: if variables are substituted in xmls
+        :type withVariables: :obj:`bool`
+        """
+        xmls = dict(components)
+        last = self.__merged.get(withVariables)
+        if last is not None and all(
+                xmls.get(name) == xml for name, xml in last[0].items()):
+            added = [self.__componentTree(name, xml)
+                     for name, xml in components if name not in last[0]]
+            if added:
+                mgr.collect([copy.deepcopy(last[1])], merged=True)
+                mgr.add(added)
+                mgr.merge(finalize=False)
+            else:
+                mgr.collect([last[1]], merged=True)
+        else:
+            mgr.collect([self.__componentTree(name, xml)
+                         for name, xml in components])
+            mgr.merge(finalize=False)
+        self.__merged[withVariables] = (xmls, mgr.root)
+        if mgr.root is not None:
+            mgr.collect([copy.deepcopy(mgr.root)])
+            mgr.finalize()
+
+    def __componentTree(self, name, xml):
+        """ provides a copy of the parsed component tree
+
+        :param name: component name
+        :type name: :obj:`str`
+        :param xml: component xml
+        :type xml: :obj:`str`
+        :returns: component tree or None for the empty component
+        :rtype: :class:`lxml.etree.Element`
+        """
+        if not xml:
+            return None
+        tree = self.__trees.get((name, xml))
+        if tree is None:
+            tree = (_fromstring(xml), len(xml))
+            if not self.__trees.maxsize:
+                return tree[0]
+            self.__trees.set((name, xml), tree)
+        return copy.deepcopy(tree[0])
+
+    def __merger(self):
+        """ creates merger with step, link and canfail datasources
+
+        :returns: merger
+        :rtype: :class:`nxsconfigserver.Merger.Merger`
         """
         mgr = Merger()
         mgr.switchdatasources = json.loads(self.stepdatasources)
         mgr.linkdatasources = json.loads(self.linkdatasources)
         mgr.canfaildatasources = json.loads(self.canfaildatasources)
-        mgr.collect(xmls)
-        mgr.merge()
-        return mgr.toString()
+        mgr.executor = self.__executor
+        return mgr
 
     def createConfiguration(self, names):
         """ creates the final configuration string in the xmlstring attribute
 
+        :brief: The created configurations are cached for the given
+                components, mandatory components, variables, step, link
+                and canfail datasources and the DB revision
         :param names: list of component names
         :type names: :obj:`list` <:obj:`str`>
         """
-        cnf = self.__mergeVars(names, withVariables=True)
-        cnf = self.__instantiate(cnf)
-        cnfMerged = self.__merge([cnf])
-        if cnfMerged and hasattr(cnfMerged, "strip") and cnfMerged.strip():
-            if sys.version_info > (3,):
-                reparsed = et.fromstring(
-                    bytes(cnfMerged, "UTF-8"),
-                    parser=XMLParser(collect_ids=False))
-            else:
-                reparsed = et.fromstring(
-                    cnfMerged, parser=XMLParser(collect_ids=False))
-            xmls = _tostr(etree.tostring(reparsed, encoding='utf8',
-                                         method='xml', pretty_print=True))
-            if xmls.startswith("<?xml"):
-                self.xmlstring = xmls
-            else:
-                self.xmlstring = "<?xml version='1.0' encoding='utf8'?>" + xmls
-        else:
-            self.xmlstring = ''
+        revision = self.__mydb.version()
+        self.__configurations.validate(revision)
+        key = json.dumps([
+            sorted(set(names)), sorted(set(self.__mydb.mandatory())),
+            self.variables, self.stepdatasources, self.linkdatasources,
+            self.canfaildatasources])
+        xmlstring = self.__configurations.get(key)
+        if xmlstring is None:
+            xmlstring = self.__createConfiguration(names)
+            self.__configurations.set(key, xmlstring, revision)
+        self.xmlstring = xmlstring
         self._streams.info("XMLConfigurator::createConfiguration() "
                            "- Create configuration")
 
+    def __createConfiguration(self, names):
+        """ creates the final configuration string
+
+        :param names: list of component names
+        :type names: :obj:`list` <:obj:`str`>
+        :returns: final configuration
+        :rtype: :obj:`str`
+        """
+        mgr, comps = self.__mergeTree(names, withVariables=True)
+        root = mgr.root
+        if root is None:
+            return ''
+        self.__instantiateTree(root, self.__availableDataSources(comps))
+        mgr = self.__merger()
+        mgr.collect([root])
+        mgr.merge()
+        xmls = _tostr(etree.tostring(root, encoding='utf8',
+                                     method='xml', pretty_print=True))
+        if xmls.startswith("<?xml"):
+            return xmls
+        else:
+            return "<?xml version='1.0' encoding='utf8'?>" + xmls
+
 
 if __name__ == "__main__":
 
@@ -39,6 +39,8 @@ def run(argv):
         pyutil.add_class(NXSCnfSrvClass, NXSCnfSrv)
 
         util = PyTango.Util.instance()
+        # commands are synchronized by the device reader/writer lock
+        util.set_serial_model(PyTango.SerialModel.NO_SYNC)
         util.server_init()
         util.server_run()
 
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas.configserver
+# \package test nexdatas.configserver
+# \file ComponentParserTest.py
+# unittests for Component Parser
+#
+import unittest
+import sys
+import struct
+
+from xml import sax
+from lxml import etree
+
+from nxsconfigserver.ComponentParser import (
+    ComponentParser, ComponentHandler)
+
+
+# if 64-bit machione
+IS64BIT = (struct.calcsize("P") == 8)
+
+
+# test fixture
+class ComponentParserTest(unittest.TestCase):
+
+    # constructor
+    # \param methodName name of the test method
+
+    def __init__(self, methodName):
+        unittest.TestCase.__init__(self, methodName)
+
+        self._bint = "int64" if IS64BIT else "int32"
+        self._buint = "uint64" if IS64BIT else "uint32"
+        self._bfloat = "float64" if IS64BIT else "float32"
+
+        # xml components with their datasources
+        self._xmls = [
+            ('<field name="myfield" ><datasource type="TANGO" '
+             'name="myTango">NXentry</datasource></field>',
+             [(u'myTango', u'TANGO')]),
+            ('<group><field name="myfield" >$datasources.myTANGO'
+             '<attribute name="myattr" >$datasources.myTANGO2</attribute>'
+             '</field></group>',
+             [(u'myTANGO2', '__FROM_DB__'), (u'myTANGO', '__FROM_DB__')]),
+            ('<definition><group type="NXentry">'
+             '<field name="f1">$datasources.ds1<strategy mode="STEP"/>'
+             '\n$datasources.ds2 $datasources.ds3$datasources.ds4</field>'
+             '<field><datasource type="PYEVAL"><datasource name="ds5"/>'
+             '<datasource type="CLIENT"/><result>'
+             '$datasources.ds6</result></datasource></field>'
+             '<group type="NXdata"><datasource type="DB" name="ds7"/>'
+             '<doc>$datasources.ds8</doc></group>'
+             '<attribute name="a">$datasources. ds9 $datasources.</attribute>'
+             '<field name="f2"><datasource name="ds1" type="DB"/>'
+             '</field><field name="f3"><![CDATA[$datasources.ds10]]>'
+             '<!-- $datasources.ds11 --></field>'
+             '</group></definition>',
+             [('ds1', 'DB'), ('ds2', '__FROM_DB__'),
+              ('ds3', '__FROM_DB__'), ('ds4', '__FROM_DB__'),
+              ('__unnamed__0', 'PYEVAL'), ('ds5', ''),
+              ('__unnamed__1', 'CLIENT'), ('ds7', 'DB'),
+              ('ds9', '__FROM_DB__'), ('ds10', '__FROM_DB__')]),
+        ]
+
+    # test starter
+    # \brief Common set up
+    def setUp(self):
+        print("\nsetting up...")
+
+    # test closer
+    # \brief Common tear down
+    def tearDown(self):
+        print("tearing down ...")
+
+    # constructor test
+    # \brief It tests default settings
+    def test_constructor(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        el = ComponentParser()
+        self.assertEqual(el.datasources, {})
+        el = ComponentParser("myds")
+        self.assertEqual(el.datasources, {})
+
+    # parse test
+    # \brief It tests parsing xml strings
+    def test_parse(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        for xml, dss in self._xmls:
+            el = ComponentParser()
+            self.assertEqual(el.parse(xml), None)
+            self.assertEqual(sorted(el.datasources.items()), sorted(dss))
+            el = ComponentParser()
+            self.assertEqual(el.parse(xml.encode("utf8")), None)
+            self.assertEqual(sorted(el.datasources.items()), sorted(dss))
+
+    # walk test
+    # \brief It tests walking parsed trees
+    def test_walk(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        for xml, dss in self._xmls:
+            el = ComponentParser()
+            root = etree.fromstring(xml)
+            text = etree.tostring(root)
+            self.assertEqual(el.walk(root), None)
+            self.assertEqual(sorted(el.datasources.items()), sorted(dss))
+            self.assertEqual(etree.tostring(root), text)
+
+    # label test
+    # \brief It tests the datasource label
+    def test_parse_label(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        xml = '<group><field name="myfield" >$ds.myTANGO' \
+            '<attribute name="myattr" >$datasources.myTANGO2</attribute>' \
+            '</field><field>$ds:myTANGO3</field></group>'
+        el = ComponentParser("ds")
+        el.parse(xml)
+        self.assertEqual(el.datasources, {u'myTANGO': '__FROM_DB__'})
+        el = ComponentParser("ds", ":")
+        el.parse(xml)
+        self.assertEqual(el.datasources, {u'myTANGO3': '__FROM_DB__'})
+
+    # handler test
+    # \brief It tests if the datasources are the same as of the SAX handler
+    def test_parse_handler(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        xml = "<definition><group type='NXentry' name='entry'>%s" \
+            "</group></definition>" % "".join(
+                "<group type='NXdetector' name='det%s'>"
+                "<field name='f%s'>$datasources.ds%s<strategy mode='STEP'/>"
+                "<attribute name='a%s'>$datasources.ads%s</attribute>\n"
+                "</field><field name='g%s'><datasource name='ds%s' "
+                "type='TANGO'><record name='r%s'/></datasource>"
+                "<doc>$datasources.doc%s</doc></field></group>"
+                % ((i % 7,) + (i,) * 8) for i in range(500))
+        handler = ComponentHandler()
+        sax.parseString(xml.encode("utf8"), handler)
+        el = ComponentParser()
+        el.parse(xml)
+        self.assertEqual(len(el.datasources), 1000)
+        self.assertEqual(list(el.datasources.items()),
+                         list(handler.datasources.items()))
+        el = ComponentParser()
+        el.walk(etree.fromstring(xml))
+        self.assertEqual(list(el.datasources.items()),
+                         list(handler.datasources.items()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file ConnectionPoolTest.py
+# unittests for ConnectionPool class
+#
+import unittest
+import sys
+import threading
+import time
+
+from nxsconfigserver.ConnectionPool import ConnectionPool
+
+
+# dummy database connection
+class DummyConnection(object):
+
+    # constructor
+    def __init__(self):
+        self.open = 1
+        self.pings = 0
+        self.broken = False
+
+    # ping method
+    def ping(self, _=None):
+        self.pings += 1
+        if self.broken:
+            raise Exception("Connection lost")
+
+    # close method
+    def close(self):
+        self.open = 0
+
+
+# test fixture
+class ConnectionPoolTest(unittest.TestCase):
+
+    # constructor
+    # \param methodName name of the test method
+    def __init__(self, methodName):
+        unittest.TestCase.__init__(self, methodName)
+        self.connections = []
+
+    # creates a new dummy connection
+    def connect(self):
+        cn = DummyConnection()
+        self.connections.append(cn)
+        return cn
+
+    # test starter
+    # \brief Common set up
+    def setUp(self):
+        print("\nsetting up...")
+        self.connections = []
+
+    # test closer
+    # \brief Common tear down
+    def tearDown(self):
+        print("tearing down ...")
+
+    # constructor test
+    # \brief It tests default settings
+    def test_open_close(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        pool = ConnectionPool(self.connect, 3, 10, 0)
+        self.assertEqual(pool.size, 3)
+        self.assertEqual(pool.idletime, 10)
+        self.assertEqual(pool.period, 0)
+        pool.open()
+        self.assertEqual(len(self.connections), 1)
+        self.assertEqual(
+            pool.info(),
+            {"size": 3, "busy": 0, "idle": 1, "closed": False})
+        pool.close()
+        self.assertEqual(self.connections[0].open, 0)
+        self.assertEqual(pool.info()["closed"], True)
+        self.assertRaises(RuntimeError, pool.acquire)
+
+    # acquire test
+    # \brief It tests acquiring connections without pinging
+    def test_acquire_release(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        pool = ConnectionPool(self.connect, 2, 10, 0)
+        pool.open()
+        cn1 = pool.acquire()
+        self.assertTrue(cn1 is self.connections[0])
+        cn2 = pool.acquire()
+        self.assertTrue(cn2 is self.connections[1])
+        self.assertEqual(pool.info()["busy"], 2)
+        pool.release(cn1)
+        cn3 = pool.acquire()
+        self.assertTrue(cn3 is cn1)
+        pool.release(cn2)
+        pool.release(cn3)
+        self.assertEqual(len(self.connections), 2)
+        self.assertEqual(sum(cn.pings for cn in self.connections), 0)
+        self.assertEqual(pool.info()["idle"], 2)
+        pool.close()
+
+    # acquire test
+    # \brief It tests waiting for a free connection
+    def test_acquire_wait(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        pool = ConnectionPool(self.connect, 1, 10, 0)
+        pool.open()
+        cn1 = pool.acquire()
+        acquired = []
+
+        def take():
+            with pool.connection() as cn:
+                acquired.append(cn)
+
+        th = threading.Thread(target=take)
+        th.start()
+        time.sleep(0.1)
+        self.assertEqual(acquired, [])
+        pool.release(cn1)
+        th.join()
+        self.assertEqual(acquired, [cn1])
+        self.assertEqual(len(self.connections), 1)
+        pool.close()
+
+    # connection test
+    # \brief It tests connections closed by an error
+    def test_connection_error(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        pool = ConnectionPool(self.connect, 2, 10, 0)
+        pool.open()
+        try:
+            with pool.connection() as cn:
+                cn.broken = True
+                raise ValueError("lost")
+        except ValueError:
+            pass
+        self.assertEqual(self.connections[0].open, 0)
+        self.assertEqual(pool.info()["idle"], 0)
+        with pool.connection() as cn:
+            self.assertTrue(cn is self.connections[1])
+        pool.close()
+
+    # check test
+    # \brief It tests health checks
+    def test_check(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        pool = ConnectionPool(self.connect, 3, 0.05, 0)
+        pool.open()
+        cn1 = pool.acquire()
+        cn2 = pool.acquire()
+        cn3 = pool.acquire()
+        pool.release(cn1)
+        pool.release(cn2)
+        pool.release(cn3)
+        time.sleep(0.1)
+        pool.check()
+        self.assertEqual(pool.info()["idle"], 1)
+        self.assertEqual([cn.open for cn in self.connections], [1, 0, 0])
+
+        cn1.broken = True
+        pool.check()
+        self.assertEqual(cn1.open, 0)
+        self.assertEqual(len(self.connections), 4)
+        self.assertEqual(pool.info()["idle"], 1)
+        with pool.connection() as cn:
+            self.assertTrue(cn is self.connections[3])
+        pool.close()
+
+    # check test
+    # \brief It tests the health checker thread
+    def test_checker_thread(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        pool = ConnectionPool(self.connect, 2, 10, 0.01)
+        pool.open()
+        time.sleep(0.2)
+        self.assertTrue(self.connections[0].pings > 0)
+        pool.close()
+        self.assertEqual(self.connections[0].open, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
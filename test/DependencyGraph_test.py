@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file DependencyGraphTest.py
+# unittests for DependencyGraph class
+#
+import unittest
+import sys
+
+from nxsconfigserver.DependencyGraph import DependencyGraph
+
+
+# test fixture
+class DependencyGraphTest(unittest.TestCase):
+
+    # constructor
+    # \param methodName name of the test method
+    def __init__(self, methodName):
+        unittest.TestCase.__init__(self, methodName)
+
+    # test starter
+    # \brief Common set up
+    def setUp(self):
+        print("\nsetting up...")
+
+    # test closer
+    # \brief Common tear down
+    def tearDown(self):
+        print("tearing down ...")
+
+    # constructor test
+    # \brief It tests default settings
+    def test_init(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        gr = DependencyGraph()
+        self.assertEqual(gr.revision, None)
+        self.assertEqual(gr.complete, False)
+        self.assertEqual(gr.names(), [])
+        self.assertEqual(
+            gr.toDict(),
+            {"revision": None, "components": {}, "datasources": {}})
+
+    # set test
+    # \brief It tests references and reverse references
+    def test_set_remove(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        gr = DependencyGraph()
+        gr.set("a", ["b", "c", "b"], ["ds1", "ds2"], ["v1"])
+        gr.set("b", ["c"], ["ds1"], [])
+        gr.set("c", [], [], ["v1", "v2"])
+        self.assertEqual(sorted(gr.names()), ["a", "b", "c"])
+        self.assertEqual(gr.references("a"), ["b", "c"])
+        self.assertEqual(gr.references("a", "datasources"), ["ds1", "ds2"])
+        self.assertEqual(gr.references("c", "variables"), ["v1", "v2"])
+        self.assertEqual(gr.references("d"), [])
+        self.assertEqual(gr.users("c"), ["a", "b"])
+        self.assertEqual(gr.users("ds1", "datasources"), ["a", "b"])
+        self.assertEqual(gr.users("ds2", "datasources"), ["a"])
+        self.assertEqual(gr.users("v1", "variables"), ["a", "c"])
+        self.assertEqual(gr.missing(["c", "d", "e", "d"]), ["d", "e"])
+
+        gr.set("a", ["c"], [], [])
+        self.assertEqual(gr.users("b"), [])
+        self.assertEqual(gr.users("ds1", "datasources"), ["b"])
+        self.assertEqual(gr.users("ds2", "datasources"), [])
+
+        gr.remove("b")
+        gr.remove("d")
+        self.assertEqual(sorted(gr.names()), ["a", "c"])
+        self.assertEqual(gr.users("c"), ["a"])
+        self.assertEqual(gr.users("ds1", "datasources"), [])
+
+    # closure test
+    # \brief It tests dependent components
+    def test_closure(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        gr = DependencyGraph()
+        gr.set("a", ["b", "c"], [], [])
+        gr.set("b", ["d"], [], [])
+        gr.set("c", ["d", "a"], [], [])
+        gr.set("d", [], [], [])
+        gr.set("e", ["a"], [], [])
+        self.assertEqual(gr.closure(["a"]), ["a", "b", "c", "d"])
+        self.assertEqual(gr.closure(["d", "d"]), ["d"])
+        self.assertEqual(
+            gr.closure(["e", "x"]), ["e", "x", "a", "b", "c", "d"])
+        self.assertEqual(gr.closure([]), [])
+
+    # revision test
+    # \brief It tests validate and follow
+    def test_revision(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        gr = DependencyGraph()
+        gr.validate("3")
+        gr.set("a", ["b"], [], [])
+        gr.complete = True
+        gr.validate("3")
+        self.assertEqual(gr.names(), ["a"])
+        self.assertTrue(gr.follow("3", "4"))
+        self.assertEqual(gr.revision, "4")
+        self.assertTrue(gr.follow("4", "4"))
+        self.assertEqual(gr.names(), ["a"])
+        self.assertEqual(gr.complete, True)
+
+        self.assertTrue(not gr.follow("4", "6"))
+        self.assertEqual(gr.revision, "6")
+        self.assertEqual(gr.names(), [])
+        self.assertEqual(gr.complete, False)
+
+        gr.set("a", ["b"], [], [])
+        self.assertTrue(not gr.follow("5", "6"))
+        self.assertEqual(gr.names(), [])
+        gr.set("a", ["b"], [], [])
+        self.assertTrue(not gr.follow("6", None))
+        self.assertEqual(gr.revision, None)
+        self.assertEqual(gr.names(), [])
+
+        gr.set("a", ["b"], [], [])
+        gr.validate("7")
+        self.assertEqual(gr.revision, "7")
+        self.assertEqual(gr.names(), [])
+
+    # toDict test
+    # \brief It tests the graph dictionary
+    def test_toDict(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        gr = DependencyGraph()
+        gr.validate("12")
+        gr.set("a", ["b"], ["ds1"], ["v1"])
+        gr.set("b", [], ["ds1", "ds2"], [])
+        gr.set("c", [], ["ds2"], ["v2"])
+        self.assertEqual(
+            gr.toDict(["a"]),
+            {"revision": "12",
+             "components": {
+                 "a": {"components": ["b"], "datasources": ["ds1"],
+                       "variables": ["v1"], "usedby": []},
+                 "b": {"components": [], "datasources": ["ds1", "ds2"],
+                       "variables": [], "usedby": ["a"]}},
+             "datasources": {"ds1": ["a", "b"], "ds2": ["b", "c"]}})
+        dct = gr.toDict()
+        self.assertEqual(sorted(dct["components"].keys()), ["a", "b", "c"])
+        self.assertEqual(
+            dct["components"]["c"],
+            {"components": [], "datasources": ["ds2"],
+             "variables": ["v2"], "usedby": []})
+
+
+if __name__ == '__main__':
+    unittest.main()
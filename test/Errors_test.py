@@ -29,7 +29,8 @@ import sys
 
 
 from nxsconfigserver.Errors import (
-    IncompatibleNodeError, UndefinedTagError, NonregisteredDBRecordError)
+    IncompatibleNodeError, UndefinedTagError, NonregisteredDBRecordError,
+    CyclicDependencyError)
 
 
 if sys.version_info > (3,):
@@ -110,6 +111,14 @@ class ErrorsTest(unittest.TestCase):
         err = NonregisteredDBRecordError()
         self.assertTrue(isinstance(err, Exception))
 
+    # CyclicDependencyError test
+    # \brief It tests default settings
+    def test_CyclicDependencyError(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        err = CyclicDependencyError()
+        self.assertTrue(isinstance(err, Exception))
+
 
 if __name__ == '__main__':
     unittest.main()
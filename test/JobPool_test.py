@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file JobPoolTest.py
+# unittests for JobPool class
+#
+import unittest
+import sys
+import threading
+import time
+
+from nxsconfigserver.JobPool import JobPool
+
+
+# test fixture
+class JobPoolTest(unittest.TestCase):
+
+    # constructor
+    # \param methodName name of the test method
+    def __init__(self, methodName):
+        unittest.TestCase.__init__(self, methodName)
+
+    # test starter
+    # \brief Common set up
+    def setUp(self):
+        print("\nsetting up...")
+
+    # test closer
+    # \brief Common tear down
+    def tearDown(self):
+        print("tearing down ...")
+
+    # waits until the job is finished
+    # \param pool job pool
+    # \param jid job id
+    def wait(self, pool, jid):
+        for _ in range(1000):
+            if pool.state(jid) in [JobPool.DONE, JobPool.FAILED]:
+                return
+            time.sleep(0.01)
+
+    # failing job
+    def failing(self, message):
+        raise ValueError(message)
+
+    # constructor test
+    # \brief It tests default settings
+    def test_open_close(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        pool = JobPool(2, 10)
+        self.assertEqual(pool.size, 2)
+        self.assertEqual(pool.maxjobs, 10)
+        self.assertRaises(RuntimeError, pool.submit, len, "abc")
+        pool.open()
+        self.assertEqual(
+            pool.info(),
+            {"size": 2, "queued": 0, "running": 0, "finished": 0,
+             "evicted": 0, "closed": False})
+        pool.close()
+        self.assertEqual(pool.info()["closed"], True)
+        self.assertRaises(RuntimeError, pool.submit, len, "abc")
+
+    # submit test
+    # \brief It tests job results
+    def test_submit_result(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        pool = JobPool()
+        pool.open()
+        jid = pool.submit(len, "abc")
+        jid2 = pool.submit(self.failing, "wrong")
+        self.assertTrue(jid != jid2)
+        self.wait(pool, jid)
+        self.wait(pool, jid2)
+        self.assertEqual(pool.state(jid), JobPool.DONE)
+        self.assertEqual(pool.state(jid2), JobPool.FAILED)
+        self.assertEqual(pool.info()["finished"], 2)
+        self.assertEqual(pool.result(jid), 3)
+        self.assertRaises(ValueError, pool.state, jid)
+        self.assertRaises(ValueError, pool.result, jid)
+        error = None
+        try:
+            pool.result(jid2)
+        except ValueError as e:
+            error = str(e)
+        self.assertEqual(error, "wrong")
+        self.assertEqual(pool.info()["finished"], 0)
+        self.assertRaises(ValueError, pool.state, "unknown")
+        pool.close()
+
+    # state test
+    # \brief It tests states of queued and running jobs
+    def test_state(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        pool = JobPool(1)
+        pool.open()
+        event = threading.Event()
+        jid = pool.submit(event.wait)
+        jid2 = pool.submit(len, "ab")
+        for _ in range(1000):
+            if pool.state(jid) == JobPool.RUNNING:
+                break
+            time.sleep(0.01)
+        self.assertEqual(pool.state(jid), JobPool.RUNNING)
+        self.assertEqual(pool.state(jid2), JobPool.QUEUED)
+        self.assertEqual(pool.info()["running"], 1)
+        self.assertEqual(pool.info()["queued"], 1)
+        self.assertRaises(RuntimeError, pool.result, jid)
+        self.assertRaises(RuntimeError, pool.result, jid2)
+        event.set()
+        self.wait(pool, jid2)
+        self.assertEqual(pool.result(jid2), 2)
+        self.assertEqual(pool.result(jid), True)
+        pool.close()
+
+    # close test
+    # \brief It tests closing the pool with queued jobs
+    def test_close_queued(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        pool = JobPool(1)
+        pool.open()
+        event = threading.Event()
+        jid = pool.submit(event.wait)
+        jid2 = pool.submit(len, "ab")
+        for _ in range(1000):
+            if pool.state(jid) == JobPool.RUNNING:
+                break
+            time.sleep(0.01)
+        pool.close(False)
+        self.assertEqual(pool.state(jid2), JobPool.FAILED)
+        self.assertRaises(RuntimeError, pool.result, jid2)
+        event.set()
+        self.wait(pool, jid)
+        self.assertEqual(pool.result(jid), True)
+
+        pool.open()
+        jid = pool.submit(len, "abc")
+        self.wait(pool, jid)
+        self.assertEqual(pool.result(jid), 3)
+        pool.close()
+
+    # maxjobs test
+    # \brief It tests forgetting the oldest finished jobs
+    def test_maxjobs(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        pool = JobPool(1, 2)
+        pool.open()
+        jids = [pool.submit(len, "a" * i) for i in range(4)]
+        self.wait(pool, jids[-1])
+        self.assertEqual(pool.info()["finished"], 2)
+        self.assertEqual(pool.info()["evicted"], 2)
+        self.assertEqual(pool.state(jids[0]), JobPool.EVICTED)
+        self.assertEqual(pool.state(jids[1]), JobPool.EVICTED)
+        self.assertRaises(RuntimeError, pool.result, jids[0])
+        self.assertRaises(ValueError, pool.state, "unknown")
+        self.assertEqual(pool.result(jids[2]), 2)
+        self.assertEqual(pool.result(jids[3]), 3)
+
+        jids = [pool.submit(len, "a" * i) for i in range(25)]
+        self.wait(pool, jids[-1])
+        self.assertEqual(pool.info()["evicted"], 20)
+        self.assertRaises(ValueError, pool.state, jids[0])
+        self.assertEqual(pool.state(jids[22]), JobPool.EVICTED)
+        pool.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -412,6 +412,77 @@ class MYSQLDataBaseTest(unittest.TestCase):
         self.assertEqual(long(el.version()), self.version + 4)
         self.assertEqual(el.close(), None)
 
+    # component test
+    # \brief It tests bulk fetching of components
+    def test_components_bulk(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        el = MYSQLDataBase()
+        self.connect(el)
+        avc = el.availableComponents()
+        name = "mcs_test_component"
+        while name in avc:
+            name = name + '_1'
+        names = ["%s_%s" % (name, i) for i in range(7)]
+        xmls = ["<?xml version='1.0'?><definition><group type='NX%s'/>"
+                "</definition>" % i for i in range(7)]
+        for i, nm in enumerate(names):
+            self.assertEqual(el.storeComponent(nm, xmls[i]), None)
+            self.__cmps.append(nm)
+
+        el.maxNames = 3
+        order = [6, 0, 3, 3, 5, 1, 2, 4, 0]
+        cpx = el.components([names[i] for i in order])
+        self.assertEqual(cpx, [xmls[i] for i in order])
+        self.assertEqual(el.components([]), [])
+
+        self.myAssertRaise(
+            NonregisteredDBRecordError, el.components,
+            [names[1], name + "_missing", names[2]])
+
+        for nm in names:
+            self.assertEqual(el.deleteComponent(nm), None)
+            self.__cmps.pop(0)
+        self.assertEqual(el.close(), None)
+
+    # component test
+    # \brief It tests caching of components
+    def test_components_cache(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        el = MYSQLDataBase()
+        self.connect(el)
+        avc = el.availableComponents()
+        name = "mcs_test_component"
+        while name in avc:
+            name = name + '_1'
+        xml = "<?xml version='1.0'?><definition><group type='NXentry'/>" \
+              + "</definition>"
+        xml2 = "<?xml version='1.0'?><definition><group type='NXentry2'/>" \
+               + "</definition>"
+        self.assertEqual(el.storeComponent(name, xml), None)
+        self.__cmps.append(name)
+
+        info = el.cacheInfo()
+        self.assertEqual(el.components([name]), [xml])
+        self.assertEqual(el.components([name, name]), [xml, xml])
+        info2 = el.cacheInfo()
+        self.assertEqual(info2["hits"], info["hits"] + 1)
+        self.assertEqual(info2["misses"], info["misses"] + 1)
+        self.assertEqual(info2["revision"], el.version())
+
+        self.assertEqual(el.storeComponent(name, xml2), None)
+        self.assertEqual(el.components([name]), [xml2])
+        info3 = el.cacheInfo()
+        self.assertEqual(info3["misses"], info2["misses"] + 1)
+        self.assertEqual(info3["items"], 1)
+
+        self.assertEqual(el.deleteComponent(name), None)
+        self.__cmps.pop()
+        self.myAssertRaise(
+            NonregisteredDBRecordError, el.components, [name])
+        self.assertEqual(el.close(), None)
+
     # selection test
     # \brief It tests default settings
     def test_available_sel(self):
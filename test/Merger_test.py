@@ -24,6 +24,11 @@ import unittest
 import sys
 import struct
 
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml.etree import XMLParser
+from xml.etree import ElementTree as et
+
 from nxsconfigserver.Merger import (
     Merger, UndefinedTagError, IncompatibleNodeError)
 try:
@@ -124,7 +129,7 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(el.collect(["<definition/>"]), None)
         self.assertEqual(
             el.toString().replace("?>\n<", "?><"),
-            "<?xml version='1.0' encoding='utf8'?><definition />")
+            "<?xml version='1.0' encoding='utf8'?><definition/>")
 
     # test collect
     # \brief It tests default settings
@@ -150,7 +155,7 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" />'
+            '<definition><group type="NXentry"/>'
             '</definition>')
 
     # test collect
@@ -168,11 +173,11 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
             '<definition>'
-            '<group type="NXentry" />'
-            '<group type="NXentry" />'
-            '<group type="NXentry" />'
-            '<group type="NXentry" />'
-            '<group type="NXentry" />'
+            '<group type="NXentry"/>'
+            '<group type="NXentry"/>'
+            '<group type="NXentry"/>'
+            '<group type="NXentry"/>'
+            '<group type="NXentry"/>'
             '</definition>')
 
     # test collect
@@ -189,8 +194,8 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" />'
-            '<group type="NXentry2" /></definition>')
+            '<definition><group type="NXentry"/>'
+            '<group type="NXentry2"/></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -229,9 +234,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
             '<definition><group type="NXentry">'
-            '<field type="field" /></group><group type="NXentry">'
-            '<field type="field" /></group><group type="NXentry">'
-            '<field type="field" /></group></definition>')
+            '<field type="field"/></group><group type="NXentry">'
+            '<field type="field"/></group><group type="NXentry">'
+            '<field type="field"/></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -250,9 +255,165 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
             '<definition><group type="NXentry">'
-            '<field name="field1" /></group>'
-            '<group type="NXentry2" />'
-            '<field name="field1" /></definition>')
+            '<field name="field1"/></group>'
+            '<group type="NXentry2"/>'
+            '<field name="field1"/></definition>')
+
+    # test collect
+    # \brief It tests collecting of parsed trees
+    def test_collect_element(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        el = Merger()
+        self.assertEqual(el.root, None)
+        root = et.fromstring(
+            "<definition><group type='NXentry' name='entry'/>"
+            "<group type='NXentry' name='entry'><field name='field1'/>"
+            "</group></definition>", parser=XMLParser(collect_ids=False))
+        self.assertEqual(
+            el.collect(
+                [root, None, "",
+                 "<definition><field name='field2'/></definition>"]),
+            None)
+        self.assertTrue(el.root is root)
+        self.assertEqual(el.merge(), None)
+        self.assertTrue(el.root is root)
+        self.assertEqual(
+            el.toString().replace("?>\n<", "?><"),
+            '<?xml version=\'1.0\' encoding=\'utf8\'?>'
+            '<definition><group type="NXentry" name="entry">'
+            '<field name="field1"/></group>'
+            '<field name="field2"/></definition>')
+
+    # test add
+    # \brief It tests adding components to the not finalized tree
+    def test_add_incremental(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        comps = [
+            "<definition><group name='entry' type='NXentry'>"
+            "<field name='f1'><datasource name='ds1'/>"
+            "<strategy mode='INIT'/></field>"
+            "<group name='transformations' type='NXtransformations'/>"
+            "</group></definition>",
+            "<definition><group name='entry' type='NXentry'>"
+            "<field name='f1'><datasource name='ds1'/>"
+            "<strategy mode='INIT'/></field>"
+            "<group name='transformations' type='NXtransformations'>"
+            "<field name='f2'/></group></group></definition>",
+        ]
+        expected = \
+            '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>' \
+            '<group name="entry" type="NXentry">' \
+            '<field name="f1"><datasource name="ds1"/>' \
+            '<strategy mode="STEP"/></field>' \
+            '<group name="transformations" type="NXtransformations">' \
+            '<field name="f2"/></group>' \
+            '<group type="NXdata" name="data">' \
+            '<link target="/entry:NXentry/f1" name="ds1"/>' \
+            '</group></group></definition>'
+
+        el = Merger()
+        el.switchdatasources = ['ds1']
+        el.linkdatasources = ['ds1']
+        self.assertEqual(el.collect(comps[:1]), None)
+        self.assertEqual(el.merge(finalize=False), None)
+        root = el.root
+
+        el = Merger()
+        el.switchdatasources = ['ds1']
+        el.linkdatasources = ['ds1']
+        self.assertEqual(el.collect([root], merged=True), None)
+        self.assertEqual(el.add(comps[1:]), None)
+        self.assertEqual(el.merge(), None)
+        self.assertEqual(el.toString().replace("?>\n<", "?><"), expected)
+
+        el = Merger()
+        el.switchdatasources = ['ds1']
+        el.linkdatasources = ['ds1']
+        self.assertEqual(el.collect(comps), None)
+        self.assertEqual(el.merge(), None)
+        self.assertEqual(el.toString().replace("?>\n<", "?><"), expected)
+
+        el = Merger()
+        el.switchdatasources = ['ds1']
+        self.assertEqual(el.collect(comps[:1]), None)
+        self.assertEqual(el.merge(), None)
+        self.assertEqual(el.add(comps[1:]), None)
+        self.myAssertRaise(IncompatibleNodeError, el.merge)
+
+    # test merge
+    # \brief It tests merging subtrees in worker processes
+    def test_merge_parallel(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        comps = []
+        for entry in range(3):
+            for det in range(3):
+                comps.append(
+                    "<definition><group type='NXentry' name='entry%s'>"
+                    "<group type='NXinstrument' name='instrument'>"
+                    "<group type='NXdetector' name='det%s'>%s</group>"
+                    "</group></group>text%s</definition>" % (
+                        entry, det,
+                        "".join("<field name='f%s'>$datasources.ds%s"
+                                "<strategy mode='INIT'/></field>\n"
+                                % (fl, fl) for fl in range(det + 2)),
+                        entry))
+        comps.append(
+            "<definition><group type='NXentry' name='entry1'>"
+            "<group type='NXinstrument' name='instrument' "
+            "xmlns:ns='http://nexdatas'><field name='ns:f1'/></group>"
+            "</group></definition>")
+        wrong = [
+            "<definition><group type='NXentry' name='entry0'>"
+            "<field name='f1'><strategy mode='INIT'/></field></group>"
+            "</definition>",
+            "<definition><group type='NXentry' name='entry0'>"
+            "<field name='f1'><strategy mode='STEP'/></field></group>"
+            "<group type='NXentry' name='entry1'><definition/></group>"
+            "</definition>"]
+
+        el = Merger()
+        el.switchdatasources = ['ds1']
+        el.linkdatasources = ['ds0', 'ds2']
+        el.collect(comps)
+        el.merge()
+        expected = el.toString()
+        el.collect(wrong)
+        try:
+            el.merge()
+        except IncompatibleNodeError as e:
+            error = e.value
+
+        executor = ProcessPoolExecutor(2)
+        try:
+            for tasksize in [1, 3, 2000]:
+                el = Merger()
+                el.switchdatasources = ['ds1']
+                el.linkdatasources = ['ds0', 'ds2']
+                el.executor = executor
+                el.tasksize = tasksize
+                el.collect(comps)
+                self.assertEqual(el.merge(), None)
+                self.assertEqual(el.toString(), expected)
+
+                el.collect(wrong)
+                try:
+                    el.merge()
+                    value = None
+                except IncompatibleNodeError as e:
+                    value = e.value
+                    self.assertEqual(len(e.nodes), 2)
+                    for node in e.nodes:
+                        self.assertTrue(
+                            node.getroottree().getroot() is el.root)
+                self.assertEqual(value, error)
+        finally:
+            executor.shutdown()
 
     # test collect
     # \brief It tests default settings
@@ -287,7 +448,7 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(el.merge(), None)
         self.assertEqual(
             el.toString().replace("?>\n<", "?><"),
-            '<?xml version=\'1.0\' encoding=\'utf8\'?><definition />')
+            '<?xml version=\'1.0\' encoding=\'utf8\'?><definition/>')
 
     # test collect
     # \brief It tests default settings
@@ -304,7 +465,7 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" />'
+            '<definition><group type="NXentry"/>'
             '</definition>')
 
     # test collect
@@ -323,7 +484,7 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(el.merge(), None)
         self.assertEqual(el.toString().replace("?>\n<", "?><"),
                          '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-                         '<definition />')
+                         '<definition/>')
 
     # test collect
     # \brief It tests default settings
@@ -340,7 +501,7 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(el.merge(), None)
         self.assertEqual(el.toString().replace("?>\n<", "?><"),
                          '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-                         '<definition />')
+                         '<definition/>')
 
     # test collect
     # \brief It tests default settings
@@ -358,7 +519,7 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" />'
+            '<definition><group type="NXentry"/>'
             '</definition>')
 
     # test collect
@@ -379,7 +540,7 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
             '<definition><group type="NXentry">'
-            '<group /></group></definition>')
+            '<group/></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -397,7 +558,7 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(el.merge(), None)
         self.assertEqual(el.toString().replace("?>\n<", "?><"),
                          '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-                         '<definition />')
+                         '<definition/>')
 
     # test collect
     # \brief It tests default settings
@@ -417,7 +578,7 @@ class MergerTest(unittest.TestCase):
             self,
             el.toString(),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group name="entry2" type="NXentry" /></definition>')
+            '<group name="entry2" type="NXentry"/></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -439,7 +600,7 @@ class MergerTest(unittest.TestCase):
             self,
             el.toString(),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group attr="ble ble" name="entry" type="NXentry" />'
+            '<group attr="ble ble" name="entry" type="NXentry"/>'
             '</definition>')
 
     # test collect
@@ -462,7 +623,7 @@ class MergerTest(unittest.TestCase):
             el.toString(),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
             '<definition>'
-            '<group name="entry2" type="NXentry" /></definition>')
+            '<group name="entry2" type="NXentry"/></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -484,7 +645,7 @@ class MergerTest(unittest.TestCase):
             el.toString(),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry2" type="NXentry">'
-            '<group type="NXtransformations" /></group></definition>')
+            '<group type="NXtransformations"/></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -505,7 +666,7 @@ class MergerTest(unittest.TestCase):
             self,
             el.toString(),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group name="entry2" type="NXentry" /></definition>')
+            '<definition><group name="entry2" type="NXentry"/></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -527,7 +688,7 @@ class MergerTest(unittest.TestCase):
             el.toString(),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
             '<definition><group name="entry2" type="NXentry">'
-            '<group name="transformations2" type="NXtransformations" />'
+            '<group name="transformations2" type="NXtransformations"/>'
             '</group></definition>')
 
     # test collect
@@ -546,7 +707,7 @@ class MergerTest(unittest.TestCase):
             self,
             el.toString(),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" />'
+            '<definition><group type="NXentry"/>'
             '</definition>')
 
     # test collect
@@ -564,8 +725,8 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" />'
-            '<group type="NXentry2" /></definition>')
+            '<definition><group type="NXentry"/>'
+            '<group type="NXentry2"/></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -582,7 +743,7 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group name="entry" type="NXentry2" /></definition>')
+            '<group name="entry" type="NXentry2"/></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -600,7 +761,7 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group name="entry" type="NXentry" /></definition>')
+            '<definition><group name="entry" type="NXentry"/></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -618,8 +779,8 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group name="entry2" />'
-            '<group name="entry" type="NXentry" /></definition>')
+            '<definition><group name="entry2"/>'
+            '<group name="entry" type="NXentry"/></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -637,7 +798,7 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
             '<definition><group type="NXentry">'
-            '<field type="field" /></group></definition>')
+            '<field type="field"/></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -655,7 +816,7 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
             '<definition><group type="NXentry">'
-            '<field type="field" /></group></definition>')
+            '<field type="field"/></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -675,7 +836,7 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry">'
-            '<field type="field" /></group>'
+            '<field type="field"/></group>'
             '</definition>')
 
     # test collect
@@ -711,9 +872,9 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group name="entry" type="NXentry"><field type="field" />'
+            '<group name="entry" type="NXentry"><field type="field"/>'
             '</group><group name="entry2" type="NXentry2">'
-            '<field type="field" /></group></definition>')
+            '<field type="field"/></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -750,8 +911,8 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
             '<definition><group type="NXentry">'
-            '<field type="field" /></group><group type="NXentry2">'
-            '<field type="field" /></group></definition>')
+            '<field type="field"/></group><group type="NXentry2">'
+            '<field type="field"/></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -857,7 +1018,7 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group name="entry" type="NXentry"><field type="field" />'
+            '<group name="entry" type="NXentry"><field type="field"/>'
             '</group></definition>')
 
     # test collect
@@ -910,12 +1071,12 @@ class MergerTest(unittest.TestCase):
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'/></group></definition>",
                  "<definition><group  name='entry' type='NXentry'>"
-                 "<field /></group></definition>"]), None)
+                 "<field/></group></definition>"]), None)
         self.assertEqual(el.merge(), None)
         self.assertEqual(
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group name="entry" type="NXentry"><field type="field" />'
+            '<group name="entry" type="NXentry"><field type="field"/>'
             '</group></definition>')
 
     # test collect
@@ -943,7 +1104,7 @@ class MergerTest(unittest.TestCase):
                 ["<definition><group name='entry' type='NXentry'>"
                  "<field type='field'/></group></definition>",
                  "<definition><group  name='entry' type='NXentry'>"
-                 "<field /></group></definition>"]), None)
+                 "<field/></group></definition>"]), None)
         self.myAssertRaise(IncompatibleNodeError, el.merge)
 
     # test collect
@@ -961,7 +1122,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds1'/>"
                  "<strategy mode='INIT'/></attribute></group></definition>"]),
@@ -971,9 +1132,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy mode="INIT" /></field>'
-            '<attribute type="field2"><datasource name="ds1" />'
-            '<strategy mode="INIT" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy mode="INIT"/></field>'
+            '<attribute type="field2"><datasource name="ds1"/>'
+            '<strategy mode="INIT"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -987,7 +1148,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy mode='FINAL'/></attribute></group>"
@@ -997,9 +1158,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy mode="STEP" />'
-            '</field><attribute type="field2"><datasource name="ds2" />'
-            '<strategy mode="FINAL" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy mode="STEP"/>'
+            '</field><attribute type="field2"><datasource name="ds2"/>'
+            '<strategy mode="FINAL"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1013,7 +1174,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy mode='FINAL'/></attribute></group></definition>"]),
@@ -1023,9 +1184,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy mode="INIT" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy mode="STEP" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy mode="INIT"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy mode="STEP"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1039,7 +1200,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds1'/>"
                  "<strategy mode='FINAL'/></attribute></group></definition>"]),
@@ -1049,9 +1210,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy mode="STEP" /></field>'
-            '<attribute type="field2"><datasource name="ds1" />'
-            '<strategy mode="STEP" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy mode="STEP"/></field>'
+            '<attribute type="field2"><datasource name="ds1"/>'
+            '<strategy mode="STEP"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1067,7 +1228,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy mode='FINAL'/></attribute></group>"
@@ -1077,9 +1238,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy mode="STEP" />'
-            '</field><attribute type="field2"><datasource name="ds2" />'
-            '<strategy mode="STEP" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy mode="STEP"/>'
+            '</field><attribute type="field2"><datasource name="ds2"/>'
+            '<strategy mode="STEP"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1095,7 +1256,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy mode='FINAL'/></attribute></group></definition>"]),
@@ -1105,9 +1266,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy mode="INIT" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy mode="FINAL" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy mode="INIT"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy mode="FINAL"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1123,7 +1284,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy mode='FINAL'/></attribute></group></definition>"]),
@@ -1133,9 +1294,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy mode="STEP" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy mode="FINAL" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy mode="STEP"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy mode="FINAL"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1151,7 +1312,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy mode='FINAL'/></attribute></group></definition>"]),
@@ -1161,9 +1322,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
             '<definition><group name="entry" type="NXentry">'
-            '<field type="field"><datasource name="ds1" />'
-            '<strategy mode="INIT" /></field><attribute type="field2">'
-            '<datasource name="ds2" /><strategy mode="FINAL" /></attribute>'
+            '<field type="field"><datasource name="ds1"/>'
+            '<strategy mode="INIT"/></field><attribute type="field2">'
+            '<datasource name="ds2"/><strategy mode="FINAL"/></attribute>'
             '</group></definition>')
 
     # test collect
@@ -1180,7 +1341,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy mode='FINAL'/></attribute></group></definition>"]),
@@ -1190,9 +1351,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy mode="STEP" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy mode="FINAL" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy mode="STEP"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy mode="FINAL"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1208,7 +1369,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy mode='FINAL'/></attribute></group></definition>"]),
@@ -1218,9 +1379,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy mode="INIT" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy mode="STEP" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy mode="INIT"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy mode="STEP"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1236,7 +1397,7 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
-                 "<field type='field'>$datasources.ds1<strategy mode='INIT' />"
+                 "<field type='field'>$datasources.ds1<strategy mode='INIT'/>"
                  "</field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'>$datasources.ds1"
@@ -1247,9 +1408,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy mode="INIT" /></field>'
+            '$datasources.ds1<strategy mode="INIT"/></field>'
             '<attribute type="field2">$datasources.ds1'
-            '<strategy mode="INIT" /></attribute></group></definition>')
+            '<strategy mode="INIT"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1263,7 +1424,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'>$datasources.ds1"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy mode='FINAL'/></attribute></group></definition>"]),
@@ -1273,9 +1434,36 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy mode="STEP" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy mode="FINAL" /></attribute></group></definition>')
+            '$datasources.ds1<strategy mode="STEP"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy mode="FINAL"/></attribute></group></definition>')
+
+    # test collect
+    # \brief It tests switching of adjacent text datasources
+    def test_switch_stepdatasources_step_adjacent_var(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        el = Merger()
+        el.switchdatasources = ['ds%s' % i for i in range(1000, 0, -1)]
+        el.canfaildatasources = ('ds3',)
+        self.assertEqual(
+            el.collect(
+                ["<definition><group  name='entry' type='NXentry'>"
+                 "<field name='f1'>$datasources.ds$datasources.ds2"
+                 "<strategy mode='INIT'/></field>"
+                 "<field name='f2'>$datasources.ds0 $datasources.ds3"
+                 "<strategy mode='FINAL'/></field></group></definition>"]),
+            None)
+        self.assertEqual(el.merge(), None)
+        self.assertEqual(
+            el.toString().replace("?>\n<", "?><"),
+            '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
+            '<group name="entry" type="NXentry"><field name="f1">'
+            '$datasources.ds$datasources.ds2<strategy mode="STEP"/></field>'
+            '<field name="f2">$datasources.ds0 $datasources.ds3'
+            '<strategy mode="STEP" canfail="true"/></field>'
+            '</group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1288,7 +1476,7 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
-                 "<field type='field'>$datasources.ds1<strategy mode='INIT' />"
+                 "<field type='field'>$datasources.ds1<strategy mode='INIT'/>"
                  "</field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
@@ -1299,9 +1487,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy mode="INIT" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy mode="STEP" /></attribute></group></definition>')
+            '$datasources.ds1<strategy mode="INIT"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy mode="STEP"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1315,7 +1503,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'>$datasources.ds1"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'>$datasources.ds1"
                  "<strategy mode='FINAL'/></attribute></group></definition>"]),
@@ -1325,9 +1513,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy mode="STEP" /></field>'
+            '$datasources.ds1<strategy mode="STEP"/></field>'
             '<attribute type="field2">$datasources.ds1'
-            '<strategy mode="STEP" /></attribute></group></definition>')
+            '<strategy mode="STEP"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1342,7 +1530,7 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
-                 "<field type='field'>$datasources.ds1<strategy mode='INIT' />"
+                 "<field type='field'>$datasources.ds1<strategy mode='INIT'/>"
                  "</field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
@@ -1353,9 +1541,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy mode="STEP" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy mode="STEP" /></attribute></group></definition>')
+            '$datasources.ds1<strategy mode="STEP"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy mode="STEP"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1371,7 +1559,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'>$datasources.ds1"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy mode='FINAL'/></attribute></group></definition>"]),
@@ -1381,9 +1569,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy mode="INIT" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy mode="FINAL" /></attribute></group></definition>')
+            '$datasources.ds1<strategy mode="INIT"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy mode="FINAL"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1399,7 +1587,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'>$datasources.ds1"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy mode='FINAL'/></attribute></group></definition>"]),
@@ -1409,9 +1597,9 @@ class MergerTest(unittest.TestCase):
             self, el.toString(),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy mode="STEP" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy mode="FINAL" /></attribute></group></definition>')
+            '$datasources.ds1<strategy mode="STEP"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy mode="FINAL"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1427,7 +1615,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'>$datasources.ds1"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy mode='FINAL'/></attribute></group></definition>"]),
@@ -1437,9 +1625,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy mode="STEP" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy mode="POSTRUN" /></attribute></group></definition>')
+            '$datasources.ds1<strategy mode="STEP"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy mode="POSTRUN"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1454,7 +1642,7 @@ class MergerTest(unittest.TestCase):
         self.assertEqual(
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
-                 "<field type='field'>$datasources.ds1<strategy mode='INIT' />"
+                 "<field type='field'>$datasources.ds1<strategy mode='INIT'/>"
                  "</field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
@@ -1465,9 +1653,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy mode="INIT" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy mode="FINAL" /></attribute></group></definition>')
+            '$datasources.ds1<strategy mode="INIT"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy mode="FINAL"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1483,7 +1671,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'>$datasources.ds1"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy mode='FINAL'/></attribute></group></definition>"]),
@@ -1493,9 +1681,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy mode="STEP" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy mode="FINAL" /></attribute></group></definition>')
+            '$datasources.ds1<strategy mode="STEP"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy mode="FINAL"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1511,7 +1699,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'>$datasources.ds1"
-                 "<strategy mode='STEP' /></field></group></definition>",
+                 "<strategy mode='STEP'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy mode='FINAL'/></attribute></group>"
@@ -1521,9 +1709,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy mode="POSTRUN" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy mode="FINAL" /></attribute></group></definition>')
+            '$datasources.ds1<strategy mode="POSTRUN"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy mode="FINAL"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1539,7 +1727,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'>$datasources.ds1"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy mode='FINAL'/></attribute></group></definition>"]),
@@ -1550,8 +1738,8 @@ class MergerTest(unittest.TestCase):
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry">'
             '<field type="field">$datasources.ds1'
-            '<strategy mode="INIT" /></field><attribute type="field2">'
-            '<datasource name="ds2" /><strategy mode="STEP" />'
+            '<strategy mode="INIT"/></field><attribute type="field2">'
+            '<datasource name="ds2"/><strategy mode="STEP"/>'
             '</attribute></group></definition>')
 
     # test collect
@@ -1574,8 +1762,8 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><attribute type="field2">'
-            '<datasource name="ds2"><datasource name="ds1" /></datasource>'
-            '<strategy mode="STEP" /></attribute></group></definition>')
+            '<datasource name="ds2"><datasource name="ds1"/></datasource>'
+            '<strategy mode="STEP"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1597,8 +1785,8 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><attribute type="field2">'
-            '<datasource name="ds2"><datasource name="ds1" /></datasource>'
-            '<strategy mode="STEP" /></attribute></group></definition>')
+            '<datasource name="ds2"><datasource name="ds1"/></datasource>'
+            '<strategy mode="STEP"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1620,8 +1808,8 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><attribute type="field2">'
-            '<datasource name="ds2"><datasource name="ds1" /></datasource>'
-            '<strategy mode="FINAL" /></attribute></group></definition>')
+            '<datasource name="ds2"><datasource name="ds1"/></datasource>'
+            '<strategy mode="FINAL"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1643,7 +1831,7 @@ class MergerTest(unittest.TestCase):
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><attribute type="field2">'
             '<datasource name="ds2">$datasources.ds1</datasource>'
-            '<strategy mode="STEP" /></attribute></group></definition>')
+            '<strategy mode="STEP"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1665,7 +1853,7 @@ class MergerTest(unittest.TestCase):
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><attribute type="field2">'
             '<datasource name="ds2">$datasources.ds1</datasource>'
-            '<strategy mode="STEP" /></attribute></group></definition>')
+            '<strategy mode="STEP"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1687,7 +1875,7 @@ class MergerTest(unittest.TestCase):
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><attribute type="field2">'
             '<datasource name="ds2">$datasources.ds1</datasource>'
-            '<strategy mode="FINAL" /></attribute></group></definition>')
+            '<strategy mode="FINAL"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1703,7 +1891,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds1'/>"
                  "<strategy mode='INIT'/></attribute></group>"
@@ -1713,9 +1901,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy mode="INIT" /></field>'
-            '<attribute type="field2"><datasource name="ds1" />'
-            '<strategy mode="INIT" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy mode="INIT"/></field>'
+            '<attribute type="field2"><datasource name="ds1"/>'
+            '<strategy mode="INIT"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1731,7 +1919,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds1'/>"
                  "<strategy mode='INIT'/></attribute></group></definition>"]),
@@ -1741,9 +1929,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy mode="INIT" /></field>'
-            '<attribute type="field2"><datasource name="ds1" />'
-            '<strategy mode="INIT" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy mode="INIT"/></field>'
+            '<attribute type="field2"><datasource name="ds1"/>'
+            '<strategy mode="INIT"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -1759,7 +1947,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field name='myfield' type='field'><datasource name='ds1'/>"
-                 "<strategy mode='INIT' /></field></group></definition>",
+                 "<strategy mode='INIT'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds1'/>"
                  "<strategy mode='INIT'/></attribute></group>"
@@ -1769,11 +1957,11 @@ class MergerTest(unittest.TestCase):
             self, el.toString(),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry">'
-            '<field name="myfield" type="field"><datasource name="ds1" />'
-            '<strategy mode="INIT" /></field><attribute type="field2">'
-            '<datasource name="ds1" /><strategy mode="INIT" /></attribute>'
+            '<field name="myfield" type="field"><datasource name="ds1"/>'
+            '<strategy mode="INIT"/></field><attribute type="field2">'
+            '<datasource name="ds1"/><strategy mode="INIT"/></attribute>'
             '<group name="data" type="NXdata">'
-            '<link name="ds1" target="/entry:NXentry/myfield" />'
+            '<link name="ds1" target="/entry:NXentry/myfield"/>'
             '</group></group></definition>')
 
     # test collect
@@ -1790,11 +1978,11 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field name='myfield' type='field'><datasource name='ds1'/>"
-                 "<strategy mode='STEP' /></field></group></definition>",
+                 "<strategy mode='STEP'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds1'/>"
                  "<strategy mode='INIT'/></attribute>"
-                 "<group name='data' type='NXdata' />"
+                 "<group name='data' type='NXdata'/>"
                  "</group></definition>"]), None)
         self.assertEqual(el.merge(), None)
         checkxmls(
@@ -1802,11 +1990,11 @@ class MergerTest(unittest.TestCase):
             el.toString(),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry">'
-            '<field name="myfield" type="field"><datasource name="ds1" />'
-            '<strategy mode="STEP" /></field><attribute type="field2">'
-            '<datasource name="ds1" /><strategy mode="INIT" /></attribute>'
+            '<field name="myfield" type="field"><datasource name="ds1"/>'
+            '<strategy mode="STEP"/></field><attribute type="field2">'
+            '<datasource name="ds1"/><strategy mode="INIT"/></attribute>'
             '<group name="data" type="NXdata">'
-            '<link name="ds1" target="/entry:NXentry/myfield" />'
+            '<link name="ds1" target="/entry:NXentry/myfield"/>'
             '</group></group></definition>')
 
     # test collect
@@ -1824,12 +2012,12 @@ class MergerTest(unittest.TestCase):
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<group  name='instrument' type='NXinstrument'>"
                  "<field name='myfield' type='field'><datasource name='ds2'/>"
-                 "<strategy mode='STEP' /></field></group></group>"
+                 "<strategy mode='STEP'/></field></group></group>"
                  "</definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<field name='mf' type='field2'><datasource name='ds1'/>"
                  "<strategy mode='INIT'/></field>"
-                 "<group name='data' type='NXdata' /></group></definition>"]),
+                 "<group name='data' type='NXdata'/></group></definition>"]),
             None)
         self.assertEqual(el.merge(), None)
         checkxmls(
@@ -1838,12 +2026,12 @@ class MergerTest(unittest.TestCase):
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry">'
             '<group name="instrument" type="NXinstrument">'
-            '<field name="myfield" type="field"><datasource name="ds2" />'
-            '<strategy mode="STEP" /></field></group>'
-            '<field name="mf" type="field2"><datasource name="ds1" />'
-            '<strategy mode="INIT" /></field>'
+            '<field name="myfield" type="field"><datasource name="ds2"/>'
+            '<strategy mode="STEP"/></field></group>'
+            '<field name="mf" type="field2"><datasource name="ds1"/>'
+            '<strategy mode="INIT"/></field>'
             '<group name="data" type="NXdata">'
-            '<link name="ds1" target="/entry:NXentry/mf" />'
+            '<link name="ds1" target="/entry:NXentry/mf"/>'
             '</group></group></definition>')
 
     # test collect
@@ -1861,12 +2049,12 @@ class MergerTest(unittest.TestCase):
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<group  name='instrument' type='NXinstrument'>"
                  "<field name='myfield' type='field'>"
-                 "<datasource name='ds2'/><strategy mode='STEP' />"
+                 "<datasource name='ds2'/><strategy mode='STEP'/>"
                  "</field></group></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<field name='mf' type='field2'><datasource name='ds1'/>"
                  "<strategy mode='INIT'/></field>"
-                 "<group name='data' type='NXdata' /></group></definition>"]),
+                 "<group name='data' type='NXdata'/></group></definition>"]),
             None)
         self.assertEqual(el.merge(), None)
         checkxmls(
@@ -1875,14 +2063,14 @@ class MergerTest(unittest.TestCase):
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry">'
             '<group name="instrument" type="NXinstrument">'
-            '<field name="myfield" type="field"><datasource name="ds2" />'
-            '<strategy mode="STEP" /></field></group>'
-            '<field name="mf" type="field2"><datasource name="ds1" />'
-            '<strategy mode="INIT" /></field>'
+            '<field name="myfield" type="field"><datasource name="ds2"/>'
+            '<strategy mode="STEP"/></field></group>'
+            '<field name="mf" type="field2"><datasource name="ds1"/>'
+            '<strategy mode="INIT"/></field>'
             '<group name="data" type="NXdata">'
             '<link name="ds2" '
-            'target="/entry:NXentry/instrument:NXinstrument/myfield" />'
-            '<link name="ds1" target="/entry:NXentry/mf" />'
+            'target="/entry:NXentry/instrument:NXinstrument/myfield"/>'
+            '<link name="ds1" target="/entry:NXentry/mf"/>'
             '</group></group></definition>')
 
     # test collect
@@ -1900,12 +2088,12 @@ class MergerTest(unittest.TestCase):
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<group  name='instrument' type='NXinstrument'>"
                  "<field name='myfield' type='field'><datasource name='ds1'/>"
-                 "<strategy mode='STEP' /></field></group></group>"
+                 "<strategy mode='STEP'/></field></group></group>"
                  "</definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<field name='mf' type='field2'><datasource name='ds1'/>"
                  "<strategy mode='INIT'/></field>"
-                 "<group name='data' type='NXdata' /></group>"
+                 "<group name='data' type='NXdata'/></group>"
                  "</definition>"]), None)
         self.assertEqual(el.merge(), None)
         checknxmls(
@@ -1915,24 +2103,24 @@ class MergerTest(unittest.TestCase):
                 '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
                 '<group name="entry" type="NXentry">'
                 '<group name="instrument" type="NXinstrument">'
-                '<field name="myfield" type="field"><datasource name="ds1" />'
-                '<strategy mode="STEP" /></field></group>'
-                '<field name="mf" type="field2"><datasource name="ds1" />'
-                '<strategy mode="INIT" /></field>'
+                '<field name="myfield" type="field"><datasource name="ds1"/>'
+                '<strategy mode="STEP"/></field></group>'
+                '<field name="mf" type="field2"><datasource name="ds1"/>'
+                '<strategy mode="INIT"/></field>'
                 '<group name="data" type="NXdata">'
                 '<link name="ds1" '
-                'target="/entry:NXentry/mf" /></group>'
+                'target="/entry:NXentry/mf"/></group>'
                 '</group></definition>',
                 '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
                 '<group name="entry" type="NXentry">'
                 '<group name="instrument" type="NXinstrument">'
-                '<field name="myfield" type="field"><datasource name="ds1" />'
-                '<strategy mode="STEP" /></field></group>'
-                '<field name="mf" type="field2"><datasource name="ds1" />'
-                '<strategy mode="INIT" /></field>'
+                '<field name="myfield" type="field"><datasource name="ds1"/>'
+                '<strategy mode="STEP"/></field></group>'
+                '<field name="mf" type="field2"><datasource name="ds1"/>'
+                '<strategy mode="INIT"/></field>'
                 '<group name="data" type="NXdata">'
                 '<link name="ds1" '
-                'target="/entry:NXentry/instrument:NXinstrument/myfield" />'
+                'target="/entry:NXentry/instrument:NXinstrument/myfield"/>'
                 '</group>'
                 '</group></definition>'
             ]
@@ -1953,7 +2141,7 @@ class MergerTest(unittest.TestCase):
                 ["<definition><group name='entry' type='NXentry'>"
                  "<group  name='instrument' type='NXinstrument'>"
                  "<field name='myfield' type='field'><datasource name='ds2'/>"
-                 "<strategy mode='STEP' /></field></group></group>"
+                 "<strategy mode='STEP'/></field></group></group>"
                  "</definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<field name='mf' type='field2'><datasource name='ds1'/>"
@@ -1968,16 +2156,55 @@ class MergerTest(unittest.TestCase):
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry">'
             '<group name="instrument" type="NXinstrument">'
-            '<field name="myfield" type="field"><datasource name="ds2" />'
-            '<strategy mode="STEP" /></field></group>'
-            '<field name="mf" type="field2"><datasource name="ds1" />'
-            '<strategy mode="INIT" /></field>'
+            '<field name="myfield" type="field"><datasource name="ds2"/>'
+            '<strategy mode="STEP"/></field></group>'
+            '<field name="mf" type="field2"><datasource name="ds1"/>'
+            '<strategy mode="INIT"/></field>'
             '<group name="data" type="NXdata">'
-            '<link name="ds1" target="/entry:NXentry" />'
+            '<link name="ds1" target="/entry:NXentry"/>'
             '<link name="ds2" '
-            'target="/entry:NXentry/instrument:NXinstrument/myfield" />'
+            'target="/entry:NXentry/instrument:NXinstrument/myfield"/>'
             '</group></group></definition>')
 
+    # test collect
+    # \brief It tests links of many datasources in two entries
+    def test_linkdatasources_many(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        nf = 500
+        el = Merger()
+        el.linkdatasources = ["ds%s" % i for i in range(nf)]
+        fields = "".join(
+            "<field name='f%s'><datasource name='ds%s'/></field>"
+            % (i, i % (nf // 2)) for i in range(nf))
+        self.assertEqual(
+            el.collect(
+                ["<definition><group name='entry' type='NXentry'>"
+                 "<group name='data' type='NXdata'>"
+                 "<link name='ds1' target='/entry:NXentry/f1'/></group>"
+                 "<group name='instrument' type='NXinstrument'>%s</group>"
+                 "</group></definition>" % fields,
+                 "<definition><group name='entry2' type='NXentry'>"
+                 "%s</group></definition>" % fields]), None)
+        self.assertEqual(el.merge(), None)
+
+        entries = list(el.root)
+        self.assertEqual(len(entries), 2)
+        for entry, prefix in zip(
+                entries, ["/entry:NXentry/instrument:NXinstrument/",
+                          "/entry2:NXentry/"]):
+            data = [gr for gr in entry if gr.get("type") == "NXdata"]
+            self.assertEqual(len(data), 1)
+            targets = dict(
+                ("ds%s" % i, "%sf%s" % (prefix, i)) for i in range(nf // 2))
+            if entry.get("name") == "entry":
+                targets["ds1"] = "/entry:NXentry/f1"
+            self.assertEqual(
+                dict((link.get("name"), link.get("target"))
+                     for link in data[0]), targets)
+            self.assertEqual(len(data[0]), nf // 2)
+
     # test collect
     # \brief It tests default settings
     def test_switch_canfaildatasources_none(self):
@@ -1992,7 +2219,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy canfail='false' /></field></group></definition>",
+                 "<strategy canfail='false'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds1'/>"
                  "<strategy canfail='false'/></attribute></group>"
@@ -2003,9 +2230,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy canfail="false" /></field>'
-            '<attribute type="field2"><datasource name="ds1" />'
-            '<strategy canfail="false" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy canfail="false"/></field>'
+            '<attribute type="field2"><datasource name="ds1"/>'
+            '<strategy canfail="false"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2019,7 +2246,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy canfail='false' /></field></group></definition>",
+                 "<strategy canfail='false'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy canfail='false'/></attribute></group>"
@@ -2029,9 +2256,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy canfail="true" />'
-            '</field><attribute type="field2"><datasource name="ds2" />'
-            '<strategy canfail="false" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy canfail="true"/>'
+            '</field><attribute type="field2"><datasource name="ds2"/>'
+            '<strategy canfail="false"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2045,7 +2272,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy canfail='false' /></field></group></definition>",
+                 "<strategy canfail='false'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy canfail='false'/></attribute></group>"
@@ -2056,9 +2283,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy canfail="false" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy canfail="true" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy canfail="false"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy canfail="true"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2072,7 +2299,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy canfail='false' /></field></group></definition>",
+                 "<strategy canfail='false'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds1'/>"
                  "<strategy canfail='false'/></attribute></group>"
@@ -2083,9 +2310,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy canfail="true" /></field>'
-            '<attribute type="field2"><datasource name="ds1" />'
-            '<strategy canfail="true" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy canfail="true"/></field>'
+            '<attribute type="field2"><datasource name="ds1"/>'
+            '<strategy canfail="true"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2100,7 +2327,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy canfail='false' /></field></group></definition>",
+                 "<strategy canfail='false'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy canfail='false'/></attribute></group>"
@@ -2110,9 +2337,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy canfail="true" />'
-            '</field><attribute type="field2"><datasource name="ds2" />'
-            '<strategy canfail="true" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy canfail="true"/>'
+            '</field><attribute type="field2"><datasource name="ds2"/>'
+            '<strategy canfail="true"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2127,7 +2354,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy canfail='false' /></field></group></definition>",
+                 "<strategy canfail='false'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy canfail='false'/></attribute></group>"
@@ -2138,9 +2365,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy canfail="false" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy canfail="false" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy canfail="false"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy canfail="false"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2155,7 +2382,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'><datasource name='ds1'/>"
-                 "<strategy canfail='false' /></field></group></definition>",
+                 "<strategy canfail='false'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy canfail='false'/></attribute>"
@@ -2166,9 +2393,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '<datasource name="ds1" /><strategy canfail="true" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy canfail="false" /></attribute></group></definition>')
+            '<datasource name="ds1"/><strategy canfail="true"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy canfail="false"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2185,7 +2412,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'>$datasources.ds1"
-                 "<strategy canfail='false' />"
+                 "<strategy canfail='false'/>"
                  "</field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'>$datasources.ds1"
@@ -2197,9 +2424,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy canfail="false" /></field>'
+            '$datasources.ds1<strategy canfail="false"/></field>'
             '<attribute type="field2">$datasources.ds1'
-            '<strategy canfail="false" /></attribute></group></definition>')
+            '<strategy canfail="false"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2213,7 +2440,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'>$datasources.ds1"
-                 "<strategy canfail='false' /></field></group></definition>",
+                 "<strategy canfail='false'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy canfail='false'/></attribute>"
@@ -2224,9 +2451,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy canfail="true" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy canfail="false" /></attribute></group></definition>')
+            '$datasources.ds1<strategy canfail="true"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy canfail="false"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2240,7 +2467,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'>$datasources.ds1"
-                 "<strategy canfail='false' />"
+                 "<strategy canfail='false'/>"
                  "</field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
@@ -2252,9 +2479,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy canfail="false" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy canfail="true" /></attribute></group></definition>')
+            '$datasources.ds1<strategy canfail="false"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy canfail="true"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2268,7 +2495,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'>$datasources.ds1"
-                 "<strategy canfail='false' /></field></group></definition>",
+                 "<strategy canfail='false'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'>$datasources.ds1"
                  "<strategy canfail='false'/></attribute></group>"
@@ -2279,9 +2506,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy canfail="true" /></field>'
+            '$datasources.ds1<strategy canfail="true"/></field>'
             '<attribute type="field2">$datasources.ds1'
-            '<strategy canfail="true" /></attribute></group></definition>')
+            '<strategy canfail="true"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2297,7 +2524,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'>$datasources.ds1"
-                 "<strategy canfail='false' />"
+                 "<strategy canfail='false'/>"
                  "</field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
@@ -2308,9 +2535,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy canfail="true" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy canfail="true" /></attribute></group></definition>')
+            '$datasources.ds1<strategy canfail="true"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy canfail="true"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2326,7 +2553,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'>$datasources.ds1"
-                 "<strategy canfail='false' /></field></group></definition>",
+                 "<strategy canfail='false'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy canfail='false'/></attribute></group>"
@@ -2337,9 +2564,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy canfail="false" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy canfail="false" /></attribute></group></definition>')
+            '$datasources.ds1<strategy canfail="false"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy canfail="false"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2355,7 +2582,7 @@ class MergerTest(unittest.TestCase):
             el.collect(
                 ["<definition><group  name='entry' type='NXentry'>"
                  "<field type='field'>$datasources.ds1"
-                 "<strategy canfail='false' /></field></group></definition>",
+                 "<strategy canfail='false'/></field></group></definition>",
                  "<definition><group name='entry' type='NXentry'>"
                  "<attribute type='field2'><datasource name='ds2'/>"
                  "<strategy canfail='false'/></attribute></group>"
@@ -2366,9 +2593,9 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field type="field">'
-            '$datasources.ds1<strategy canfail="true" /></field>'
-            '<attribute type="field2"><datasource name="ds2" />'
-            '<strategy canfail="false" /></attribute></group></definition>')
+            '$datasources.ds1<strategy canfail="true"/></field>'
+            '<attribute type="field2"><datasource name="ds2"/>'
+            '<strategy canfail="false"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2390,8 +2617,8 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><attribute type="field2">'
-            '<datasource name="ds2"><datasource name="ds1" /></datasource>'
-            '<strategy canfail="true" /></attribute></group></definition>')
+            '<datasource name="ds2"><datasource name="ds1"/></datasource>'
+            '<strategy canfail="true"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2413,8 +2640,8 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><attribute type="field2">'
-            '<datasource name="ds2"><datasource name="ds1" /></datasource>'
-            '<strategy canfail="true" /></attribute></group></definition>')
+            '<datasource name="ds2"><datasource name="ds1"/></datasource>'
+            '<strategy canfail="true"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2436,8 +2663,8 @@ class MergerTest(unittest.TestCase):
             el.toString().replace("?>\n<", "?><"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><attribute type="field2">'
-            '<datasource name="ds2"><datasource name="ds1" /></datasource>'
-            '<strategy canfail="false" /></attribute></group></definition>')
+            '<datasource name="ds2"><datasource name="ds1"/></datasource>'
+            '<strategy canfail="false"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2459,7 +2686,7 @@ class MergerTest(unittest.TestCase):
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><attribute type="field2">'
             '<datasource name="ds2">$datasources.ds1</datasource>'
-            '<strategy canfail="true" /></attribute></group></definition>')
+            '<strategy canfail="true"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2481,7 +2708,7 @@ class MergerTest(unittest.TestCase):
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><attribute type="field2">'
             '<datasource name="ds2">$datasources.ds1</datasource>'
-            '<strategy canfail="true" /></attribute></group></definition>')
+            '<strategy canfail="true"/></attribute></group></definition>')
 
     # test collect
     # \brief It tests default settings
@@ -2503,7 +2730,70 @@ class MergerTest(unittest.TestCase):
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><attribute type="field2">'
             '<datasource name="ds2">$datasources.ds1</datasource>'
-            '<strategy canfail="false" /></attribute></group></definition>')
+            '<strategy canfail="false"/></attribute></group></definition>')
+
+    # test merge
+    # \brief It tests merging of groups with many children
+    def test_merge_group_many_fields(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        nf = 3000
+        fields1 = "".join(
+            ["<field name='f%s' type='NX_FLOAT'/>" % i for i in range(nf)])
+        fields2 = "".join(
+            ["<field name='f%s' units='mm'/>" % i
+             for i in reversed(range(nf))])
+        el = Merger()
+        self.assertEqual(
+            el.collect(
+                ["<definition><group name='entry' type='NXentry'>%s"
+                 "</group></definition>" % fields1,
+                 "<definition><group name='entry' type='NXentry'>%s"
+                 "<doc>text</doc></group></definition>" % fields2]), None)
+        self.assertEqual(el.merge(), None)
+        self.assertEqual(
+            el.toString().replace("?>\n<", "?><"),
+            '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
+            '<group name="entry" type="NXentry">%s<doc>text</doc>'
+            '</group></definition>'
+            % "".join(['<field name="f%s" type="NX_FLOAT" units="mm"/>' % i
+                       for i in range(nf)]))
+
+        el = Merger()
+        fields2 = "".join(
+            ["<field name='f%s' type='NX_INT'/>" % i
+             for i in reversed(range(nf))])
+        self.assertEqual(
+            el.collect(
+                ["<definition><group name='entry' type='NXentry'>%s"
+                 "</group></definition>" % fields1,
+                 "<definition><group name='entry' type='NXentry'>%s"
+                 "</group></definition>" % fields2]), None)
+        self.myAssertRaise(IncompatibleNodeError, el.merge)
+
+    # test merge
+    # \brief It tests merging of groups with unnamed children
+    def test_merge_group_unnamed_fields(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        el = Merger()
+        self.assertEqual(
+            el.collect(
+                ["<definition><group type='NXentry'>"
+                 "<field name='f1' type='NX_FLOAT'/><field name='f2'/>"
+                 "</group></definition>",
+                 "<definition><group type='NXentry'>"
+                 "<field units='mm'/><field name='f2' units='cm'/>"
+                 "</group></definition>"]), None)
+        self.assertEqual(el.merge(), None)
+        self.assertEqual(
+            el.toString().replace("?>\n<", "?><"),
+            '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
+            '<group type="NXentry">'
+            '<field name="f1" type="NX_FLOAT" units="mm"/>'
+            '<field name="f2" units="cm"/></group></definition>')
 
 
 if __name__ == '__main__':
@@ -22,6 +22,7 @@
 import unittest
 import sys
 import time
+import json
 import PyTango
 
 # import XMLConTest as XMLConfigurator_test
@@ -130,6 +131,69 @@ class NXSConfigServerTest(XMLConfigurator_test.XMLConfiguratorTest):
     def getXML(self, xmlc):
         return xmlc.XMLString
 
+    # waits until the job is finished
+    # \param xmlc configuration instance
+    # \param jid job id
+    # \returns job state
+    def waitJob(self, xmlc, jid):
+        for _ in range(1000):
+            state = xmlc.JobState(jid)
+            if state in ["DONE", "FAILED"]:
+                break
+            time.sleep(0.01)
+        return state
+
+    # submitJob test
+    # \brief It tests asynchronous jobs
+    def test_submitJob(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        el = self.openConf()
+        avc = el.availableComponents()
+        avds = el.availableDataSources()
+        name = "mcs_test_component"
+        while name in avc:
+            name = name + '_1'
+        dsname = "mcs_test_datasource"
+        while dsname in avds:
+            dsname = dsname + '_1'
+
+        self.setXML(
+            el, '<definition><datasource name="%s" type="CLIENT">'
+            '<record name="r1"/></datasource></definition>' % dsname)
+        el.storeDataSource(dsname)
+        self.setXML(
+            el, '<definition><group type="NXentry" name="entry">'
+            '<field name="field1">$datasources.%s</field></group>'
+            '</definition>' % dsname)
+        el.storeComponent(name)
+        man = el.mandatoryComponents()
+        el.unsetMandatoryComponents(man)
+
+        jid = el.SubmitJob(["CreateConfiguration", name])
+        jid2 = el.SubmitJob(["ComponentsDataSources", name])
+        jid3 = el.SubmitJob(["Merge", name + "_nonexisting"])
+        self.assertTrue(jid != jid2)
+        self.myAssertRaise(
+            PyTango.DevFailed, el.SubmitJob, ["StoreComponent", name])
+        self.myAssertRaise(PyTango.DevFailed, el.SubmitJob, [])
+
+        self.assertEqual(self.waitJob(el, jid), "DONE")
+        el.createConfiguration([name])
+        self.assertEqual(el.JobResult(jid), self.getXML(el))
+        self.myAssertRaise(PyTango.DevFailed, el.JobState, jid)
+        self.assertEqual(self.waitJob(el, jid2), "DONE")
+        self.assertEqual(json.loads(el.JobResult(jid2)), [dsname])
+        self.assertEqual(self.waitJob(el, jid3), "FAILED")
+        self.myAssertRaise(PyTango.DevFailed, el.JobResult, jid3)
+        self.assertEqual(el.state(), PyTango.DevState.OPEN)
+
+        el.setMandatoryComponents(man)
+        el.deleteComponent(name)
+        el.deleteDataSource(dsname)
+        el.close()
+
 
 if __name__ == '__main__':
     unittest.main()
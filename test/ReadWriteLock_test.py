@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file ReadWriteLockTest.py
+# unittests for ReadWriteLock class
+#
+import unittest
+import sys
+import threading
+import time
+
+from nxsconfigserver.ReadWriteLock import ReadWriteLock
+
+
+# test fixture
+class ReadWriteLockTest(unittest.TestCase):
+
+    # constructor
+    # \param methodName name of the test method
+    def __init__(self, methodName):
+        unittest.TestCase.__init__(self, methodName)
+
+    # test starter
+    # \brief Common set up
+    def setUp(self):
+        print("\nsetting up...")
+
+    # test closer
+    # \brief Common tear down
+    def tearDown(self):
+        print("tearing down ...")
+
+    # starts the thread and waits a moment
+    # \param target thread function
+    # \returns started thread
+    def start(self, target):
+        th = threading.Thread(target=target)
+        th.start()
+        time.sleep(0.1)
+        return th
+
+    # constructor test
+    # \brief It tests default settings
+    def test_constructor(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        lock = ReadWriteLock()
+        self.assertEqual(
+            lock.info(), {"readers": 0, "writer": False, "waiting": 0})
+
+    # reading test
+    # \brief It tests parallel readers
+    def test_reading(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        lock = ReadWriteLock()
+        done = []
+
+        def read():
+            with lock.reading():
+                done.append("read")
+
+        with lock.reading():
+            self.assertEqual(lock.info()["readers"], 1)
+            th = self.start(read)
+            th.join()
+            self.assertEqual(done, ["read"])
+        self.assertEqual(lock.info()["readers"], 0)
+
+    # writing test
+    # \brief It tests that writers wait for readers and block them
+    def test_writing(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        lock = ReadWriteLock()
+        done = []
+
+        def read():
+            with lock.reading():
+                done.append("read")
+
+        def write():
+            with lock.writing():
+                done.append("write")
+
+        lock.acquireRead()
+        wth = self.start(write)
+        self.assertEqual(done, [])
+        self.assertEqual(lock.info()["waiting"], 1)
+        rth = self.start(read)
+        self.assertEqual(done, [])
+        lock.releaseRead()
+        wth.join()
+        rth.join()
+        self.assertEqual(done, ["write", "read"])
+
+        done[:] = []
+        with lock.writing():
+            self.assertEqual(lock.info()["writer"], True)
+            rth = self.start(read)
+            wth = self.start(write)
+            self.assertEqual(done, [])
+        rth.join()
+        wth.join()
+        self.assertEqual(sorted(done), ["read", "write"])
+        self.assertEqual(
+            lock.info(), {"readers": 0, "writer": False, "waiting": 0})
+
+    # error test
+    # \brief It tests releasing the lock after errors
+    def test_error(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        lock = ReadWriteLock()
+        try:
+            with lock.writing():
+                raise ValueError("wrong")
+        except ValueError:
+            pass
+        try:
+            with lock.reading():
+                raise ValueError("wrong")
+        except ValueError:
+            pass
+        self.assertEqual(
+            lock.info(), {"readers": 0, "writer": False, "waiting": 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file RevisionCacheTest.py
+# unittests for RevisionCache class
+#
+import unittest
+import sys
+
+from nxsconfigserver.RevisionCache import RevisionCache
+
+
+# test fixture
+class RevisionCacheTest(unittest.TestCase):
+
+    # constructor
+    # \param methodName name of the test method
+    def __init__(self, methodName):
+        unittest.TestCase.__init__(self, methodName)
+
+    # test starter
+    # \brief Common set up
+    def setUp(self):
+        print("\nsetting up...")
+
+    # test closer
+    # \brief Common tear down
+    def tearDown(self):
+        print("tearing down ...")
+
+    # constructor test
+    # \brief It tests default settings
+    def test_init(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        ch = RevisionCache(100)
+        self.assertEqual(ch.maxsize, 100)
+        self.assertEqual(
+            ch.info(),
+            {"hits": 0, "misses": 0, "items": 0, "size": 0,
+             "maxsize": 100, "revision": None})
+        ch = RevisionCache()
+        ch.set("a", "value")
+        self.assertEqual(ch.get("a"), None)
+
+    # get/set test
+    # \brief It tests hits and misses
+    def test_get_set(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        ch = RevisionCache(100)
+        ch.validate("1")
+        self.assertEqual(ch.get("a"), None)
+        self.assertEqual(ch.get("a", "def"), "def")
+        ch.set("a", "value")
+        ch.set("b", "value2", "1")
+        self.assertEqual(ch.get("a"), "value")
+        self.assertEqual(ch.get("b"), "value2")
+        ch.set("a", "value3")
+        self.assertEqual(ch.get("a"), "value3")
+        info = ch.info()
+        self.assertEqual(info["hits"], 3)
+        self.assertEqual(info["misses"], 2)
+        self.assertEqual(info["items"], 2)
+        self.assertEqual(info["size"], 12)
+        self.assertEqual(info["revision"], "1")
+        self.assertTrue("a" in ch)
+        self.assertTrue("c" not in ch)
+        self.assertEqual(ch.info()["misses"], 2)
+        ch.pop("a")
+        self.assertTrue("a" not in ch)
+        self.assertEqual(ch.get("a"), None)
+        self.assertEqual(ch.info()["size"], 6)
+        ch.clear()
+        self.assertEqual(ch.get("b"), None)
+        self.assertEqual(ch.info()["revision"], None)
+
+    # revision test
+    # \brief It tests invalidation by revision
+    def test_revision(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        ch = RevisionCache(100)
+        ch.validate("1")
+        ch.set("a", "value")
+        ch.validate("1")
+        self.assertEqual(ch.get("a"), "value")
+        ch.validate("2")
+        self.assertEqual(ch.get("a"), None)
+        ch.set("a", "value", "1")
+        self.assertEqual(ch.get("a"), None)
+        ch.set("a", "value", "2")
+        self.assertEqual(ch.get("a"), "value")
+
+    # LRU test
+    # \brief It tests eviction of the least recently used values
+    def test_lru(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        ch = RevisionCache(10)
+        ch.set("a", "aaaa")
+        ch.set("b", "bbbb")
+        self.assertEqual(ch.get("a"), "aaaa")
+        ch.set("c", "cccc")
+        self.assertEqual(ch.get("b"), None)
+        self.assertEqual(ch.get("a"), "aaaa")
+        self.assertEqual(ch.get("c"), "cccc")
+        self.assertEqual(ch.info()["size"], 8)
+        ch.set("d", "d" * 11)
+        self.assertEqual(ch.get("d"), None)
+        ch.set("e", "e" * 10)
+        self.assertEqual(ch.get("e"), "e" * 10)
+        self.assertEqual(ch.get("a"), None)
+        self.assertEqual(ch.get("c"), None)
+        self.assertEqual(ch.info()["items"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+#   This file is part of nexdatas - Tango Server for NeXus data writer
+#
+#    Copyright (C) 2012-2017 DESY, Jan Kotanski <jkotan@mail.desy.de>
+#
+#    nexdatas is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    nexdatas is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with nexdatas.  If not, see <http://www.gnu.org/licenses/>.
+# \package test nexdatas
+# \file TemplateTest.py
+# unittests for Template class
+#
+import unittest
+import sys
+
+from nxsconfigserver.Template import Template
+
+
+# test fixture
+class TemplateTest(unittest.TestCase):
+
+    # constructor
+    # \param methodName name of the test method
+    def __init__(self, methodName):
+        unittest.TestCase.__init__(self, methodName)
+
+    # test starter
+    # \brief Common set up
+    def setUp(self):
+        print("\nsetting up...")
+
+    # test closer
+    # \brief Common tear down
+    def tearDown(self):
+        print("tearing down ...")
+
+    # constructor test
+    # \brief It tests text without placeholders
+    def test_init(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        tp = Template("<definition>$datasources.ds1</definition>", "var")
+        self.assertEqual(tp.text, "<definition>$datasources.ds1</definition>")
+        self.assertEqual(tp.literals, [tp.text])
+        self.assertEqual(tp.placeholders, [])
+        self.assertEqual(tp.names(), [])
+        self.assertEqual(tp.render(lambda name, default: "x"), tp.text)
+
+    # tokenize test
+    # \brief It tests placeholders
+    def test_placeholders(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        tp = Template("<a name='$var.entry'>$var.b1 $var.c</a>$var.", "var")
+        self.assertEqual(
+            tp.literals, ["<a name='", "'>", " ", "</a>", ""])
+        self.assertEqual(
+            tp.placeholders,
+            [("entry", None, "$var.entry"), ("b1", None, "$var.b1"),
+             ("c", None, "$var.c"), ("", None, "$var.")])
+        self.assertEqual(tp.names(), ["entry", "b1", "c"])
+
+        tp = Template("<a>$datasources.ds1#'d'</a>", "datasources",
+                      defaults=False)
+        self.assertEqual(tp.literals, ["<a>", "#'d'</a>"])
+        self.assertEqual(
+            tp.placeholders, [("ds1", None, "$datasources.ds1")])
+
+    # default test
+    # \brief It tests default values
+    def test_defaults(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        tp = Template(
+            "<a>$var.a#'x\\'y'|$var.b#\"u\\\"v\"|$var.c#&quot;p\\\"q&quot;|"
+            "$var.d#\\&quot;r\\&quot;|$var.e#|$var.f</a>", "var")
+        self.assertEqual(
+            tp.placeholders,
+            [("a", "x'y", "$var.a#'x\\'y'"),
+             ("b", 'u"v', "$var.b#\"u\\\"v\""),
+             ("c", 'p"q', "$var.c#&quot;p\\\"q&quot;"),
+             ("d", "r", "$var.d#\\&quot;r\\&quot;"),
+             ("e", None, "$var.e"),
+             ("f", None, "$var.f")])
+        self.assertEqual(
+            tp.literals, ["<a>", "|", "|", "|", "|", "#|", "</a>"])
+
+    # render test
+    # \brief It tests substitution
+    def test_render(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        values = {"entry": "scan", "title": "", "x": "$var.entry"}
+        tp = Template(
+            "<a name='$var.entry'>$var.title$var.x$var.y#'def'$var.z</a>",
+            "var")
+        calls = []
+
+        def substitute(name, default):
+            calls.append((name, default))
+            return values.get(name, default)
+
+        self.assertEqual(
+            tp.render(substitute),
+            "<a name='scan'>$var.entrydef$var.z</a>")
+        self.assertEqual(
+            calls,
+            [("entry", None), ("title", None), ("x", None),
+             ("y", "def"), ("z", None)])
+
+    # error test
+    # \brief It tests errors raised by substitution
+    def test_render_error(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+        tp = Template("<a>$var.a</a>$var.", "var")
+
+        def substitute(name, default):
+            if not name:
+                raise ValueError("empty name")
+            return name.upper()
+
+        self.assertRaises(ValueError, tp.render, substitute)
+        tp = Template("<a>$var.a $var.b</a>", "var")
+        self.assertEqual(tp.render(substitute), "<a>A B</a>")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,6 +23,7 @@ import unittest
 import os
 import sys
 import random
+import threading
 import time
 import struct
 import binascii
@@ -36,12 +37,14 @@ except Exception:
 
 from os.path import expanduser
 
+from lxml import etree
+
 import nxsconfigserver
 from nxsconfigserver.XMLConfigurator import XMLConfigurator
 from nxsconfigserver.Merger import Merger
 from nxsconfigserver.Errors import (
     NonregisteredDBRecordError, UndefinedTagError,
-    IncompatibleNodeError)
+    IncompatibleNodeError, CyclicDependencyError)
 
 # if 64-bit machione
 IS64BIT = (struct.calcsize("P") == 8)
@@ -1328,6 +1331,196 @@ class XMLConfiguratorTest(unittest.TestCase):
         el.setMandatoryComponents(man)
         el.close()
 
+    # creatConf test
+    # \brief It tests XMLConfigurator
+    def test_createConf_cache(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        el = self.openConf()
+        man = el.mandatoryComponents()
+        el.unsetMandatoryComponents(man)
+        self.__man += man
+
+        avc = el.availableComponents()
+        name = "mcs_test_component"
+        xml = "<?xml version='1.0' encoding='utf8'?><definition>" \
+              + "<group type='NXentry' name='$var.myentry'/></definition>"
+        while name in avc:
+            name = name + '_1'
+        self.setXML(el, xml)
+        self.assertEqual(el.storeComponent(name), None)
+        self.__cmps.append(name)
+
+        info = el.cacheStatistics()["configurations"]
+        self.assertEqual(info["items"], 0)
+        hits = info["hits"]
+        misses = info["misses"]
+        expected = [
+            '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
+            '<group name="" type="NXentry"/></definition>',
+            '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
+            '<group name="entry1" type="NXentry"/></definition>',
+            '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
+            '<group name="entry1" type="NXentry"><field name="data"/>'
+            '</group></definition>',
+        ]
+
+        self.assertEqual(el.createConfiguration([name]), None)
+        checkxmls(self, self.getXML(el), expected[0])
+        self.assertEqual(el.createConfiguration([name, name]), None)
+        checkxmls(self, self.getXML(el), expected[0])
+        info = el.cacheStatistics()["configurations"]
+        self.assertEqual(info["items"], 1)
+        self.assertEqual(info["hits"], hits + 1)
+        self.assertEqual(info["misses"], misses + 1)
+
+        el.variables = '{"myentry":"entry1"}'
+        self.assertEqual(el.createConfiguration([name]), None)
+        checkxmls(self, self.getXML(el), expected[1])
+        self.assertEqual(el.createConfiguration([name]), None)
+        checkxmls(self, self.getXML(el), expected[1])
+        info = el.cacheStatistics()["configurations"]
+        self.assertEqual(info["items"], 2)
+        self.assertEqual(info["hits"], hits + 2)
+        self.assertEqual(info["misses"], misses + 2)
+
+        self.setXML(el, "<definition><group type='NXentry' "
+                    "name='$var.myentry'><field name='data'/></group>"
+                    "</definition>")
+        self.assertEqual(el.storeComponent(name), None)
+        self.assertEqual(el.createConfiguration([name]), None)
+        checkxmls(self, self.getXML(el), expected[2])
+        info = el.cacheStatistics()["configurations"]
+        self.assertEqual(info["items"], 1)
+        self.assertEqual(info["revision"], el.version.split('.')[-1])
+
+        el.variables = '{}'
+        self.assertEqual(el.deleteComponent(name), None)
+        self.__cmps.pop()
+        self.myAssertRaise(
+            NonregisteredDBRecordError, el.createConfiguration, [name])
+
+        el.setMandatoryComponents(man)
+        el.close()
+
+    # creatConf test
+    # \brief It tests XMLConfigurator with merging in worker processes
+    def test_createConf_merge_processes(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        el = self.openConf()
+        man = el.mandatoryComponents()
+        el.unsetMandatoryComponents(man)
+        self.__man += man
+
+        avc = el.availableComponents()
+        names = []
+        for i in range(2):
+            names.append("mcs_test_component_%s" % i)
+            while names[i] in avc:
+                names[i] = names[i] + '_%s' % i
+        for i, name in enumerate(names):
+            self.setXML(
+                el, "<definition>%s</definition>" % "".join(
+                    ["<group type='NXentry' name='entry%s'>"
+                     "<group type='NXinstrument' name='instrument'>"
+                     "<field name='f%s' type='NX_FLOAT'/></group>"
+                     "</group>" % (e, i) for e in range(20)]))
+            self.assertEqual(el.storeComponent(name), None)
+            self.__cmps.append(name)
+
+        self.assertEqual(el.createConfiguration(names), None)
+        expected = self.getXML(el)
+
+        settings = json.loads(el.jsonsettings)
+        el.close()
+        settings["merge_processes"] = 2
+        el.jsonsettings = json.dumps(settings)
+        el.open()
+        self.assertEqual(el.createConfiguration(names), None)
+        checkxmls(self, self.getXML(el), expected)
+        el.close()
+
+        settings.pop("merge_processes")
+        el.jsonsettings = json.dumps(settings)
+        el.open()
+        for name in names:
+            self.assertEqual(el.deleteComponent(name), None)
+            self.__cmps.pop()
+        el.setMandatoryComponents(man)
+        el.close()
+
+    # creatConf test
+    # \brief It tests XMLConfigurator with nested datasources
+    def test_createConf_nested_datasources(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        el = self.openConf()
+        man = el.mandatoryComponents()
+        el.unsetMandatoryComponents(man)
+        self.__man += man
+
+        avc = el.availableComponents()
+        avds = el.availableDataSources()
+        name = "mcs_test_component"
+        dsname = ["mcs_test_datasource", "mcs_test_datasource_2"]
+        while name in avc:
+            name = name + '_1'
+        while dsname[0] in avds or dsname[1] in avds:
+            dsname = [dn + '_1' for dn in dsname]
+
+        self.setXML(
+            el, "<?xml version='1.0' encoding='utf8'?><definition>"
+            "<datasource type='CLIENT' name='%s'>"
+            "<record name='$var.myrecord'/></datasource></definition>"
+            % dsname[0])
+        self.assertEqual(el.storeDataSource(dsname[0]), None)
+        self.__ds.append(dsname[0])
+        self.setXML(
+            el, "<?xml version='1.0' encoding='utf8'?><definition>"
+            "<datasource type='PYEVAL' name='%s'>"
+            "<result>ds.result = ds.%s</result>$datasources.%s"
+            "</datasource></definition>"
+            % (dsname[1], dsname[0], dsname[0]))
+        self.assertEqual(el.storeDataSource(dsname[1]), None)
+        self.__ds.append(dsname[1])
+        self.setXML(
+            el, "<?xml version='1.0' encoding='utf8'?><definition>"
+            "<group type='NXentry' name='$var.myentry'>"
+            "<field name='data' units='$var.myunits'>$datasources.%s"
+            "<strategy mode='STEP'/></field></group></definition>"
+            % dsname[1])
+        self.assertEqual(el.storeComponent(name), None)
+        self.__cmps.append(name)
+
+        el.variables = '{"myentry":"entry1", "myrecord":"counter1", ' \
+            '"myunits":"mm"}'
+        self.assertEqual(el.createConfiguration([name]), None)
+        checkxmls(
+            self, self.getXML(el),
+            '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
+            '<group name="entry1" type="NXentry">'
+            '<field name="data" units="mm">'
+            '<datasource name="%s" type="PYEVAL">'
+            '<result>ds.result = ds.%s</result>'
+            '<datasource name="%s" type="CLIENT">'
+            '<record name="counter1"/></datasource></datasource>'
+            '<strategy mode="STEP"/></field></group></definition>'
+            % (dsname[1], dsname[0], dsname[0]))
+
+        el.variables = '{}'
+        self.assertEqual(el.deleteComponent(name), None)
+        self.__cmps.pop()
+        for dn in reversed(dsname):
+            self.assertEqual(el.deleteDataSource(dn), None)
+            self.__ds.pop()
+
+        el.setMandatoryComponents(man)
+        el.close()
+
     # creatConf test
     # \brief It tests XMLConfigurator
     def test_createConf_default_2_var_cp(self):
@@ -2084,7 +2277,7 @@ class XMLConfiguratorTest(unittest.TestCase):
         self.assertTrue(isinstance(avc, list))
         name = "mcs_test_component"
         xml = '<?xml version=\'1.0\'?><definition><group type="NXentry" ' \
-              'name="$var.myentry#\'12def34\'" /></definition>'
+              'name="$var.myentry#\'12def34\'"/></definition>'
         while name in avc:
             name = name + '_1'
 #        print(avc
@@ -2149,7 +2342,7 @@ class XMLConfiguratorTest(unittest.TestCase):
         self.assertTrue(isinstance(avc, list))
         name = "mcs_test_component"
         xml = '<?xml version=\'1.0\'?><definition><group type="NXentry" ' \
-              'name="$var.myentry#&quot;12def34&quot;" /></definition>'
+              'name="$var.myentry#&quot;12def34&quot;"/></definition>'
         while name in avc:
             name = name + '_1'
 #        print(avc
@@ -2214,7 +2407,7 @@ class XMLConfiguratorTest(unittest.TestCase):
         self.assertTrue(isinstance(avc, list))
         name = "mcs_test_component"
         xml = '<?xml version=\'1.0\'?><definition><group type="NXentry" ' \
-              'name="$var.myentry#&quot;12def34&quot;" /></definition>'
+              'name="$var.myentry#&quot;12def34&quot;"/></definition>'
         while name in avc:
             name = name + '_1'
 #        print(avc
@@ -3384,7 +3577,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self.assertTrue(isinstance(avc, list))
             xml = [
                 "<definition><field  name='entry' ><datasource type='TANGO'>"
-                "<%s /></datasource></field></definition>" % ut]
+                "<%s/></datasource></field></definition>" % ut]
             np = len(xml)
             name = []
             for i in range(np):
@@ -3444,7 +3637,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self.assertTrue(isinstance(avc, list))
             xml = [
                 "<definition><field  name='entry' ><datasource type='TANGO'>"
-                "<%s /></datasource></field></definition>" % ut]
+                "<%s/></datasource></field></definition>" % ut]
             np = len(xml)
             name = []
             for i in range(np):
@@ -3490,7 +3683,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self.assertTrue(isinstance(avc, list))
             xml = [
                 "<definition><field  name='entry' ><attribute type='TANGO'>"
-                "<%s /></attribute></field></definition>" % ut]
+                "<%s/></attribute></field></definition>" % ut]
             np = len(xml)
             name = []
             for i in range(np):
@@ -3552,7 +3745,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self.assertTrue(isinstance(avc, list))
             xml = [
                 "<definition><field  name='entry' ><attribute type='TANGO'>"
-                "<%s /></attribute></field></definition>" % ut]
+                "<%s/></attribute></field></definition>" % ut]
             np = len(xml)
             name = []
             for i in range(np):
@@ -3596,7 +3789,7 @@ class XMLConfiguratorTest(unittest.TestCase):
 
             oname = "mcs_test_component"
             self.assertTrue(isinstance(avc, list))
-            xml = ["<definition><%s  name='entry' /></definition>" % ut]
+            xml = ["<definition><%s  name='entry'/></definition>" % ut]
             np = len(xml)
             name = []
             for i in range(np):
@@ -3653,7 +3846,7 @@ class XMLConfiguratorTest(unittest.TestCase):
 
             oname = "mcs_test_component"
             self.assertTrue(isinstance(avc, list))
-            xml = ["<definition><%s  name='entry' /></definition>" % ut]
+            xml = ["<definition><%s  name='entry'/></definition>" % ut]
             np = len(xml)
             name = []
             for i in range(np):
@@ -3699,7 +3892,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self.assertTrue(isinstance(avc, list))
             xml = [
                 "<definition><field  name='entry' >"
-                "<dimensions type='TANGO'><%s />"
+                "<dimensions type='TANGO'><%s/>"
                 "</dimensions></field></definition>" % ut]
             np = len(xml)
             name = []
@@ -3759,7 +3952,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self.assertTrue(isinstance(avc, list))
             xml = [
                 "<definition><field  name='entry' ><dimensions type='TANGO'>"
-                "<%s /></dimensions></field></definition>" % ut]
+                "<%s/></dimensions></field></definition>" % ut]
             np = len(xml)
             name = []
             for i in range(np):
@@ -3804,7 +3997,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             oname = "mcs_test_component"
             self.assertTrue(isinstance(avc, list))
             xml = ["<definition><field  name='entry' >"
-                   "<%s /></field></definition>" %
+                   "<%s/></field></definition>" %
                    ut]
             np = len(xml)
             name = []
@@ -3861,7 +4054,7 @@ class XMLConfiguratorTest(unittest.TestCase):
 
             oname = "mcs_test_component"
             self.assertTrue(isinstance(avc, list))
-            xml = ["<definition><field  name='entry' ><%s />"
+            xml = ["<definition><field  name='entry' ><%s/>"
                    "</field></definition>" %
                    ut]
             np = len(xml)
@@ -3907,7 +4100,7 @@ class XMLConfiguratorTest(unittest.TestCase):
 
             oname = "mcs_test_component"
             self.assertTrue(isinstance(avc, list))
-            xml = ["<definition><group  name='entry' ><%s /></group>"
+            xml = ["<definition><group  name='entry' ><%s/></group>"
                    "</definition>" %
                    ut]
             np = len(xml)
@@ -3965,7 +4158,7 @@ class XMLConfiguratorTest(unittest.TestCase):
 
             oname = "mcs_test_component"
             self.assertTrue(isinstance(avc, list))
-            xml = ["<definition><group  name='entry' ><%s /></group>"
+            xml = ["<definition><group  name='entry' ><%s/></group>"
                    "</definition>" %
                    ut]
             np = len(xml)
@@ -4012,7 +4205,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             oname = "mcs_test_component"
             self.assertTrue(isinstance(avc, list))
             xml = [
-                "<definition><link  name='entry' ><%s /></link>"
+                "<definition><link  name='entry' ><%s/></link>"
                 "</definition>" % ut]
             np = len(xml)
             name = []
@@ -4072,7 +4265,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             oname = "mcs_test_component"
             self.assertTrue(isinstance(avc, list))
             xml = [
-                "<definition><link  name='entry' ><%s /></link>"
+                "<definition><link  name='entry' ><%s/></link>"
                 "</definition>" % ut]
             np = len(xml)
             name = []
@@ -4277,7 +4470,7 @@ class XMLConfiguratorTest(unittest.TestCase):
         self.assertEqual(
             xml.replace(">\n", ">"),
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" />'
+            '<definition><group type="NXentry"/>'
             '</definition>')
 
         self.assertEqual(el.deleteComponent(name), None)
@@ -4293,6 +4486,128 @@ class XMLConfiguratorTest(unittest.TestCase):
         el.setMandatoryComponents(man)
         el.close()
 
+    # merge test
+    # \brief It tests merging extending the last merged components
+    def test_merge_incremental(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        el = self.openConf()
+        man = el.mandatoryComponents()
+        el.unsetMandatoryComponents(man)
+        self.__man += man
+
+        avc = el.availableComponents()
+        name = "mcs_test_component"
+        while any(("%s%s" % (name, i)) in avc for i in range(3)):
+            name = name + '_1'
+        names = ["%s%s" % (name, i) for i in range(3)]
+        xml = "<?xml version='1.0' encoding='utf8'?><definition>" \
+              "<group type='NXentry' name='entry'><field name='f%s'>" \
+              "<datasource name='ds%s'/><strategy mode='%s'/></field>" \
+              "</group></definition>"
+        fds = [(0, 0, "INIT"), (1, 1, "FINAL"), (0, 0, "INIT")]
+        for i, nm in enumerate(names):
+            self.setXML(el, xml % fds[i])
+            self.assertEqual(el.storeComponent(nm), None)
+            self.__cmps.append(nm)
+        el.stepdatasources = '["ds0", "ds2"]'
+
+        def fields(xml):
+            root = etree.fromstring(xml.encode("utf8"))
+            return sorted(
+                (field.get("name"),
+                 field.find("datasource").get("name"),
+                 field.find("strategy").get("mode"))
+                for field in root.iter("field"))
+
+        self.assertEqual(fields(el.merge(names[:1])),
+                         [("f0", "ds0", "STEP")])
+        self.assertEqual(fields(el.merge(names[:2])),
+                         [("f0", "ds0", "STEP"), ("f1", "ds1", "FINAL")])
+        self.assertEqual(fields(el.merge(names)),
+                         [("f0", "ds0", "STEP"), ("f1", "ds1", "FINAL")])
+
+        self.setXML(el, xml % (2, 2, "INIT"))
+        self.assertEqual(el.storeComponent(names[2]), None)
+        self.assertEqual(fields(el.merge(names)),
+                         [("f0", "ds0", "STEP"), ("f1", "ds1", "FINAL"),
+                          ("f2", "ds2", "STEP")])
+        self.assertEqual(fields(el.merge(names[1:])),
+                         [("f1", "ds1", "FINAL"), ("f2", "ds2", "STEP")])
+
+        el2 = self.openConf()
+        el2.stepdatasources = '["ds0", "ds2"]'
+        self.assertEqual(fields(el2.merge(names)), fields(el.merge(names)))
+        el2.close()
+
+        for nm in names:
+            self.assertEqual(el.deleteComponent(nm), None)
+            self.__cmps.pop()
+        el.setMandatoryComponents(man)
+        el.close()
+
+    # merge test
+    # \brief It tests merging with cached component trees
+    def test_merge_tree_cache(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        el = self.openConf()
+        man = el.mandatoryComponents()
+        el.unsetMandatoryComponents(man)
+        self.__man += man
+
+        avc = el.availableComponents()
+        name = "mcs_test_component"
+        while any(("%s%s" % (name, i)) in avc for i in range(2)):
+            name = name + '_1'
+        names = ["%s%s" % (name, i) for i in range(2)]
+        xml = "<?xml version='1.0' encoding='utf8'?><definition>" \
+              "<group type='NXentry' name='entry'>" \
+              "<field name='f%s'/></group></definition>"
+        for i, nm in enumerate(names):
+            self.setXML(el, xml % i)
+            self.assertEqual(el.storeComponent(nm), None)
+            self.__cmps.append(nm)
+
+        expected = [
+            '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
+            '<group type="NXentry" name="entry"><field name="f0"/>'
+            '</group></definition>',
+            '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
+            '<group type="NXentry" name="entry"><field name="f0"/>'
+            '<field name="f1"/></group></definition>',
+            '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
+            '<group type="NXentry" name="entry"><field name="f1"/>'
+            '<field name="f2"/></group></definition>',
+        ]
+        info = el.cacheStatistics()["trees"]
+        hits = info["hits"]
+        misses = info["misses"]
+        checkxmls(self, el.merge(names), expected[1])
+        info = el.cacheStatistics()["trees"]
+        self.assertEqual(info["misses"], misses + 2)
+        self.assertEqual(info["hits"], hits)
+        checkxmls(self, el.merge(names[:1]), expected[0])
+        checkxmls(self, el.merge(names[1:] + names[:1]), expected[1])
+        info = el.cacheStatistics()["trees"]
+        self.assertEqual(info["misses"], misses + 2)
+        self.assertEqual(info["hits"], hits + 2)
+
+        self.setXML(el, xml % 2)
+        self.assertEqual(el.storeComponent(names[0]), None)
+        checkxmls(self, el.merge(names), expected[2])
+        info = el.cacheStatistics()["trees"]
+        self.assertEqual(info["misses"], misses + 3)
+        self.assertEqual(info["hits"], hits + 3)
+
+        for nm in names:
+            self.assertEqual(el.deleteComponent(nm), None)
+            self.__cmps.pop()
+        el.setMandatoryComponents(man)
+        el.close()
+
     # creatConf test
     # \brief It tests XMLConfigurator
     def test_merge_default_2_var(self):
@@ -4334,7 +4649,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             xml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group name="$var.myentry" type="NXentry" /></definition>')
+            '<group name="$var.myentry" type="NXentry"/></definition>')
 
         el.variables = '{"myentry":"entry1"}'
         xml = el.merge([name])
@@ -4343,7 +4658,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             xml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group name="$var.myentry" type="NXentry" /></definition>')
+            '<group name="$var.myentry" type="NXentry"/></definition>')
 
         self.assertEqual(el.deleteComponent(name), None)
         self.__cmps.pop()
@@ -4408,14 +4723,14 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             xml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group name="$var.myentry" type="NXentry" /></definition>')
+            '<group name="$var.myentry" type="NXentry"/></definition>')
 
         xml = el.merge([name, name2])
         checkxmls(
             self,
             xml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group name="$var.myentry" type="NXentry" />'
+            '<group name="$var.myentry" type="NXentry"/>'
             '<doc>$var(myentry=entry2)</doc></definition>')
         el.variables = '{"myentry":"entry1"}'
         xml = el.merge([name])
@@ -4424,7 +4739,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             xml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group name="$var.myentry" type="NXentry" /></definition>')
+            '<group name="$var.myentry" type="NXentry"/></definition>')
 
         self.assertEqual(el.deleteComponent(name2), None)
         self.__cmps.pop()
@@ -4482,7 +4797,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             xml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group name="$var.myentry" type="$var.entryType" />'
+            '<group name="$var.myentry" type="$var.entryType"/>'
             '</definition>')
         el.variables = '{"myentry":"entry1", "entryType":"NXentry"}'
         xml = el.merge([name])
@@ -4491,7 +4806,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             xml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group name="$var.myentry" type="$var.entryType" />'
+            '<group name="$var.myentry" type="$var.entryType"/>'
             '</definition>')
 
         self.assertEqual(el.deleteComponent(name), None)
@@ -4595,7 +4910,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group type="NXentry" /></definition>')
+            '<group type="NXentry"/></definition>')
 
         self.assertEqual(el.deleteComponent(name[1]), None)
         self.__cmps.pop()
@@ -4644,7 +4959,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group type="NXentry" /></definition>')
+            '<group type="NXentry"/></definition>')
 
         for i in range(np):
             self.assertEqual(el.deleteComponent(name[i]), None)
@@ -4692,7 +5007,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry2" /><group type="NXentry" />'
+            '<definition><group type="NXentry2"/><group type="NXentry"/>'
             '</definition>')
 
         for i in range(np):
@@ -4741,8 +5056,8 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry2" />'
-            'second group<group type="NXentry" />'
+            '<definition><group type="NXentry2"/>'
+            'second group<group type="NXentry"/>'
             '</definition>')
 
         for i in range(np):
@@ -4791,8 +5106,8 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry2" />'
-            '<group type="NXentry" />first group'
+            '<definition><group type="NXentry2"/>'
+            '<group type="NXentry"/>first group'
             '</definition>')
 
         for i in range(np):
@@ -4841,8 +5156,8 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition>before<group type="NXentry2" />'
-            '<group type="NXentry" />'
+            '<definition>before<group type="NXentry2"/>'
+            '<group type="NXentry"/>'
             '</definition>')
 
         for i in range(np):
@@ -4892,7 +5207,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
             '<definition>'
-            '<group type="NXentry" />after'
+            '<group type="NXentry"/>after'
             '</definition>')
 
         for i in range(np):
@@ -5052,10 +5367,10 @@ class XMLConfiguratorTest(unittest.TestCase):
             gxml,
             [
                 '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-                '<definition><group type="NXentry"><doc />txt</group>'
+                '<definition><group type="NXentry"><doc/>txt</group>'
                 '</definition>',
                 '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-                '<definition><group type="NXentry">txt<doc /></group>'
+                '<definition><group type="NXentry">txt<doc/></group>'
                 '</definition>'
             ]
         )
@@ -5108,10 +5423,10 @@ class XMLConfiguratorTest(unittest.TestCase):
             gxml,
             [
                 '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-                '<definition><group type="NXentry"><doc />txt</group>'
+                '<definition><group type="NXentry"><doc/>txt</group>'
                 '</definition>',
                 '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-                '<definition><group type="NXentry">txt<doc /></group>'
+                '<definition><group type="NXentry">txt<doc/></group>'
                 '</definition>'
             ]
         )
@@ -5246,7 +5561,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
             '<definition><group type="NXentry">'
-            '<field type="field" /></group></definition>')
+            '<field type="field"/></group></definition>')
 
         for i in range(np):
             self.assertEqual(el.deleteComponent(name[i]), None)
@@ -5297,8 +5612,8 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry2" /><field name="field1" />'
-            '<group type="NXentry"><field name="field1" />'
+            '<definition><group type="NXentry2"/><field name="field1"/>'
+            '<group type="NXentry"><field name="field1"/>'
             '</group></definition>')
 
         for i in range(np):
@@ -5347,7 +5662,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group name="entry" type="NXentry2" /></definition>')
+            '<group name="entry" type="NXentry2"/></definition>')
 
         for i in range(np):
             self.assertEqual(el.deleteComponent(name[i]), None)
@@ -5395,7 +5710,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group name="entry" type="NXentry" /></definition>')
+            '<group name="entry" type="NXentry"/></definition>')
 
         for i in range(np):
             self.assertEqual(el.deleteComponent(name[i]), None)
@@ -5443,8 +5758,8 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group name="entry" type="NXentry" />'
-            '<group name="entry2" /></definition>')
+            '<definition><group name="entry" type="NXentry"/>'
+            '<group name="entry2"/></definition>')
 
         for i in range(np):
             self.assertEqual(el.deleteComponent(name[i]), None)
@@ -5493,7 +5808,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group type="NXentry"><field type="field" />'
+            '<group type="NXentry"><field type="field"/>'
             '</group></definition>')
 
         for i in range(np):
@@ -5546,7 +5861,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry">'
-            '<field type="field" /></group></definition>')
+            '<field type="field"/></group></definition>')
 
         for i in range(np):
             self.assertEqual(el.deleteComponent(name[i]), None)
@@ -5695,9 +6010,9 @@ class XMLConfiguratorTest(unittest.TestCase):
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
             '<definition><group name="entry2" type="NXentry2">'
-            '<field type="field" /></group>'
+            '<field type="field"/></group>'
             '<group name="entry" type="NXentry">'
-            '<field type="field" /></group></definition>')
+            '<field type="field"/></group></definition>')
 
         for i in range(np):
             self.assertEqual(el.deleteComponent(name[i]), None)
@@ -5821,7 +6136,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self.assertTrue(isinstance(avc, list))
             xml = [
                 "<definition><field  name='entry' ><datasource type='TANGO'>"
-                "<%s /></datasource></field></definition>" % ut]
+                "<%s/></datasource></field></definition>" % ut]
             np = len(xml)
             name = []
             for i in range(np):
@@ -5842,7 +6157,7 @@ class XMLConfiguratorTest(unittest.TestCase):
                 gxml,
                 '<?xml version=\'1.0\' encoding=\'utf8\'?>'
                 '<definition><field name="entry">'
-                '<datasource type="TANGO"><%s /></datasource></field>'
+                '<datasource type="TANGO"><%s/></datasource></field>'
                 '</definition>' % (ut))
 
             for i in range(np):
@@ -5880,7 +6195,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self.assertTrue(isinstance(avc, list))
             xml = [
                 "<definition><field  name='entry' ><datasource type='TANGO'>"
-                "<%s /></datasource></field></definition>" % ut]
+                "<%s/></datasource></field></definition>" % ut]
             np = len(xml)
             name = []
             for i in range(np):
@@ -5925,7 +6240,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self.assertTrue(isinstance(avc, list))
             xml = [
                 "<definition><field  name='entry' ><attribute type='TANGO'>"
-                "<%s /></attribute></field></definition>" % ut]
+                "<%s/></attribute></field></definition>" % ut]
             np = len(xml)
             name = []
             for i in range(np):
@@ -5946,7 +6261,7 @@ class XMLConfiguratorTest(unittest.TestCase):
                 gxml,
                 '<?xml version=\'1.0\' encoding=\'utf8\'?>'
                 '<definition><field name="entry">'
-                '<attribute type="TANGO"><%s /></attribute></field>'
+                '<attribute type="TANGO"><%s/></attribute></field>'
                 '</definition>' % (ut))
 
             for i in range(np):
@@ -5982,7 +6297,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self.assertTrue(isinstance(avc, list))
             xml = [
                 "<definition><field  name='entry' ><attribute type='TANGO'>"
-                "<%s /></attribute></field></definition>" % ut]
+                "<%s/></attribute></field></definition>" % ut]
             np = len(xml)
             name = []
             for i in range(np):
@@ -6025,7 +6340,7 @@ class XMLConfiguratorTest(unittest.TestCase):
 
             oname = "mcs_test_component"
             self.assertTrue(isinstance(avc, list))
-            xml = ["<definition><%s  name='entry' /></definition>" % ut]
+            xml = ["<definition><%s  name='entry'/></definition>" % ut]
             np = len(xml)
             name = []
             for i in range(np):
@@ -6045,7 +6360,7 @@ class XMLConfiguratorTest(unittest.TestCase):
                 self,
                 gxml,
                 '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-                '<definition><%s name="entry" />'
+                '<definition><%s name="entry"/>'
                 '</definition>' % (ut))
 
             for i in range(np):
@@ -6081,7 +6396,7 @@ class XMLConfiguratorTest(unittest.TestCase):
 
             oname = "mcs_test_component"
             self.assertTrue(isinstance(avc, list))
-            xml = ["<definition><%s  name='entry' /></definition>" % ut]
+            xml = ["<definition><%s  name='entry'/></definition>" % ut]
             np = len(xml)
             name = []
             for i in range(np):
@@ -6126,7 +6441,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self.assertTrue(isinstance(avc, list))
             xml = [
                 "<definition><field  name='entry' ><dimensions type='TANGO'>"
-                "<%s /></dimensions></field></definition>" % ut]
+                "<%s/></dimensions></field></definition>" % ut]
             np = len(xml)
             name = []
             for i in range(np):
@@ -6147,7 +6462,7 @@ class XMLConfiguratorTest(unittest.TestCase):
                 gxml,
                 '<?xml version=\'1.0\' encoding=\'utf8\'?>'
                 '<definition><field name="entry">'
-                '<dimensions type="TANGO"><%s /></dimensions></field>'
+                '<dimensions type="TANGO"><%s/></dimensions></field>'
                 '</definition>' % (ut))
 
             for i in range(np):
@@ -6184,7 +6499,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self.assertTrue(isinstance(avc, list))
             xml = [
                 "<definition><field  name='entry' ><dimensions type='TANGO'>"
-                "<%s /></dimensions></field></definition>" % ut]
+                "<%s/></dimensions></field></definition>" % ut]
             np = len(xml)
             name = []
             for i in range(np):
@@ -6227,7 +6542,7 @@ class XMLConfiguratorTest(unittest.TestCase):
 
             oname = "mcs_test_component"
             self.assertTrue(isinstance(avc, list))
-            xml = ["<definition><field  name='entry' ><%s /></field>"
+            xml = ["<definition><field  name='entry' ><%s/></field>"
                    "</definition>" %
                    ut]
             np = len(xml)
@@ -6250,7 +6565,7 @@ class XMLConfiguratorTest(unittest.TestCase):
                 gxml,
                 '<?xml version=\'1.0\' encoding=\'utf8\'?>'
                 '<definition><field name="entry">'
-                '<%s /></field></definition>' % (ut))
+                '<%s/></field></definition>' % (ut))
 
             for i in range(np):
                 self.assertEqual(el.deleteComponent(name[i]), None)
@@ -6284,7 +6599,7 @@ class XMLConfiguratorTest(unittest.TestCase):
 
             oname = "mcs_test_component"
             self.assertTrue(isinstance(avc, list))
-            xml = ["<definition><field  name='entry' ><%s /></field>"
+            xml = ["<definition><field  name='entry' ><%s/></field>"
                    "</definition>" %
                    ut]
             np = len(xml)
@@ -6329,7 +6644,7 @@ class XMLConfiguratorTest(unittest.TestCase):
 
             oname = "mcs_test_component"
             self.assertTrue(isinstance(avc, list))
-            xml = ["<definition><group  name='entry' ><%s /></group>"
+            xml = ["<definition><group  name='entry' ><%s/></group>"
                    "</definition>" %
                    ut]
             np = len(xml)
@@ -6351,7 +6666,7 @@ class XMLConfiguratorTest(unittest.TestCase):
                 self,
                 gxml,
                 '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-                '<group name="entry"><%s /></group></definition>' % (ut))
+                '<group name="entry"><%s/></group></definition>' % (ut))
 
             for i in range(np):
                 self.assertEqual(el.deleteComponent(name[i]), None)
@@ -6385,7 +6700,7 @@ class XMLConfiguratorTest(unittest.TestCase):
 
             oname = "mcs_test_component"
             self.assertTrue(isinstance(avc, list))
-            xml = ["<definition><group  name='entry' ><%s /></group>"
+            xml = ["<definition><group  name='entry' ><%s/></group>"
                    "</definition>" %
                    ut]
             np = len(xml)
@@ -6431,7 +6746,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             oname = "mcs_test_component"
             self.assertTrue(isinstance(avc, list))
             xml = [
-                "<definition><link  name='entry' ><%s /></link>"
+                "<definition><link  name='entry' ><%s/></link>"
                 "</definition>" % ut]
             np = len(xml)
             name = []
@@ -6453,7 +6768,7 @@ class XMLConfiguratorTest(unittest.TestCase):
                 gxml,
                 '<?xml version=\'1.0\' encoding=\'utf8\'?>'
                 '<definition><link name="entry">'
-                '<%s /></link></definition>' % (ut))
+                '<%s/></link></definition>' % (ut))
 
             for i in range(np):
                 self.assertEqual(el.deleteComponent(name[i]), None)
@@ -6490,7 +6805,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             oname = "mcs_test_component"
             self.assertTrue(isinstance(avc, list))
             xml = [
-                "<definition><link  name='entry' ><%s /></link>"
+                "<definition><link  name='entry' ><%s/></link>"
                 "</definition>" % ut]
             np = len(xml)
             name = []
@@ -6557,7 +6872,7 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry2" /><group type="NXentry" />'
+            '<definition><group type="NXentry2"/><group type="NXentry"/>'
             '</definition>')
 
         el.unsetMandatoryComponents([name[0]])
@@ -6615,8 +6930,8 @@ class XMLConfiguratorTest(unittest.TestCase):
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry2" /><group type="NXentry3" />'
-            '<group type="NXentry" /></definition>')
+            '<definition><group type="NXentry2"/><group type="NXentry3"/>'
+            '<group type="NXentry"/></definition>')
 
         el.unsetMandatoryComponents([name[1]])
 
@@ -6651,13 +6966,13 @@ class XMLConfiguratorTest(unittest.TestCase):
 
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" name="entry$var.%s" />'
+        xml = ['<definition><group type="NXentry" name="entry$var.%s"/>'
                '<field name="field1">some</field></definition>'
                % (vrs[0]),
-               '<definition><group type="NXentry" /><field name="field2">'
+               '<definition><group type="NXentry"/><field name="field2">'
                '$var.%s</field></definition>'
                % (vrs[1]),
-               '<definition><group type="NXentry" /><field name="field3">'
+               '<definition><group type="NXentry"/><field name="field3">'
                '$var.%s</field><field name="field4">$var.%s</field>'
                '</definition>'
                % (vrs[2], vrs[3])
@@ -6707,13 +7022,13 @@ class XMLConfiguratorTest(unittest.TestCase):
 
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" name="entry$var.%s" />'
+        xml = ['<definition><group type="NXentry" name="entry$var.%s"/>'
                '<field name="field1">some</field></definition>'
                % (vrs[0]),
-               '<definition><group type="NXentry" /><field name="field2">'
+               '<definition><group type="NXentry"/><field name="field2">'
                '$var.%s</field></definition>'
                % (vrs[1]),
-               '<definition><group type="NXentry" /><field name="field3">'
+               '<definition><group type="NXentry"/><field name="field3">'
                '$var.%s</field><field name="field4">$var.%s</field>'
                '</definition>'
                % (vrs[2], vrs[3])
@@ -6772,24 +7087,24 @@ class XMLConfiguratorTest(unittest.TestCase):
 #        print(avc
 
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" /><field name="field4">'
+        xml = ['<definition><group type="NXentry"/><field name="field4">'
                '</field><field name="field4"></field>'
                '$components.%s$components.%s</definition>'
                % (name[1], name[2]),
                '<definition>$components.%s$components.%s'
-               '<group type="NXentry" /><field name="field5"></field>'
+               '<group type="NXentry"/><field name="field5"></field>'
                '<field name="field4"></field></definition>'
                % (name[2], name[3]),
                '<definition>'
-               '<group type="NXentry" name="entry$components.%s" />'
+               '<group type="NXentry" name="entry$components.%s"/>'
                '<field name="field">some</field></definition>'
                % (name[4]),
-               '<definition><group type="NXentry" /><field name="field1">'
+               '<definition><group type="NXentry"/><field name="field1">'
                '$components.%s</field></definition>'
                % (name[5]),
-               '<definition><group type="NXentry" /><field name="field2">'
+               '<definition><group type="NXentry"/><field name="field2">'
                '</field><field name="field4"></field></definition>',
-               '<definition><group type="NXentry" /><field name="field3">'
+               '<definition><group type="NXentry"/><field name="field3">'
                '</field><field name="field4"></field></definition>'
                ]
 
@@ -6903,24 +7218,24 @@ class XMLConfiguratorTest(unittest.TestCase):
 #        print(avc
 
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" /><field name="field4">'
+        xml = ['<definition><group type="NXentry"/><field name="field4">'
                '</field><field name="field4"></field>'
                '$components.%s$components.%s</definition>'
                % (name[1], name[2]),
                '<definition>$components.%s$components.%s'
-               '<group type="NXentry" /><field name="field5"></field>'
+               '<group type="NXentry"/><field name="field5"></field>'
                '<field name="field4"></field></definition>'
                % (name[2], name[3]),
                '<definition>'
-               '<group type="NXentry" name="entry$components.%s" />'
+               '<group type="NXentry" name="entry$components.%s"/>'
                '<field name="field">some</field></definition>'
                % (name[4]),
-               '<definition><group type="NXentry" /><field name="field1">'
+               '<definition><group type="NXentry"/><field name="field1">'
                '$components.%s</field></definition>'
                % (name[5]),
-               '<definition><group type="NXentry" /><field name="field2">'
+               '<definition><group type="NXentry"/><field name="field2">'
                '</field><field name="field4"></field></definition>',
-               '<definition><group type="NXentry" /><field name="field3">'
+               '<definition><group type="NXentry"/><field name="field3">'
                '</field><field name="field4"></field></definition>'
                ]
 
@@ -7006,6 +7321,136 @@ class XMLConfiguratorTest(unittest.TestCase):
         el.setMandatoryComponents(man)
         el.close()
 
+    # dependentComponents test
+    # \brief It tests XMLConfigurator with cyclic dependencies
+    def test_dependentComponents_cycle(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        el = self.openConf()
+        man = el.mandatoryComponents()
+        el.unsetMandatoryComponents(man)
+        self.__man += man
+
+        oname = "mcs_test_component"
+        avc = el.availableComponents()
+
+        np = 4
+        name = []
+        for i in range(np):
+            name.append(oname + '_%s' % i)
+            while name[i] in avc:
+                name[i] = name[i] + '_%s' % i
+
+        xml = ['<definition><group type="NXentry"/>'
+               '$components.%s</definition>' % name[1],
+               '<definition><group type="NXentry"/>'
+               '$components.%s</definition>' % name[2],
+               '<definition><group type="NXentry"/>'
+               '$components.%s</definition>' % name[0],
+               '<definition><group type="NXentry"/>'
+               '$components.%s</definition>' % name[3],
+               ]
+
+        for i in range(np):
+            self.setXML(el, xml[i])
+            self.assertEqual(el.storeComponent(name[i]), None)
+            self.__cmps.append(name[i])
+
+        for i in range(np):
+            self.assertRaises(
+                CyclicDependencyError, el.dependentComponents, [name[i]])
+
+        self.setXML(el, '<definition><group type="NXentry"/>'
+                    '</definition>')
+        self.assertEqual(el.storeComponent(name[2]), None)
+        self.assertEqual(sorted(el.dependentComponents([name[0]])),
+                         sorted(name[:3]))
+        self.assertRaises(
+            CyclicDependencyError, el.dependentComponents, [name[3]])
+
+        el.setMandatoryComponents(man)
+        el.close()
+
+    # dependencyGraph test
+    # \brief It tests XMLConfigurator
+    def test_dependencyGraph(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        el = self.openConf()
+        el2 = self.openConf()
+        man = el.mandatoryComponents()
+        el.unsetMandatoryComponents(man)
+        self.__man += man
+
+        oname = "mcs_test_component"
+        avc = el.availableComponents()
+
+        np = 3
+        name = []
+        for i in range(np):
+            name.append(oname + '_%s' % i)
+            while name[i] in avc:
+                name[i] = name[i] + '_%s' % i
+        ds = ["mcs_test_depds_0", "mcs_test_depds_1"]
+
+        xml = ['<definition><group type="NXentry" name="$var.entry#'
+               '\'scan\'"/>$components.%s<field>$datasources.%s</field>'
+               '</definition>' % (name[1], ds[0]),
+               '<definition><group type="NXentry"/>'
+               '$datasources.%s $datasources.%s</definition>'
+               % (ds[0], ds[1]),
+               '<definition><group type="NXentry"/></definition>',
+               ]
+
+        for i in range(np):
+            self.setXML(el, xml[i])
+            self.assertEqual(el.storeComponent(name[i]), None)
+            self.__cmps.append(name[i])
+
+        graph = json.loads(el.dependencyGraph([name[0]]))
+        self.assertEqual(graph["revision"], el.version.split('.')[-1])
+        self.assertEqual(
+            graph["components"],
+            {name[0]: {"components": [name[1]], "datasources": [ds[0]],
+                       "variables": ["entry"], "usedby": []},
+             name[1]: {"components": [], "datasources": ds,
+                       "variables": [], "usedby": [name[0]]}})
+        self.assertEqual(
+            graph["datasources"],
+            {ds[0]: [name[0], name[1]], ds[1]: [name[1]]})
+
+        graph = json.loads(el.dependencyGraph([]))
+        for i in range(np):
+            self.assertTrue(name[i] in graph["components"])
+        self.assertEqual(
+            graph["components"][name[2]],
+            {"components": [], "datasources": [],
+             "variables": [], "usedby": []})
+
+        self.setXML(el2, '<definition>$components.%s $datasources.%s'
+                    '</definition>' % (name[0], ds[1]))
+        self.assertEqual(el2.storeComponent(name[2]), None)
+        graph = json.loads(el.dependencyGraph([name[2]]))
+        self.assertEqual(sorted(graph["components"].keys()), sorted(name))
+        self.assertEqual(graph["datasources"][ds[1]], [name[1], name[2]])
+        self.assertEqual(graph["components"][name[0]]["usedby"], [name[2]])
+
+        el.deleteComponent(name[1])
+        self.__cmps.remove(name[1])
+        graph = json.loads(el.dependencyGraph([]))
+        self.assertTrue(name[1] not in graph["components"])
+        self.assertEqual(graph["datasources"][ds[0]], [name[0]])
+        self.myAssertRaise(
+            NonregisteredDBRecordError, el.dependentComponents, [name[2]])
+        self.myAssertRaise(
+            NonregisteredDBRecordError, el.dependencyGraph, [name[1]])
+
+        el.setMandatoryComponents(man)
+        el2.close()
+        el.close()
+
     # creatConf test
     # \brief It tests XMLConfigurator
     def test_componentDataSources(self):
@@ -7022,13 +7467,13 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -7050,13 +7495,13 @@ class XMLConfiguratorTest(unittest.TestCase):
 
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" /><field name="field1">%s'
+        xml = ['<definition><group type="NXentry"/><field name="field1">%s'
                '</field></definition>'
                % (xds[0] % dsname[0]),
-               '<definition><group type="NXentry" /><field name="field2">%s'
+               '<definition><group type="NXentry"/><field name="field2">%s'
                '</field></definition>'
                % (xds[1] % dsname[1]),
-               '<definition><group type="NXentry" /><field name="field3">%s'
+               '<definition><group type="NXentry"/><field name="field3">%s'
                '</field><field name="field4">%s</field></definition>'
                % (xds[2] % dsname[2], xds[3] % dsname[3])
                ]
@@ -7103,13 +7548,13 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -7131,13 +7576,13 @@ class XMLConfiguratorTest(unittest.TestCase):
 
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" /><field name="field1">%s'
+        xml = ['<definition><group type="NXentry"/><field name="field1">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[0]),
-               '<definition><group type="NXentry" /><field name="field2">%s'
+               '<definition><group type="NXentry"/><field name="field2">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[1]),
-               '<definition><group type="NXentry" /><field name="field3">%s'
+               '<definition><group type="NXentry"/><field name="field3">%s'
                '</field><field name="field4">%s</field></definition>'
                % ("$datasources.%s" % dsname[2], "$datasources.%s" % dsname[3])
                ]
@@ -7184,13 +7629,13 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -7212,23 +7657,23 @@ class XMLConfiguratorTest(unittest.TestCase):
 
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" /><field name="field1">%s'
+        xml = ['<definition><group type="NXentry"/><field name="field1">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[0]),
-               '<definition><group type="NXentry" /><field name="field2">%s'
+               '<definition><group type="NXentry"/><field name="field2">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[1]),
-               '<definition><group type="NXentry" /><field name="field3">%s'
+               '<definition><group type="NXentry"/><field name="field3">%s'
                '</field><field name="field4">%s</field></definition>'
                % ("$datasources.%s" % dsname[2], "$datasources.%s" % dsname[3])
                ]
 
         xml2 = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>',
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>',
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
         ]
 
@@ -7326,13 +7771,13 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -7354,26 +7799,26 @@ class XMLConfiguratorTest(unittest.TestCase):
 
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" /><field name="field1">%s'
+        xml = ['<definition><group type="NXentry"/><field name="field1">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[0]),
-               '<definition><group type="NXentry" /><field name="field2">%s'
+               '<definition><group type="NXentry"/><field name="field2">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[1]),
-               '<definition><group type="NXentry" /><field name="field3">%s'
+               '<definition><group type="NXentry"/><field name="field3">%s'
                '</field><field name="field4">%s</field></definition>'
                % ("$datasources.%s" % dsname[2], "$datasources.%s" % dsname[3])
                ]
 
         xml2 = [
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" />'
+            '<definition><group type="NXentry"/>'
             '<field name="field1">%s'
             '</field></definition>',
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>',
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" />'
+            '<definition><group type="NXentry"/>'
             '<field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
         ]
@@ -7472,13 +7917,13 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -7500,23 +7945,23 @@ class XMLConfiguratorTest(unittest.TestCase):
 
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" /><field name="field1">%s'
+        xml = ['<definition><group type="NXentry"/><field name="field1">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[0]),
-               '<definition><group type="NXentry" /><field name="field2">%s'
+               '<definition><group type="NXentry"/><field name="field2">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[1]),
-               '<definition><group type="NXentry" /><field name="field3">%s'
+               '<definition><group type="NXentry"/><field name="field3">%s'
                '</field><field name="field4">%s</field></definition>'
                % ("$datasources.%s" % dsname[2], "$datasources.%s" % dsname[3])
                ]
 
         xml2 = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>',
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>',
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
         ]
 
@@ -7622,9 +8067,9 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>'
         ]
 
@@ -7649,13 +8094,13 @@ class XMLConfiguratorTest(unittest.TestCase):
 
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" /><field name="field1">%s'
+        xml = ['<definition><group type="NXentry"/><field name="field1">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[0]),
-               '<definition><group type="NXentry" /><field name="field2">%s'
+               '<definition><group type="NXentry"/><field name="field2">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[1]),
-               '<definition><group type="NXentry" /><field name="field3">%s'
+               '<definition><group type="NXentry"/><field name="field3">%s'
                '</field><field name="field4">%s</field></definition>'
                % ("$datasources.%s" % dsname[0], "$datasources.%s" % dsname[1])
                ]
@@ -7701,9 +8146,9 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>'
         ]
 
@@ -7727,13 +8172,13 @@ class XMLConfiguratorTest(unittest.TestCase):
 
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" /><field name="field1">%s'
+        xml = ['<definition><group type="NXentry"/><field name="field1">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[0]),
-               '<definition><group type="NXentry" /><field name="field2">%s'
+               '<definition><group type="NXentry"/><field name="field2">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[1]),
-               '<definition><group type="NXentry" /><field name="field3">'
+               '<definition><group type="NXentry"/><field name="field3">'
                '<datasource>%s%s</datasource></field></definition>'
                % ("$datasources.%s" % dsname[0], "$datasources.%s" % dsname[1])
                ]
@@ -7779,13 +8224,13 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -7807,13 +8252,13 @@ class XMLConfiguratorTest(unittest.TestCase):
 
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" /><field name="field1">%s'
+        xml = ['<definition><group type="NXentry"/><field name="field1">%s'
                '</field></definition>'
                % (xds[0] % dsname[0]),
-               '<definition><group type="NXentry" /><field name="field2">%s'
+               '<definition><group type="NXentry"/><field name="field2">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[1]),
-               '<definition><group type="NXentry" /><field name="field3">%s'
+               '<definition><group type="NXentry"/><field name="field3">%s'
                '</field><field name="field4">%s</field></definition>'
                % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
                ]
@@ -7859,13 +8304,13 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -7887,13 +8332,13 @@ class XMLConfiguratorTest(unittest.TestCase):
 
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" /><field name="field1">%s'
+        xml = ['<definition><group type="NXentry"/><field name="field1">%s'
                '</field></definition>'
                % (xds[0] % dsname[0]),
-               '<definition><group type="NXentry" /><field name="field2">%s'
+               '<definition><group type="NXentry"/><field name="field2">%s'
                '</field></definition>'
                % (xds[1] % dsname[1]),
-               '<definition><group type="NXentry" /><field name="field3">%s'
+               '<definition><group type="NXentry"/><field name="field3">%s'
                '</field><field name="field4">%s</field></definition>'
                % (xds[2] % dsname[2], xds[3] % dsname[3])
                ]
@@ -7938,13 +8383,13 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -7966,13 +8411,13 @@ class XMLConfiguratorTest(unittest.TestCase):
 
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" /><field name="field1">%s'
+        xml = ['<definition><group type="NXentry"/><field name="field1">%s'
                '</field></definition>'
                % (xds[0] % dsname[0]),
-               '<definition><group type="NXentry" /><field name="field2">%s'
+               '<definition><group type="NXentry"/><field name="field2">%s'
                '</field></definition>'
                % (xds[1] % dsname[1]),
-               '<definition><group type="NXentry" /><field name="field3">%s'
+               '<definition><group type="NXentry"/><field name="field3">%s'
                '</field><field name="field4">%s</field></definition>'
                % (xds[2] % dsname[2], xds[3] % dsname[3])
                ]
@@ -8021,13 +8466,13 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -8049,13 +8494,13 @@ class XMLConfiguratorTest(unittest.TestCase):
 
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" /><field name="field1">%s'
+        xml = ['<definition><group type="NXentry"/><field name="field1">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[0]),
-               '<definition><group type="NXentry" /><field name="field2">%s'
+               '<definition><group type="NXentry"/><field name="field2">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[1]),
-               '<definition><group type="NXentry" /><field name="field3">%s'
+               '<definition><group type="NXentry"/><field name="field3">%s'
                '</field><field name="field4">%s</field></definition>'
                % ("$datasources.%s" % dsname[2], "$datasources.%s" % dsname[3])
                ]
@@ -8084,6 +8529,143 @@ class XMLConfiguratorTest(unittest.TestCase):
         el.setMandatoryComponents(man)
         el.close()
 
+    # parallel reads test
+    # \brief It tests reading the configuration from parallel threads
+    def test_parallel_reads(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        el = self.openConf()
+        man = el.mandatoryComponents()
+        el.unsetMandatoryComponents(man)
+        self.__man += man
+
+        avc = el.availableComponents()
+        avds = el.availableDataSources()
+
+        dsname = []
+        name = []
+        for i in range(3):
+            dsname.append("mcs_test_datasource_%s" % i)
+            while dsname[i] in avds:
+                dsname[i] = dsname[i] + '_%s' % i
+            self.setXML(
+                el, '<definition><datasource name="%s" type="CLIENT">'
+                '<record name="r%s"/></datasource></definition>'
+                % (dsname[i], i))
+            self.assertEqual(el.storeDataSource(dsname[i]), None)
+            self.__ds.append(dsname[i])
+        for i in range(3):
+            name.append("mcs_test_component_%s" % i)
+            while name[i] in avc:
+                name[i] = name[i] + '_%s' % i
+            self.setXML(
+                el, '<definition><group type="NXentry" '
+                'name="$var.entry#\'e%s\'">'
+                '<field name="field%s">$datasources.%s</field>'
+                '<field name="extra%s">$datasources.%s</field>'
+                '</group></definition>'
+                % (i, i, dsname[i], i, dsname[(i + 1) % 3]))
+            self.assertEqual(el.storeComponent(name[i]), None)
+            self.__cmps.append(name[i])
+
+        # merged component order depends on previously merged trees
+        calls = [
+            (el.componentsDataSources, [name[0], name[1]], sorted),
+            (el.componentsDataSources, [name[2]], sorted),
+            (el.instantiatedComponents, [name[1], name[2]], list),
+            (el.merge, [name[0], name[2]], None),
+            (el.components, [name[0], name[1], name[2]], list),
+            (el.dependentComponents, [name[1]], sorted),
+        ]
+        expected = [fn(args) for fn, args, _ in calls]
+        results = []
+        errors = []
+
+        def read(index):
+            try:
+                for k in range(10):
+                    ci = (index + k) % len(calls)
+                    fn, args, _ = calls[ci]
+                    results.append((ci, fn(args)))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=read, args=(i,))
+                   for i in range(4)]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(results), 40)
+        for ci, result in results:
+            order = calls[ci][2]
+            if order is None:
+                checkxmls(self, result, expected[ci])
+            else:
+                self.assertEqual(order(result), order(expected[ci]))
+
+        el.setMandatoryComponents(man)
+        el.close()
+
+    # creatConf test
+    # \brief It tests XMLConfigurator
+    def test_componentsDataSources_nested_attribute(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        el = self.openConf()
+        man = el.mandatoryComponents()
+        el.unsetMandatoryComponents(man)
+        self.__man += man
+
+        avc = el.availableComponents()
+        avds = el.availableDataSources()
+
+        dsname = []
+        for i in range(3):
+            dsname.append("mcs_test_datasource_%s" % i)
+            while dsname[i] in avds:
+                dsname[i] = dsname[i] + '_%s' % i
+        xds = [
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
+            '</datasource>' % dsname[0],
+            '<definition><datasource name="%s" type="PYEVAL">'
+            '$datasources.%s<result>ds.result = 1</result></datasource>'
+            '</definition>' % (dsname[1], dsname[0]),
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
+            '</datasource>' % dsname[2],
+        ]
+        for i in range(3):
+            self.setXML(el, xds[i])
+            self.assertEqual(el.storeDataSource(dsname[i]), None)
+            self.__ds.append(dsname[i])
+
+        name = "mcs_test_component"
+        while name in avc:
+            name = name + '_1'
+        self.setXML(
+            el, '<definition><group type="NXentry" name="entry">'
+            '<field name="field1" units="$datasources.%s">'
+            '$datasources.%s</field></group></definition>'
+            % (dsname[2], dsname[1]))
+        self.assertEqual(el.storeComponent(name), None)
+        self.__cmps.append(name)
+
+        self.assertEqual(el.componentsDataSources([name]),
+                         [dsname[1], dsname[0]])
+        el.createConfiguration([name])
+        root = etree.fromstring(el.xmlstring.encode("utf8"))
+        self.assertEqual(
+            [ds.get("name") for ds in root.iter("datasource")],
+            [dsname[1], dsname[0]])
+        self.assertTrue(
+            'name="%s"' % dsname[2] in root.find(".//field").get("units"))
+
+        el.setMandatoryComponents(man)
+        el.close()
+
     # creatConf test
     # \brief It tests XMLConfigurator
     def test_componentsDataSources_external_2(self):
@@ -8100,9 +8682,9 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>'
         ]
 
@@ -8126,13 +8708,13 @@ class XMLConfiguratorTest(unittest.TestCase):
 
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" /><field name="field1">%s'
+        xml = ['<definition><group type="NXentry"/><field name="field1">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[0]),
-               '<definition><group type="NXentry" /><field name="field2">%s'
+               '<definition><group type="NXentry"/><field name="field2">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[1]),
-               '<definition><group type="NXentry" /><field name="field3">%s'
+               '<definition><group type="NXentry"/><field name="field3">%s'
                '</field><field name="field4">%s</field></definition>'
                % ("$datasources.%s" % dsname[0], "$datasources.%s" % dsname[1])
                ]
@@ -8176,9 +8758,9 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>'
         ]
 
@@ -8202,13 +8784,13 @@ class XMLConfiguratorTest(unittest.TestCase):
 
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" /><field name="field1">%s'
+        xml = ['<definition><group type="NXentry"/><field name="field1">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[0]),
-               '<definition><group type="NXentry" /><field name="field2">%s'
+               '<definition><group type="NXentry"/><field name="field2">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[1]),
-               '<definition><group type="NXentry" /><field name="field3">'
+               '<definition><group type="NXentry"/><field name="field3">'
                '<datasource>%s%s</datasource></field></definition>'
                % ("$datasources.%s" % dsname[0], "$datasources.%s" % dsname[1])
                ]
@@ -8253,13 +8835,13 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -8281,13 +8863,13 @@ class XMLConfiguratorTest(unittest.TestCase):
 
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
-        xml = ['<definition><group type="NXentry" /><field name="field1">%s'
+        xml = ['<definition><group type="NXentry"/><field name="field1">%s'
                '</field></definition>'
                % (xds[0] % dsname[0]),
-               '<definition><group type="NXentry" /><field name="field2">%s'
+               '<definition><group type="NXentry"/><field name="field2">%s'
                '</field></definition>'
                % ("$datasources.%s" % dsname[1]),
-               '<definition><group type="NXentry" /><field name="field3">%s'
+               '<definition><group type="NXentry"/><field name="field3">%s'
                '</field><field name="field4">%s</field></definition>'
                % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
                ]
@@ -8332,13 +8914,13 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -8361,13 +8943,13 @@ class XMLConfiguratorTest(unittest.TestCase):
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -8421,13 +9003,13 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="$var.name1" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name2" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name3" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name4" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name4"/>'
             '</datasource>'
         ]
 
@@ -8450,13 +9032,13 @@ class XMLConfiguratorTest(unittest.TestCase):
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -8514,7 +9096,7 @@ class XMLConfiguratorTest(unittest.TestCase):
 
         xds = [
             '<datasource name="%s" type="CLIENT">'
-            '<record name="$var.name1" /></datasource>',
+            '<record name="$var.name1"/></datasource>',
         ]
 
         odsname = "mcs_test_datasource"
@@ -8536,13 +9118,13 @@ class XMLConfiguratorTest(unittest.TestCase):
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field">%s'
+            '<definition><group type="NXentry"/><field name="field">%s'
             '</field></definition>' % (
                 xds[0] % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field">%s'
+            '<definition><group type="NXentry"/><field name="field">%s'
             '</field></definition>' % (
                 "$datasources.$var.source"),
-            '<definition><group type="NXentry" /><field name="field">%s'
+            '<definition><group type="NXentry"/><field name="field">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0])
         ]
@@ -8594,13 +9176,13 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="$var.name1" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name2" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name3" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name5" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name5"/>'
             '</datasource>'
         ]
 
@@ -8623,13 +9205,13 @@ class XMLConfiguratorTest(unittest.TestCase):
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -8697,9 +9279,9 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>'
         ]
 
@@ -8724,16 +9306,16 @@ class XMLConfiguratorTest(unittest.TestCase):
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[0] % dsname[0], "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % ("$datasources.%s" % dsname[0], "$datasources.%s" % dsname[1])
         ]
@@ -8788,9 +9370,9 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>'
         ]
 
@@ -8815,16 +9397,16 @@ class XMLConfiguratorTest(unittest.TestCase):
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[0] % dsname[0], "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">'
+            '<definition><group type="NXentry"/><field name="field3">'
             '<datasource>%s%s</datasource></field></definition>'
             % ("$datasources.%s" % dsname[0], "$datasources.%s" % dsname[1])
         ]
@@ -8878,9 +9460,9 @@ class XMLConfiguratorTest(unittest.TestCase):
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
             """<datasource name="%s" type="CLIENT">$datasources.%s"""
             """$datasources.%s<result>
@@ -8914,16 +9496,16 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[0] % dsname[0], "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field></definition>'
             % ("$datasources.%s" % dsname[2])
         ]
@@ -8981,13 +9563,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -9012,13 +9594,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -9073,13 +9655,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -9102,13 +9684,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -9132,8 +9714,8 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" /><field name="field3">'
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<definition><group type="NXentry"/><field name="field3">'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource></field><field name="field4">$datasources.%s'
             '</field><field name="field1">$datasources.%s</field>'
             '</definition>' % (dsname[2], dsname[3], dsname[0]))
@@ -9157,13 +9739,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="$var.name1" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name2" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name3" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name4" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name4"/>'
             '</datasource>'
         ]
 
@@ -9186,13 +9768,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -9219,8 +9801,8 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" /><field name="field3">'
-            '<datasource name="%s" type="CLIENT"><record name="$var.name3" />'
+            '<definition><group type="NXentry"/><field name="field3">'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name3"/>'
             '</datasource></field><field name="field4">$datasources.%s'
             '</field><field name="field1">$datasources.%s</field>'
             '</definition>' % (dsname[2], dsname[3], dsname[0]))
@@ -9245,13 +9827,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="$var.name1" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name2" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name3" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name5" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name5"/>'
             '</datasource>'
         ]
 
@@ -9274,13 +9856,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -9307,8 +9889,8 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" /><field name="field3">'
-            '<datasource name="%s" type="CLIENT"><record name="$var.name3" />'
+            '<definition><group type="NXentry"/><field name="field3">'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name3"/>'
             '</datasource></field><field name="field4">$datasources.%s'
             '</field><field name="field1">$datasources.%s</field>'
             '</definition>' % (dsname[2], dsname[3], dsname[0]))
@@ -9332,9 +9914,9 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>'
         ]
 
@@ -9359,16 +9941,16 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[0] % dsname[0], "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % ("$datasources.%s" % dsname[0], "$datasources.%s" % dsname[1])
         ]
@@ -9393,8 +9975,8 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" /><field name="field3">'
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<definition><group type="NXentry"/><field name="field3">'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource></field><field name="field4">$datasources.%s'
             '</field><field name="field1">$datasources.%s</field>'
             '</definition>' % (dsname[0], dsname[1], dsname[0]))
@@ -9419,9 +10001,9 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>'
         ]
 
@@ -9446,16 +10028,16 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[0] % dsname[0], "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">'
+            '<definition><group type="NXentry"/><field name="field3">'
             '<datasource>%s%s</datasource></field></definition>'
             % ("$datasources.%s" % dsname[0], "$datasources.%s" % dsname[1])
         ]
@@ -9479,7 +10061,7 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" /><field name="field3">'
+            '<definition><group type="NXentry"/><field name="field3">'
             '<datasource>$datasources.%s$datasources.%s</datasource>'
             '</field><field name="field1">$datasources.%s</field>'
             '</definition>' % (dsname[0], dsname[1], dsname[0]))
@@ -9504,9 +10086,9 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
             """<datasource name="%s" type="CLIENT">$datasources.%s"""
             """$datasources.%s<result>
@@ -9540,16 +10122,16 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[0] % dsname[0], "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field></definition>'
             % ("$datasources.%s" % dsname[2])
         ]
@@ -9573,7 +10155,7 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group type="NXentry" /><field name="field3">$datasources.%s'
+            '<group type="NXentry"/><field name="field3">$datasources.%s'
             '</field><field name="field1">$datasources.%s</field>'
             '</definition>' % (dsname[2], dsname[0]))
 
@@ -9597,13 +10179,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -9629,13 +10211,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -9658,8 +10240,8 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" /><field name="field3">'
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<definition><group type="NXentry"/><field name="field3">'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource></field><field name="field4">$datasources.%s'
             '</field><field name="field1">$datasources.%s</field>'
             '</definition>' % (dsname[2], dsname[3], dsname[0]))
@@ -9684,13 +10266,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -9713,13 +10295,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -9742,17 +10324,17 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         self.assertEqual(len(comps), 2)
         self.assertEqual(
             comps[0],
-            '<definition><group type="NXentry" /><field name="field1">\n'
+            '<definition><group type="NXentry"/><field name="field1">\n'
             '<datasource name="%s" type="CLIENT">'
-            '<record name="r1" /></datasource></field></definition>' %
+            '<record name="r1"/></datasource></field></definition>' %
             (dsname[0]))
         self.assertEqual(
             comps[1],
-            '<definition><group type="NXentry" /><field name="field3">'
+            '<definition><group type="NXentry"/><field name="field3">'
             '<datasource name="%s" type="CLIENT">'
-            '<record name="r3" /></datasource></field><field name="field4">\n'
+            '<record name="r3"/></datasource></field><field name="field4">\n'
             '<datasource name="%s" type="CLIENT">'
-            '<record name="r4" /></datasource></field></definition>' %
+            '<record name="r4"/></datasource></field></definition>' %
             (dsname[2], dsname[3]))
 
         self.assertEqual(long(el.version.split('.')[-1]), revision + 7)
@@ -9774,13 +10356,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="$var.name1" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name2" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name3" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name4" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name4"/>'
             '</datasource>'
         ]
 
@@ -9803,13 +10385,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -9835,18 +10417,18 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         self.assertEqual(len(comps), 2)
         self.assertEqual(
             comps[0],
-            '<definition><group type="NXentry" /><field name="field1">\n'
+            '<definition><group type="NXentry"/><field name="field1">\n'
             '<datasource name="%s" type="CLIENT">'
-            '<record name="r1" /></datasource></field></definition>'
+            '<record name="r1"/></datasource></field></definition>'
             % (dsname[0])
         )
         self.assertEqual(
             comps[1],
-            '<definition><group type="NXentry" /><field name="field3">'
+            '<definition><group type="NXentry"/><field name="field3">'
             '<datasource name="%s" type="CLIENT">'
-            '<record name="r3" /></datasource></field><field name="field4">\n'
+            '<record name="r3"/></datasource></field><field name="field4">\n'
             '<datasource name="%s" type="CLIENT">'
-            '<record name="r4" /></datasource></field></definition>' % (
+            '<record name="r4"/></datasource></field></definition>' % (
                 dsname[2], dsname[3]))
 
         self.assertEqual(long(el.version.split('.')[-1]), revision + 7)
@@ -9870,7 +10452,7 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
 
         xds = [
             '<datasource name="%s" type="CLIENT">'
-            '<record name="$var.name1" /></datasource>',
+            '<record name="$var.name1"/></datasource>',
         ]
 
         odsname = "mcs_test_datasource"
@@ -9892,13 +10474,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field">%s'
+            '<definition><group type="NXentry"/><field name="field">%s'
             '</field></definition>' % (
                 xds[0] % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field">%s'
+            '<definition><group type="NXentry"/><field name="field">%s'
             '</field></definition>' % (
                 "$datasources.$var.source"),
-            '<definition><group type="NXentry" /><field name="field">%s'
+            '<definition><group type="NXentry"/><field name="field">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0])
         ]
@@ -9921,21 +10503,21 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         self.assertEqual(len(comps), 3)
         self.assertEqual(
             comps[0],
-            '<definition><group type="NXentry" /><field name="field">'
+            '<definition><group type="NXentry"/><field name="field">'
             '<datasource name="%s" type="CLIENT">'
-            '<record name="r1" /></datasource></field></definition>'
+            '<record name="r1"/></datasource></field></definition>'
             % dsname[0])
         self.assertEqual(
             comps[1],
-            '<definition><group type="NXentry" /><field name="field">\n'
+            '<definition><group type="NXentry"/><field name="field">\n'
             '<datasource name="%s" type="CLIENT">'
-            '<record name="r1" /></datasource></field></definition>'
+            '<record name="r1"/></datasource></field></definition>'
             % (dsname[0]))
         self.assertEqual(
             comps[2],
-            '<definition><group type="NXentry" /><field name="field">\n'
+            '<definition><group type="NXentry"/><field name="field">\n'
             '<datasource name="%s" type="CLIENT">'
-            '<record name="r1" /></datasource></field></definition>'
+            '<record name="r1"/></datasource></field></definition>'
             % dsname[0])
 
         self.assertEqual(long(el.version.split('.')[-1]), revision + 4)
@@ -9958,13 +10540,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="$var.name1" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name2" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name3" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="$var.name5" />'
+            '<datasource name="%s" type="CLIENT"><record name="$var.name5"/>'
             '</datasource>'
         ]
 
@@ -9987,13 +10569,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -10018,17 +10600,17 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         self.assertEqual(len(comps), 2)
         self.assertEqual(
             comps[0],
-            '<definition><group type="NXentry" /><field name="field1">\n'
+            '<definition><group type="NXentry"/><field name="field1">\n'
             '<datasource name="%s" type="CLIENT">'
-            '<record name="r1" /></datasource></field></definition>'
+            '<record name="r1"/></datasource></field></definition>'
             % (dsname[0]))
         self.assertEqual(
             comps[1],
-            '<definition><group type="NXentry" /><field name="field3">'
+            '<definition><group type="NXentry"/><field name="field3">'
             '<datasource name="%s" type="CLIENT">'
-            '<record name="r3" /></datasource></field><field name="field4">\n'
+            '<record name="r3"/></datasource></field><field name="field4">\n'
             '<datasource name="%s" type="CLIENT">'
-            '<record name="" /></datasource></field></definition>'
+            '<record name=""/></datasource></field></definition>'
             % (dsname[2], dsname[3]))
 
         self.assertEqual(long(el.version.split('.')[-1]), revision + 7)
@@ -10051,9 +10633,9 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>'
         ]
 
@@ -10078,16 +10660,16 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[0] % dsname[0], "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % ("$datasources.%s" % dsname[0], "$datasources.%s" % dsname[1])
         ]
@@ -10108,16 +10690,16 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         comps = el.instantiatedComponents(css)
         self.assertEqual(len(comps), 2)
         self.assertEqual(
-            comps[0], '<definition><group type="NXentry" />'
+            comps[0], '<definition><group type="NXentry"/>'
             '<field name="field1">\n<datasource name="%s" type="CLIENT">'
-            '<record name="r1" /></datasource></field></definition>'
+            '<record name="r1"/></datasource></field></definition>'
             % (dsname[0]))
         self.assertEqual(
             comps[1],
-            '<definition><group type="NXentry" /><field name="field3">'
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<definition><group type="NXentry"/><field name="field3">'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource></field><field name="field4">\n'
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource></field></definition>' % (dsname[0], dsname[1]))
 
         self.assertEqual(long(el.version.split('.')[-1]), revision + 6)
@@ -10140,9 +10722,9 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>'
         ]
 
@@ -10167,16 +10749,16 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[0] % dsname[0], "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">'
+            '<definition><group type="NXentry"/><field name="field3">'
             '<datasource>%s%s</datasource></field></definition>'
             % ("$datasources.%s" % dsname[0], "$datasources.%s" % dsname[1])
         ]
@@ -10198,15 +10780,15 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         self.assertEqual(len(comps), 2)
         self.assertEqual(
             comps[0],
-            '<definition><group type="NXentry" /><field name="field1">\n'
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<definition><group type="NXentry"/><field name="field1">\n'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource></field></definition>' % (dsname[0]))
         self.assertEqual(
             comps[1],
-            '<definition><group type="NXentry" /><field name="field3">'
+            '<definition><group type="NXentry"/><field name="field3">'
             '<datasource>\n<datasource name="%s" type="CLIENT">'
-            '<record name="r1" /></datasource>\n'
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<record name="r1"/></datasource>\n'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource></datasource></field></definition>'
             % (dsname[0], dsname[1]))
 
@@ -10214,6 +10796,74 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         el.setMandatoryComponents(man)
         el.close()
 
+    # creatConf test
+    # \brief It tests XMLConfigurator
+    def test_instantiatedComponents_datasource_update(self):
+        fun = sys._getframe().f_code.co_name
+        print("Run: %s.%s() " % (self.__class__.__name__, fun))
+
+        el = self.openConf()
+        man = el.mandatoryComponents()
+        el.unsetMandatoryComponents(man)
+        self.__man += man
+
+        avc = el.availableComponents()
+        avds = el.availableDataSources()
+        dsname = "mcs_test_datasource"
+        while dsname in avds:
+            dsname = dsname + "_1"
+        xds = '<datasource name="%s" type="CLIENT"><record name="r%s"/>' \
+            '</datasource>'
+
+        name = ["mcs_test_component_0", "mcs_test_component_1"]
+        for i in range(len(name)):
+            while name[i] in avc:
+                name[i] = name[i] + '_%s' % i
+        for i in range(len(name)):
+            self.setXML(
+                el, '<definition><field name="field%s">$datasources.%s'
+                '</field></definition>' % (i, dsname))
+            self.assertEqual(el.storeComponent(name[i]), None)
+            self.__cmps.append(name[i])
+
+        self.myAssertRaise(
+            NonregisteredDBRecordError, el.instantiatedComponents, name)
+
+        self.setXML(el, xds % (dsname, 1))
+        self.assertEqual(el.storeDataSource(dsname), None)
+        self.__ds.append(dsname)
+        comps = el.instantiatedComponents(name)
+        for i in range(len(name)):
+            self.assertEqual(
+                comps[i],
+                '<definition><field name="field%s">\n%s</field>'
+                '</definition>' % (i, xds % (dsname, 1)))
+        info = el.cacheStatistics()["datasources"]
+        self.assertEqual(info["items"], 1)
+        self.assertEqual(info["hits"], 1)
+        comps2 = el.instantiatedComponents(name)
+        self.assertEqual(comps, comps2)
+        info = el.cacheStatistics()["datasources"]
+        self.assertEqual(info["items"], 1)
+        self.assertEqual(info["hits"], 3)
+
+        self.setXML(el, xds % (dsname, 2))
+        self.assertEqual(el.storeDataSource(dsname), None)
+        comps = el.instantiatedComponents(name)
+        for i in range(len(name)):
+            self.assertEqual(
+                comps[i],
+                '<definition><field name="field%s">\n%s</field>'
+                '</definition>' % (i, xds % (dsname, 2)))
+
+        self.assertEqual(el.deleteDataSource(dsname), None)
+        self.__ds.pop()
+        self.myAssertRaise(
+            NonregisteredDBRecordError, el.instantiatedComponents, name)
+
+        el.setMandatoryComponents(man)
+        el.close()
+
     # creatConf test
     # \brief It tests XMLConfigurator
     def test_instantiatedComponents_mixed_3_double(self):
@@ -10230,9 +10880,9 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
             """<datasource name="%s" type="CLIENT">"""
             """$datasources.%s$datasources.%s<result>
@@ -10266,16 +10916,16 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[0] % dsname[0], "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field></definition>'
             % ("$datasources.%s" % dsname[2])
         ]
@@ -10297,16 +10947,16 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         self.assertEqual(len(comps), 2)
         self.assertEqual(
             comps[0],
-            '<definition><group type="NXentry" /><field name="field1">\n'
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<definition><group type="NXentry"/><field name="field1">\n'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource></field></definition>' % (dsname[0]))
         self.assertEqual(
             comps[1],
-            '<definition><group type="NXentry" /><field name="field3">\n'
+            '<definition><group type="NXentry"/><field name="field3">\n'
             '<datasource name="%s" type="CLIENT">\n'
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>\n<datasource name="%s" type="CLIENT">'
-            '<record name="r2" /></datasource><result>'
+            '<record name="r2"/></datasource><result>'
             '\nimport nxsconfigserver\nds.result = nxsconfigserver.__version__'
             '</result></datasource></field></definition>'
             % (dsname[2], dsname[0], dsname[1]))
@@ -10330,13 +10980,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -10361,13 +11011,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
+            '<definition><group type="NXentry"/><field name="field1">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
+            '<definition><group type="NXentry"/><field name="field2">%s'
             '</field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
             '</field><field name="field4">%s</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -10388,18 +11038,18 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         comps = el.instantiatedComponents(css)
         self.assertEqual(len(comps), 2)
         self.assertEqual(
-            comps[0], '<definition><group type="NXentry" />'
+            comps[0], '<definition><group type="NXentry"/>'
             '<field name="field1">'
             '\n<datasource name="%s" type="CLIENT">'
-            '<record name="r1" /></datasource></field></definition>'
+            '<record name="r1"/></datasource></field></definition>'
             % dsname[0])
         self.assertEqual(
             comps[1],
-            '<definition><group type="NXentry" /><field name="field3">'
+            '<definition><group type="NXentry"/><field name="field3">'
             '<datasource name="%s" type="CLIENT">'
-            '<record name="r3" /></datasource></field><field name="field4">'
+            '<record name="r3"/></datasource></field><field name="field4">'
             '\n<datasource name="%s" type="CLIENT">'
-            '<record name="r4" /></datasource></field></definition>'
+            '<record name="r4"/></datasource></field></definition>'
             % (dsname[2], dsname[3]))
 
         self.assertEqual(long(el.version.split('.')[-1]), revision + 7)
@@ -10422,13 +11072,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -10451,14 +11101,14 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
-            '<strategy mode="INIT" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field1">%s'
+            '<strategy mode="INIT"/></field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
-            '<strategy mode="FINAL" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field2">%s'
+            '<strategy mode="FINAL"/></field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
-            '<strategy mode="FINAL" /></field><field name="field4">%s</field>'
+            '<definition><group type="NXentry"/><field name="field3">%s'
+            '<strategy mode="FINAL"/></field><field name="field4">%s</field>'
             '</definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -10511,13 +11161,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -10540,14 +11190,14 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
-            '<strategy mode="INIT" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field1">%s'
+            '<strategy mode="INIT"/></field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
-            '<strategy mode="FINAL" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field2">%s'
+            '<strategy mode="FINAL"/></field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
-            '<strategy mode="FINAL" /></field><field name="field4">%s</field>'
+            '<definition><group type="NXentry"/><field name="field3">%s'
+            '<strategy mode="FINAL"/></field><field name="field4">%s</field>'
             '</definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -10601,13 +11251,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -10630,14 +11280,14 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
-            '<strategy mode="INIT" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field1">%s'
+            '<strategy mode="INIT"/></field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
-            '<strategy mode="FINAL" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field2">%s'
+            '<strategy mode="FINAL"/></field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
-            '<strategy mode="FINAL" /></field><field name="field4">%s</field>'
+            '<definition><group type="NXentry"/><field name="field3">%s'
+            '<strategy mode="FINAL"/></field><field name="field4">%s</field>'
             '</definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -10692,13 +11342,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -10783,13 +11433,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -10812,14 +11462,14 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
-            '<strategy canfail="false" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field1">%s'
+            '<strategy canfail="false"/></field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
-            '<strategy canfail="false" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field2">%s'
+            '<strategy canfail="false"/></field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
-            '<strategy canfail="false" /></field><field name="field4">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
+            '<strategy canfail="false"/></field><field name="field4">%s'
             '</field>'
             '</definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
@@ -10873,13 +11523,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -10902,14 +11552,14 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
-            '<strategy canfail="false" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field1">%s'
+            '<strategy canfail="false"/></field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
-            '<strategy canfail="false" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field2">%s'
+            '<strategy canfail="false"/></field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
-            '<strategy canfail="false" /></field><field name="field4">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
+            '<strategy canfail="false"/></field><field name="field4">%s'
             '</field>'
             '</definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
@@ -10964,13 +11614,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -10993,14 +11643,14 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
-            '<strategy canfail="false" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field1">%s'
+            '<strategy canfail="false"/></field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
-            '<strategy canfail="false" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field2">%s'
+            '<strategy canfail="false"/></field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
-            '<strategy canfail="false" /></field>'
+            '<definition><group type="NXentry"/><field name="field3">%s'
+            '<strategy canfail="false"/></field>'
             '<field name="field4">%s</field>'
             '</definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
@@ -11056,13 +11706,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -11085,14 +11735,14 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
-            '<strategy canfail="false" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field1">%s'
+            '<strategy canfail="false"/></field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
-            '<strategy canfail="false" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field2">%s'
+            '<strategy canfail="false"/></field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
-            '<strategy canfail="false" /></field><field name="field4">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
+            '<strategy canfail="false"/></field><field name="field4">%s'
             '</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -11147,13 +11797,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -11177,15 +11827,15 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         self.assertTrue(isinstance(avc, list))
         xml = [
             '<definition><group name="entry" type="NXentry">'
-            '<field name="field1">%s<strategy mode="INIT" /></field></group>'
+            '<field name="field1">%s<strategy mode="INIT"/></field></group>'
             '</definition>' % (
                 "$datasources.%s" % dsname[0]),
             '<definition><group  name="entry" type="NXentry">'
-            '<field name="field2">%s<strategy mode="FINAL" /></field>'
+            '<field name="field2">%s<strategy mode="FINAL"/></field>'
             '</group></definition>' % (
                 "$datasources.%s" % dsname[1]),
             '<definition><group  name="entry" type="NXentry">'
-            '<field name="field3">%s<strategy mode="FINAL" /></field>'
+            '<field name="field3">%s<strategy mode="FINAL"/></field>'
             '<field name="field4">%s</field></group></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -11242,13 +11892,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -11271,16 +11921,16 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group name="entry" type="NXentry" />'
-            '<field name="field1">%s<strategy mode="INIT" /></field>'
+            '<definition><group name="entry" type="NXentry"/>'
+            '<field name="field1">%s<strategy mode="INIT"/></field>'
             '</definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group  name="entry" type="NXentry" />'
-            '<field name="field2">%s<strategy mode="FINAL" /></field>'
+            '<definition><group  name="entry" type="NXentry"/>'
+            '<field name="field2">%s<strategy mode="FINAL"/></field>'
             '</definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group  name="entry" type="NXentry" />'
-            '<field name="field3">%s<strategy mode="FINAL" /></field>'
+            '<definition><group  name="entry" type="NXentry"/>'
+            '<field name="field3">%s<strategy mode="FINAL"/></field>'
             '<field name="field4">%s</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -11335,13 +11985,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -11365,17 +12015,17 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         self.assertTrue(isinstance(avc, list))
         xml = [
             '<definition><group name="entry" type="NXentry">'
-            '<field name="field1">%s<strategy mode="INIT" /></field>'
+            '<field name="field1">%s<strategy mode="INIT"/></field>'
             '</group></definition>' % (
                 "$datasources.%s" % dsname[0]),
             '<definition><group  name="entry" type="NXentry">'
-            '<field name="field2">%s<strategy mode="FINAL" /></field>'
+            '<field name="field2">%s<strategy mode="FINAL"/></field>'
             '</group></definition>' % (
                 "$datasources.%s" % dsname[1]),
             '<definition><group  name="entry" type="NXentry">'
-            '<field name="field3">%s<strategy mode="FINAL" /></field>'
+            '<field name="field3">%s<strategy mode="FINAL"/></field>'
             '<field name="field4">%s</field>'
-            '<group name="data" type="NXdata" /></group></definition>'
+            '<group name="data" type="NXdata"/></group></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
 
@@ -11433,13 +12083,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -11463,17 +12113,17 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         self.assertTrue(isinstance(avc, list))
         xml = [
             '<definition><group name="entry" type="NXentry">'
-            '<field name="field1">%s<strategy mode="INIT" /></field>'
+            '<field name="field1">%s<strategy mode="INIT"/></field>'
             '</group></definition>' % (
                 "$datasources.%s" % dsname[0]),
             '<definition><group  name="entry" type="NXentry">'
-            '<field name="field2">%s<strategy mode="FINAL" /></field>'
+            '<field name="field2">%s<strategy mode="FINAL"/></field>'
             '</group></definition>' % (
                 "$datasources.%s" % dsname[1]),
             '<definition><group  name="entry" type="NXentry">'
-            '<field name="field3">%s<strategy mode="FINAL" /></field>'
+            '<field name="field3">%s<strategy mode="FINAL"/></field>'
             '<field name="field4">%s</field>'
-            '<group name="data" type="NXdata" /></group></definition>'
+            '<group name="data" type="NXdata"/></group></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
 
@@ -11529,13 +12179,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -11558,14 +12208,14 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
-            '<strategy mode="INIT" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field1">%s'
+            '<strategy mode="INIT"/></field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
-            '<strategy mode="FINAL" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field2">%s'
+            '<strategy mode="FINAL"/></field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
-            '<strategy mode="FINAL" /></field><field name="field4">%s</field>'
+            '<definition><group type="NXentry"/><field name="field3">%s'
+            '<strategy mode="FINAL"/></field><field name="field4">%s</field>'
             '</definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -11590,11 +12240,11 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" /><field name="field3">'
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
-            '</datasource><strategy mode="FINAL" /></field>'
+            '<definition><group type="NXentry"/><field name="field3">'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
+            '</datasource><strategy mode="FINAL"/></field>'
             '<field name="field4">$datasources.%s</field>'
-            '<field name="field1">$datasources.%s<strategy mode="INIT" />'
+            '<field name="field1">$datasources.%s<strategy mode="INIT"/>'
             '</field></definition>' % (dsname[2], dsname[3], dsname[0]))
 
         self.assertEqual(long(el.version.split('.')[-1]), revision + 7)
@@ -11617,13 +12267,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -11646,14 +12296,14 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
-            '<strategy mode="INIT" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field1">%s'
+            '<strategy mode="INIT"/></field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
-            '<strategy mode="FINAL" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field2">%s'
+            '<strategy mode="FINAL"/></field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
-            '<strategy mode="FINAL" /></field><field name="field4">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
+            '<strategy mode="FINAL"/></field><field name="field4">%s'
             '</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -11679,11 +12329,11 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" /><field name="field3">'
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
-            '</datasource><strategy mode="FINAL" /></field>'
+            '<definition><group type="NXentry"/><field name="field3">'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
+            '</datasource><strategy mode="FINAL"/></field>'
             '<field name="field4">$datasources.%s</field>'
-            '<field name="field1">$datasources.%s<strategy mode="STEP" />'
+            '<field name="field1">$datasources.%s<strategy mode="STEP"/>'
             '</field></definition>' % (dsname[2], dsname[3], dsname[0]))
 
         self.assertEqual(long(el.version.split('.')[-1]), revision + 7)
@@ -11706,13 +12356,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -11735,14 +12385,14 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
-            '<strategy mode="INIT" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field1">%s'
+            '<strategy mode="INIT"/></field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
-            '<strategy mode="FINAL" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field2">%s'
+            '<strategy mode="FINAL"/></field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
-            '<strategy mode="FINAL" /></field><field name="field4">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
+            '<strategy mode="FINAL"/></field><field name="field4">%s'
             '</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -11769,11 +12419,11 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" /><field name="field3">'
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
-            '</datasource><strategy mode="STEP" /></field>'
+            '<definition><group type="NXentry"/><field name="field3">'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
+            '</datasource><strategy mode="STEP"/></field>'
             '<field name="field4">$datasources.%s</field>'
-            '<field name="field1">$datasources.%s<strategy mode="INIT" />'
+            '<field name="field1">$datasources.%s<strategy mode="INIT"/>'
             '</field></definition>' % (dsname[2], dsname[3], dsname[0]))
 
         self.assertEqual(long(el.version.split('.')[-1]), revision + 7)
@@ -11796,13 +12446,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -11825,14 +12475,14 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
-            '<strategy mode="INIT" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field1">%s'
+            '<strategy mode="INIT"/></field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
-            '<strategy mode="FINAL" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field2">%s'
+            '<strategy mode="FINAL"/></field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
-            '<strategy mode="FINAL" /></field><field name="field4">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
+            '<strategy mode="FINAL"/></field><field name="field4">%s'
             '</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -11858,12 +12508,12 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" />'
+            '<definition><group type="NXentry"/>'
             '<field name="field3"><datasource name="%s" type="CLIENT">'
-            '<record name="r3" /></datasource>'
-            '<strategy mode="STEP" /></field>'
+            '<record name="r3"/></datasource>'
+            '<strategy mode="STEP"/></field>'
             '<field name="field4">$datasources.%s</field>'
-            '<field name="field1">$datasources.%s<strategy mode="STEP" />'
+            '<field name="field1">$datasources.%s<strategy mode="STEP"/>'
             '</field></definition>' % (dsname[2], dsname[3], dsname[0]))
         self.assertEqual(long(el.version.split('.')[-1]), revision + 7)
         el.setMandatoryComponents(man)
@@ -11885,13 +12535,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -11914,14 +12564,14 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
-            '<strategy canfail="false" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field1">%s'
+            '<strategy canfail="false"/></field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
-            '<strategy canfail="false" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field2">%s'
+            '<strategy canfail="false"/></field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
-            '<strategy canfail="false" /></field><field name="field4">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
+            '<strategy canfail="false"/></field><field name="field4">%s'
             '</field>'
             '</definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
@@ -11947,11 +12597,11 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" /><field name="field3">'
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
-            '</datasource><strategy canfail="false" /></field>'
+            '<definition><group type="NXentry"/><field name="field3">'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
+            '</datasource><strategy canfail="false"/></field>'
             '<field name="field4">$datasources.%s</field>'
-            '<field name="field1">$datasources.%s<strategy canfail="false" />'
+            '<field name="field1">$datasources.%s<strategy canfail="false"/>'
             '</field></definition>' % (dsname[2], dsname[3], dsname[0]))
         self.assertEqual(long(el.version.split('.')[-1]), revision + 7)
         el.setMandatoryComponents(man)
@@ -11973,13 +12623,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -12002,14 +12652,14 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
-            '<strategy canfail="false" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field1">%s'
+            '<strategy canfail="false"/></field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
-            '<strategy canfail="false" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field2">%s'
+            '<strategy canfail="false"/></field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
-            '<strategy canfail="false" /></field><field name="field4">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
+            '<strategy canfail="false"/></field><field name="field4">%s'
             '</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -12035,11 +12685,11 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" /><field name="field3">'
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
-            '</datasource><strategy canfail="false" /></field>'
+            '<definition><group type="NXentry"/><field name="field3">'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
+            '</datasource><strategy canfail="false"/></field>'
             '<field name="field4">$datasources.%s</field>'
-            '<field name="field1">$datasources.%s<strategy canfail="true" />'
+            '<field name="field1">$datasources.%s<strategy canfail="true"/>'
             '</field></definition>' % (dsname[2], dsname[3], dsname[0]))
 
         self.assertEqual(long(el.version.split('.')[-1]), revision + 7)
@@ -12062,13 +12712,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -12091,14 +12741,14 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
-            '<strategy canfail="false" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field1">%s'
+            '<strategy canfail="false"/></field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
-            '<strategy canfail="false" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field2">%s'
+            '<strategy canfail="false"/></field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
-            '<strategy canfail="false" /></field><field name="field4">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
+            '<strategy canfail="false"/></field><field name="field4">%s'
             '</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -12125,11 +12775,11 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" /><field name="field3">'
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
-            '</datasource><strategy canfail="true" /></field>'
+            '<definition><group type="NXentry"/><field name="field3">'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
+            '</datasource><strategy canfail="true"/></field>'
             '<field name="field4">$datasources.%s</field>'
-            '<field name="field1">$datasources.%s<strategy canfail="false" />'
+            '<field name="field1">$datasources.%s<strategy canfail="false"/>'
             '</field></definition>' % (dsname[2], dsname[3], dsname[0]))
 
         self.assertEqual(long(el.version.split('.')[-1]), revision + 7)
@@ -12152,13 +12802,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -12181,14 +12831,14 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group type="NXentry" /><field name="field1">%s'
-            '<strategy canfail="false" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field1">%s'
+            '<strategy canfail="false"/></field></definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group type="NXentry" /><field name="field2">%s'
-            '<strategy canfail="false" /></field></definition>' % (
+            '<definition><group type="NXentry"/><field name="field2">%s'
+            '<strategy canfail="false"/></field></definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group type="NXentry" /><field name="field3">%s'
-            '<strategy canfail="false" /></field><field name="field4">%s'
+            '<definition><group type="NXentry"/><field name="field3">%s'
+            '<strategy canfail="false"/></field><field name="field4">%s'
             '</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -12214,12 +12864,12 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?>'
-            '<definition><group type="NXentry" />'
+            '<definition><group type="NXentry"/>'
             '<field name="field3"><datasource name="%s" type="CLIENT">'
-            '<record name="r3" /></datasource><strategy canfail="true" />'
+            '<record name="r3"/></datasource><strategy canfail="true"/>'
             '</field>'
             '<field name="field4">$datasources.%s</field>'
-            '<field name="field1">$datasources.%s<strategy canfail="true" />'
+            '<field name="field1">$datasources.%s<strategy canfail="true"/>'
             '</field></definition>' % (dsname[2], dsname[3], dsname[0]))
         self.assertEqual(long(el.version.split('.')[-1]), revision + 7)
         el.setMandatoryComponents(man)
@@ -12241,13 +12891,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -12271,15 +12921,15 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         self.assertTrue(isinstance(avc, list))
         xml = [
             '<definition><group name="entry" type="NXentry">'
-            '<field name="field1">%s<strategy mode="INIT" /></field></group>'
+            '<field name="field1">%s<strategy mode="INIT"/></field></group>'
             '</definition>' % (
                 "$datasources.%s" % dsname[0]),
             '<definition><group  name="entry" type="NXentry">'
-            '<field name="field2">%s<strategy mode="FINAL" /></field>'
+            '<field name="field2">%s<strategy mode="FINAL"/></field>'
             '</group></definition>' % (
                 "$datasources.%s" % dsname[1]),
             '<definition><group  name="entry" type="NXentry">'
-            '<field name="field3">%s<strategy mode="FINAL" /></field>'
+            '<field name="field3">%s<strategy mode="FINAL"/></field>'
             '<field name="field4">%s</field></group></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -12306,12 +12956,12 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field name="field3">'
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
-            '</datasource><strategy mode="FINAL" /></field>'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
+            '</datasource><strategy mode="FINAL"/></field>'
             '<field name="field4">$datasources.%s</field>'
-            '<field name="field1">$datasources.%s<strategy mode="INIT" />'
+            '<field name="field1">$datasources.%s<strategy mode="INIT"/>'
             '</field><group name="data" type="NXdata">'
-            '<link name="%s" target="/entry:NXentry/field1" /></group>'
+            '<link name="%s" target="/entry:NXentry/field1"/></group>'
             '</group></definition>'
             % (dsname[2], dsname[3], dsname[0], dsname[0]))
         self.assertEqual(long(el.version.split('.')[-1]), revision + 7)
@@ -12334,13 +12984,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -12363,16 +13013,16 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         oname = "mcs_test_component"
         self.assertTrue(isinstance(avc, list))
         xml = [
-            '<definition><group name="entry" type="NXentry" />'
-            '<field name="field1">%s<strategy mode="INIT" /></field>'
+            '<definition><group name="entry" type="NXentry"/>'
+            '<field name="field1">%s<strategy mode="INIT"/></field>'
             '</definition>' % (
                 "$datasources.%s" % dsname[0]),
-            '<definition><group  name="entry" type="NXentry" />'
-            '<field name="field2">%s<strategy mode="FINAL" /></field>'
+            '<definition><group  name="entry" type="NXentry"/>'
+            '<field name="field2">%s<strategy mode="FINAL"/></field>'
             '</definition>' % (
                 "$datasources.%s" % dsname[1]),
-            '<definition><group  name="entry" type="NXentry" />'
-            '<field name="field3">%s<strategy mode="FINAL" /></field>'
+            '<definition><group  name="entry" type="NXentry"/>'
+            '<field name="field3">%s<strategy mode="FINAL"/></field>'
             '<field name="field4">%s</field></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
@@ -12398,11 +13048,11 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             self,
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
-            '<group name="entry" type="NXentry" /><field name="field3">'
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
-            '</datasource><strategy mode="FINAL" /></field>'
+            '<group name="entry" type="NXentry"/><field name="field3">'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
+            '</datasource><strategy mode="FINAL"/></field>'
             '<field name="field4">$datasources.%s</field>'
-            '<field name="field1">$datasources.%s<strategy mode="INIT" />'
+            '<field name="field1">$datasources.%s<strategy mode="INIT"/>'
             '</field></definition>' % (dsname[2], dsname[3], dsname[0]))
         self.assertEqual(long(el.version.split('.')[-1]), revision + 7)
         el.setMandatoryComponents(man)
@@ -12424,13 +13074,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -12454,17 +13104,17 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         self.assertTrue(isinstance(avc, list))
         xml = [
             '<definition><group name="entry" type="NXentry">'
-            '<field name="field1">%s<strategy mode="INIT" /></field>'
+            '<field name="field1">%s<strategy mode="INIT"/></field>'
             '</group></definition>' % (
                 "$datasources.%s" % dsname[0]),
             '<definition><group  name="entry" type="NXentry">'
-            '<field name="field2">%s<strategy mode="FINAL" /></field>'
+            '<field name="field2">%s<strategy mode="FINAL"/></field>'
             '</group></definition>' % (
                 "$datasources.%s" % dsname[1]),
             '<definition><group  name="entry" type="NXentry">'
-            '<field name="field3">%s<strategy mode="FINAL" /></field>'
+            '<field name="field3">%s<strategy mode="FINAL"/></field>'
             '<field name="field4">%s</field>'
-            '<group name="data" type="NXdata" /></group></definition>'
+            '<group name="data" type="NXdata"/></group></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
 
@@ -12490,13 +13140,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field name="field3">'
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
-            '</datasource><strategy mode="FINAL" /></field>'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
+            '</datasource><strategy mode="FINAL"/></field>'
             '<field name="field4">$datasources.%s</field>'
             '<group name="data" type="NXdata">'
-            '<link name="%s" target="/entry:NXentry/field3" />'
-            '<link name="%s" target="/entry:NXentry/field1" /></group>'
-            '<field name="field1">$datasources.%s<strategy mode="INIT" />'
+            '<link name="%s" target="/entry:NXentry/field3"/>'
+            '<link name="%s" target="/entry:NXentry/field1"/></group>'
+            '<field name="field1">$datasources.%s<strategy mode="INIT"/>'
             '</field></group></definition>'
             % (dsname[2], dsname[3], dsname[2], dsname[0], dsname[0]))
 
@@ -12520,13 +13170,13 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         avc = el.availableComponents()
 
         xds = [
-            '<datasource name="%s" type="CLIENT"><record name="r1" />'
+            '<datasource name="%s" type="CLIENT"><record name="r1"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r2" />'
+            '<datasource name="%s" type="CLIENT"><record name="r2"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
             '</datasource>',
-            '<datasource name="%s" type="CLIENT"><record name="r4" />'
+            '<datasource name="%s" type="CLIENT"><record name="r4"/>'
             '</datasource>'
         ]
 
@@ -12550,17 +13200,17 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
         self.assertTrue(isinstance(avc, list))
         xml = [
             '<definition><group name="entry" type="NXentry">'
-            '<field name="field1">%s<strategy mode="INIT" /></field>'
+            '<field name="field1">%s<strategy mode="INIT"/></field>'
             '</group></definition>' % (
                 "$datasources.%s" % dsname[0]),
             '<definition><group  name="entry" type="NXentry">'
-            '<field name="field2">%s<strategy mode="FINAL" /></field>'
+            '<field name="field2">%s<strategy mode="FINAL"/></field>'
             '</group></definition>' % (
                 "$datasources.%s" % dsname[1]),
             '<definition><group  name="entry" type="NXentry">'
-            '<field name="field3">%s<strategy mode="FINAL" /></field>'
+            '<field name="field3">%s<strategy mode="FINAL"/></field>'
             '<field name="field4">%s</field>'
-            '<group name="data" type="NXdata" /></group></definition>'
+            '<group name="data" type="NXdata"/></group></definition>'
             % (xds[2] % dsname[2], "$datasources.%s" % dsname[3])
         ]
 
@@ -12586,12 +13236,12 @@ ds.result = nxsconfigserver.__version__</result></datasource>"""
             gxml,
             '<?xml version=\'1.0\' encoding=\'utf8\'?><definition>'
             '<group name="entry" type="NXentry"><field name="field3">'
-            '<datasource name="%s" type="CLIENT"><record name="r3" />'
-            '</datasource><strategy mode="FINAL" /></field>'
+            '<datasource name="%s" type="CLIENT"><record name="r3"/>'
+            '</datasource><strategy mode="FINAL"/></field>'
             '<field name="field4">$datasources.%s</field>'
-            '<field name="field1">$datasources.%s<strategy mode="INIT" />'
+            '<field name="field1">$datasources.%s<strategy mode="INIT"/>'
             '</field><group name="data" type="NXdata">'
-            '<link name="%s" target="/entry:NXentry/field1" />'
+            '<link name="%s" target="/entry:NXentry/field1"/>'
             '</group></group></definition>'
             % (dsname[2], dsname[3], dsname[0], dsname[0]))
         self.assertEqual(long(el.version.split('.')[-1]), revision + 7)
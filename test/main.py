@@ -24,9 +24,16 @@ import sys
 import unittest
 
 import ComponentHandler_test
+import ComponentParser_test
 import Merger_test
 import Errors_test
 import StreamSet_test
+import ConnectionPool_test
+import JobPool_test
+import ReadWriteLock_test
+import RevisionCache_test
+import DependencyGraph_test
+import Template_test
 
 try:
     __import__("PyTango")
@@ -91,6 +98,9 @@ def main():
     suite.addTests(
         unittest.defaultTestLoader.loadTestsFromModule(ComponentHandler_test))
 
+    suite.addTests(
+        unittest.defaultTestLoader.loadTestsFromModule(ComponentParser_test))
+
     suite.addTests(
         unittest.defaultTestLoader.loadTestsFromModule(Merger_test))
 
@@ -100,6 +110,24 @@ def main():
     suite.addTests(
         unittest.defaultTestLoader.loadTestsFromModule(StreamSet_test))
 
+    suite.addTests(
+        unittest.defaultTestLoader.loadTestsFromModule(ConnectionPool_test))
+
+    suite.addTests(
+        unittest.defaultTestLoader.loadTestsFromModule(JobPool_test))
+
+    suite.addTests(
+        unittest.defaultTestLoader.loadTestsFromModule(ReadWriteLock_test))
+
+    suite.addTests(
+        unittest.defaultTestLoader.loadTestsFromModule(RevisionCache_test))
+
+    suite.addTests(
+        unittest.defaultTestLoader.loadTestsFromModule(DependencyGraph_test))
+
+    suite.addTests(
+        unittest.defaultTestLoader.loadTestsFromModule(Template_test))
+
     if "MYSQL" in DB_AVAILABLE:
         suite.addTests(
             unittest.defaultTestLoader.loadTestsFromModule(MYSQLDataBase_test))